@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+base_glyphs.py
+
+Pristine base-glyph store, so trail decorations never stack on earlier decorations.
+
+The trail tools (Tools/make_seconds_sweep_font.py, Tools/add_seconds_arc_trail.py) rewrite
+hand glyphs in place. Without a record of the undecorated outlines, a second run (or one
+tool after the other) would trail the trail, and contour counts would grow with every run.
+
+The store is a private font table, WWbg, holding per hand glyph the compiled glyf data as
+it was before the first decoration, plus one layer per decoration: the contours that
+decoration added, and whether they sit under the hand (between the keeper squares and the
+hand contours) or over it. glyph_family.process_glyphs() hands workers the stored base
+outline (storing the current outline first when there is none), records the worker's
+contours as that decoration's layer, and rebuilds the glyph as base + every recorded layer.
+Re-running a tool replaces only its own layer; the other tool's layer stays, so a sweep
+followed by an arc trail (or the reverse) draws both. Renderers ignore unknown tables.
+
+The generators drop the entries of glyphs they rebuild (--hand-template, mh****), so the
+next decoration starts from the new outlines; strip_decorations() puts the stored base
+outlines back and drops the entries (generate_second_hand_font.py --undecorated).
+
+Font files are written without the table: split_base_glyphs() serialises a font without
+it, and save_base_glyphs() keeps it beside the font, in FONT.ttf.wwbg (committed with the
+font, excluded from the app targets), next to the SHA-256 of the bytes written.
+attach_base_glyphs() reinstalls it when that font is loaded again, as long as the file is
+still the one written then, so shipped fonts carry no build-only data and an in-place
+decoration chain still starts from the undecorated outlines, also in a fresh clone or when
+font and store are moved together. A font copied without its store has no base outlines;
+glyph_family.process_glyphs() then refuses glyphs that already look decorated instead of
+storing the trail as their base.
+
+Table layout (big-endian):
+  uint16  version (2)
+  zlib stream of:
+    uint16  glyph count
+    per glyph: uint16 name length, name (ASCII), uint32 data length, compiled glyf data,
+               uint16 layer count
+      per layer: uint16 decoration length, decoration (ASCII), uint8 placement (0 under,
+                 1 over), uint32 data length, compiled simple glyph of the layer contours
+Version 1 tables (no layer count, no layers) are still read.
+
+Store file layout: 32-byte SHA-256 of the font file, then the raw table.
+
+Dependencies:
+  python3 -m pip install --user fonttools
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+import zlib
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from fontTools.ttLib import TTFont, newTable
+from fontTools.ttLib.tables._g_l_y_f import Glyph
+
+from font_io import font_bytes, write_bytes_atomic
+
+
+BASE_GLYPHS_TAG = "WWbg"
+
+STORE_SUFFIX = ".wwbg"
+
+UNDER = "under"
+OVER = "over"
+PLACEMENTS = (UNDER, OVER)
+
+_VERSION = 2
+
+
+@dataclass
+class StoredGlyph:
+    base: bytes
+    # decoration name -> (placement, compiled simple glyph of the contours it added)
+    layers: Dict[str, Tuple[str, bytes]] = field(default_factory=dict)
+
+
+def glyph_data(glyf, name: str) -> bytes:
+    """Compiled data of a glyph; glyphs not yet expanded still hold it, so no round trip."""
+    glyph = glyf.glyphs[name]
+    data = getattr(glyph, "data", None)
+    return data if data is not None else glyph.compile(glyf)
+
+
+def parse_glyph_store(raw: bytes) -> Dict[str, StoredGlyph]:
+    """Entries of a raw WWbg table (version 1 or 2)."""
+    (version,) = struct.unpack(">H", raw[:2])
+    if version not in (1, _VERSION):
+        raise RuntimeError(f"Unsupported {BASE_GLYPHS_TAG} table version {version}")
+
+    payload = zlib.decompress(raw[2:])
+    (count,) = struct.unpack(">H", payload[:2])
+    out: Dict[str, StoredGlyph] = {}
+    pos = 2
+    for _ in range(count):
+        (name_len,) = struct.unpack(">H", payload[pos : pos + 2])
+        pos += 2
+        name = payload[pos : pos + name_len].decode("ascii")
+        pos += name_len
+        (data_len,) = struct.unpack(">I", payload[pos : pos + 4])
+        pos += 4
+        entry = StoredGlyph(payload[pos : pos + data_len])
+        pos += data_len
+        if version >= 2:
+            (layer_count,) = struct.unpack(">H", payload[pos : pos + 2])
+            pos += 2
+            for _ in range(layer_count):
+                (deco_len,) = struct.unpack(">H", payload[pos : pos + 2])
+                pos += 2
+                decoration = payload[pos : pos + deco_len].decode("ascii")
+                pos += deco_len
+                placement, layer_len = struct.unpack(">BI", payload[pos : pos + 5])
+                pos += 5
+                entry.layers[decoration] = (PLACEMENTS[placement], payload[pos : pos + layer_len])
+                pos += layer_len
+        out[name] = entry
+    return out
+
+
+def read_glyph_store(font: TTFont) -> Dict[str, StoredGlyph]:
+    if BASE_GLYPHS_TAG not in font:
+        return {}
+    return parse_glyph_store(font[BASE_GLYPHS_TAG].data)
+
+
+def write_glyph_store(font: TTFont, store: Dict[str, StoredGlyph]) -> None:
+    """Replaces the store with store; an empty dict removes it."""
+    if not store:
+        if BASE_GLYPHS_TAG in font:
+            del font[BASE_GLYPHS_TAG]
+        return
+
+    parts = [struct.pack(">H", len(store))]
+    for name in sorted(store):
+        entry = store[name]
+        encoded = name.encode("ascii")
+        parts.append(struct.pack(">H", len(encoded)))
+        parts.append(encoded)
+        parts.append(struct.pack(">I", len(entry.base)))
+        parts.append(entry.base)
+        parts.append(struct.pack(">H", len(entry.layers)))
+        for decoration in sorted(entry.layers):
+            placement, data = entry.layers[decoration]
+            encoded = decoration.encode("ascii")
+            parts.append(struct.pack(">H", len(encoded)))
+            parts.append(encoded)
+            parts.append(struct.pack(">BI", PLACEMENTS.index(placement), len(data)))
+            parts.append(data)
+
+    table = newTable(BASE_GLYPHS_TAG)
+    table.data = struct.pack(">H", _VERSION) + zlib.compress(b"".join(parts), 9)
+    font[BASE_GLYPHS_TAG] = table
+
+
+def read_base_glyphs(font: TTFont) -> Dict[str, bytes]:
+    """Stored undecorated data per glyph name."""
+    return {name: entry.base for name, entry in read_glyph_store(font).items()}
+
+
+def glyph_store(font: TTFont, glyph_names: Sequence[str]) -> Dict[str, StoredGlyph]:
+    """
+    The whole store, after storing the current outline of every named glyph that has no
+    entry yet as its base. Callers change entries and write the store back.
+    """
+    store = read_glyph_store(font)
+    glyf = font["glyf"]
+    missing = [name for name in glyph_names if name not in store]
+    if missing:
+        for name in missing:
+            store[name] = StoredGlyph(glyph_data(glyf, name))
+        write_glyph_store(font, store)
+    return store
+
+
+def base_glyph_data(font: TTFont, glyph_names: Sequence[str]) -> Dict[str, bytes]:
+    """
+    Undecorated compiled data of each named glyph. Glyphs without a stored base are stored
+    from their current outline first.
+    """
+    store = glyph_store(font, glyph_names)
+    return {name: store[name].base for name in glyph_names}
+
+
+def forget_base_glyphs(font: TTFont, glyph_names: Optional[Iterable[str]] = None) -> None:
+    """Drops the stored entries of the named glyphs (all glyphs when None) after they are rebuilt."""
+    if BASE_GLYPHS_TAG not in font:
+        return
+    if glyph_names is None:
+        write_glyph_store(font, {})
+        return
+    store = read_glyph_store(font)
+    drop = set(glyph_names)
+    if drop.intersection(store):
+        write_glyph_store(font, {name: entry for name, entry in store.items() if name not in drop})
+
+
+def strip_decorations(font: TTFont, glyph_names: Optional[Iterable[str]] = None) -> List[str]:
+    """
+    Restores the stored base outline of the named glyphs (all stored glyphs when None) and
+    drops their entries, trail layers included. Returns the names restored.
+    """
+    store = read_glyph_store(font)
+    names = [name for name in (store if glyph_names is None else glyph_names) if name in store]
+    glyf = font["glyf"]
+    for name in names:
+        glyph = Glyph(store[name].base)
+        glyph.expand(glyf)
+        glyf[name] = glyph
+    forget_base_glyphs(font, names)
+    return names
+
+
+# -- font files -------------------------------------------------------------------------
+
+
+def base_store_path(font_path: str) -> str:
+    """The store file kept beside the font file at font_path."""
+    return font_path + STORE_SUFFIX
+
+
+def split_base_glyphs(font: TTFont) -> Tuple[bytes, Optional[bytes]]:
+    """(font bytes without the store table, raw store table or None); font keeps its store."""
+    if BASE_GLYPHS_TAG not in font:
+        return font_bytes(font), None
+    table = font[BASE_GLYPHS_TAG]
+    raw = table.compile(font)
+    del font[BASE_GLYPHS_TAG]
+    try:
+        return font_bytes(font), raw
+    finally:
+        font[BASE_GLYPHS_TAG] = table
+
+
+def save_base_glyphs(font_path: str, raw: Optional[bytes], font_data: bytes) -> None:
+    """Keeps the store split off the font file just written as font_data (None: it had none)."""
+    path = base_store_path(font_path)
+    if raw is None:
+        if os.path.exists(path):
+            os.remove(path)
+        return
+    write_bytes_atomic(path, hashlib.sha256(font_data).digest() + raw)
+
+
+def saved_base_glyphs(font_path: str, font_data: bytes) -> Optional[bytes]:
+    """Raw store saved with the font file at font_path, if font_data is still what was written."""
+    try:
+        with open(base_store_path(font_path), "rb") as f:
+            saved = f.read()
+    except FileNotFoundError:
+        return None
+    if saved[:32] != hashlib.sha256(font_data).digest():
+        return None
+    return saved[32:]
+
+
+def attach_base_glyphs(font: TTFont, font_path: str, font_data: bytes) -> bool:
+    """Reinstalls the store saved for the font file font_data was read from; True if it did."""
+    if BASE_GLYPHS_TAG in font:
+        return False
+    raw = saved_base_glyphs(font_path, font_data)
+    if raw is None:
+        return False
+    table = newTable(BASE_GLYPHS_TAG)
+    table.data = raw
+    font[BASE_GLYPHS_TAG] = table
+    return True
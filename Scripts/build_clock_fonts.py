@@ -0,0 +1,550 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+build_clock_fonts.py
+
+Single entry point for the clock font builds.
+
+Subcommands:
+  second       generate_second_hand_font.py (in place)
+  minute       generate_minute_hand_font.py
+  minute-icon  generate_minute_hand_icon_font.py
+  sweep        Tools/make_seconds_sweep_font.py   (input/output + tool options)
+  arc-trail    Tools/add_seconds_arc_trail.py     (input/output + tool options)
+  all          second, minute, minute-icon in one process
+  assets       every clock asset as a dependency graph (options below), stale steps only,
+               independent steps in parallel worker processes
+
+Arguments after the subcommand go to that script's own parser (e.g. --hand-template);
+--force goes before the subcommand.
+
+Only argparse/hashlib/json are imported up front; fontTools and the generator modules are
+imported when a command actually runs, so every command after the first in "all" reuses
+the loaded modules, and an up-to-date command never loads them at all.
+
+A command is up to date when its output still has the hash recorded after the last build
+and its inputs (input font bytes, arguments, Scripts/ + Tools/ sources) hash to the same
+key; the cache lives in .clock_fonts_cache.json at the repo root.
+
+Startup (interpreter CPU time before this module ran, then entry point) and per-command
+import/build times are reported.
+
+assets declares each step with the files it reads and writes: the second-hand font
+(regenerated in place from its undecorated outlines, then optionally decorated in place by
+--sweep and/or --arc-trail, which compose: each replaces only its own trail layer),
+both minute generators cloning it, then --collection, the size budget and inspector
+(Tools/inspect_clock_fonts.py) checks, --goldens visual regression, --previews and
+--outline-pack on the results. Edges follow from the files (read after write, write after
+write, write after read), so the minute variants, checks and previews of independent
+fonts run side by side. A step's key covers its arguments, the sources and, for each
+input, the key of the step that writes it, so keys are known up front; a step is stale
+when its key, or the recorded final hash or final writer of one of its outputs, changed,
+and everything downstream of a stale step is rebuilt with it. Modules are imported once
+in the parent and inherited by the forked workers; each step's output is printed when it
+finishes, and the summary gives the critical path through the graph against wall and
+total step time.
+
+Dependencies:
+  python3 -m pip install --user fonttools
+  (assets --previews / --goldens also: freetype-py numpy)
+
+Run from repo root:
+  python3 -u Scripts/build_clock_fonts.py all
+  python3 -u Scripts/build_clock_fonts.py --force all
+  python3 -u Scripts/build_clock_fonts.py minute --hand-template themes/hand.svg
+  python3 -u Scripts/build_clock_fonts.py sweep \
+    WidgetWeaverWidget/Clock/WWClockSecondHand-Regular.ttf /tmp/sweep.ttf --trail-count 5
+  python3 -u Scripts/build_clock_fonts.py assets --collection --previews /tmp/previews
+  python3 -u Scripts/build_clock_fonts.py assets --sweep="--trail-count 5" --jobs 4
+  python3 -u Scripts/build_clock_fonts.py assets --minute-args="--hand-template themes/hand.svg" --no-budget
+"""
+
+from __future__ import annotations
+
+import time
+
+_T0 = time.perf_counter()
+_INTERPRETER_CPU_S = time.process_time()
+
+import argparse  # noqa: E402
+import contextlib  # noqa: E402
+import hashlib  # noqa: E402
+import importlib  # noqa: E402
+import io  # noqa: E402
+import json  # noqa: E402
+import os  # noqa: E402
+import shlex  # noqa: E402
+import sys  # noqa: E402
+import traceback  # noqa: E402
+from dataclasses import dataclass  # noqa: E402
+from typing import Dict, List, Optional, Tuple  # noqa: E402
+
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+TOOLS_DIR = os.path.join(SCRIPTS_DIR, os.pardir, "Tools")
+
+CACHE_FILE = ".clock_fonts_cache.json"
+
+CLOCK_DIR = os.path.join("WidgetWeaverWidget", "Clock")
+SECOND_TTF = os.path.join(CLOCK_DIR, "WWClockSecondHand-Regular.ttf")
+MINUTE_TTF = os.path.join(CLOCK_DIR, "WWClockMinuteHand-Regular.ttf")
+MINUTE_ICON_TTF = os.path.join(CLOCK_DIR, "WWClockMinuteHandIcon-Regular.ttf")
+COLLECTION_TTC = os.path.join(CLOCK_DIR, "WWClockMinuteHands-Regular.ttc")
+
+
+@dataclass(frozen=True)
+class Command:
+    module: str
+    # Fixed input/output for generators; None means positional input/output in the args.
+    input_path: Optional[str]
+    output_path: Optional[str]
+
+
+COMMANDS: Dict[str, Command] = {
+    "second": Command("generate_second_hand_font", SECOND_TTF, SECOND_TTF),
+    "minute": Command("generate_minute_hand_font", SECOND_TTF, MINUTE_TTF),
+    "minute-icon": Command("generate_minute_hand_icon_font", SECOND_TTF, MINUTE_ICON_TTF),
+    "sweep": Command("make_seconds_sweep_font", None, None),
+    "arc-trail": Command("add_seconds_arc_trail", None, None),
+}
+
+ALL_ORDER = ("second", "minute", "minute-icon")
+
+
+def log(msg: str) -> None:
+    print(msg, flush=True)
+
+
+def _sha256_file(path: str) -> Optional[str]:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def _sources_digest() -> str:
+    h = hashlib.sha256()
+    for d in (SCRIPTS_DIR, TOOLS_DIR):
+        for name in sorted(os.listdir(d)):
+            if name.endswith(".py"):
+                h.update(name.encode("utf-8"))
+                with open(os.path.join(d, name), "rb") as f:
+                    h.update(f.read())
+    return h.hexdigest()
+
+
+def _io_paths(cmd: Command, args: List[str]) -> Optional[Tuple[str, str]]:
+    if cmd.input_path is not None:
+        return cmd.input_path, cmd.output_path or cmd.input_path
+    positional = [a for a in args if not a.startswith("-")]
+    if len(positional) < 2:
+        return None  # let the tool's own parser report the usage error
+    return positional[0], positional[1]
+
+
+def _input_key(name: str, args: List[str], input_path: Optional[str], sources: str) -> str:
+    h = hashlib.sha256()
+    h.update(name.encode("utf-8"))
+    h.update(json.dumps(args).encode("utf-8"))
+    h.update(sources.encode("ascii"))
+    if input_path is not None:
+        h.update((_sha256_file(input_path) or "missing").encode("ascii"))
+    return h.hexdigest()
+
+
+def _load_cache(path: str) -> Dict[str, Dict[str, str]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def _save_cache(path: str, cache: Dict[str, Dict[str, str]]) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def run_command(name: str, args: List[str], cache: Dict[str, Dict[str, str]], sources: str, force: bool) -> bool:
+    """Runs one subcommand unless it is up to date. Returns True if it built."""
+    cmd = COMMANDS[name]
+    paths = _io_paths(cmd, args)
+    entry_key = None
+
+    if paths is not None:
+        input_path, output_path = paths
+        entry_key = f"{name}:{os.path.abspath(output_path)}"
+        # In-place commands read their own previous output: the recorded output hash already
+        # pins the input, so the key covers only arguments and sources.
+        in_place = os.path.abspath(input_path) == os.path.abspath(output_path)
+        key = _input_key(name, args, None if in_place else input_path, sources)
+        entry = cache.get(entry_key)
+        out_hash = _sha256_file(output_path)
+        if (
+            not force
+            and entry is not None
+            and out_hash is not None
+            and out_hash == entry.get("output")
+            and entry.get("inputs") == key
+        ):
+            log(f"[{name}] up to date ({output_path})")
+            return False
+
+    t0 = time.perf_counter()
+    if TOOLS_DIR not in sys.path:
+        sys.path.append(TOOLS_DIR)
+    module = importlib.import_module(cmd.module)
+    t1 = time.perf_counter()
+
+    rc = module.main(args)
+    t2 = time.perf_counter()
+    if rc:
+        raise SystemExit(rc)
+
+    log(f"[{name}] imports {(t1 - t0) * 1000.0:.0f} ms, build {(t2 - t1) * 1000.0:.0f} ms")
+
+    if paths is not None and entry_key is not None:
+        input_path, output_path = paths
+        cache[entry_key] = {
+            "inputs": key,
+            "output": _sha256_file(output_path) or "",
+        }
+    return True
+
+
+# -- asset graph ------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class BuildStep:
+    name: str
+    module: str
+    args: Tuple[str, ...] = ()
+    # Files the step reads and writes (repo-relative or absolute); the graph's edges come from these.
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+
+
+def _assets_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="build_clock_fonts.py assets")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Steps run at once")
+    parser.add_argument("--second-args", default="", help="Arguments for the second-hand generator")
+    parser.add_argument("--minute-args", default="", help="Arguments for both minute-hand generators")
+    parser.add_argument(
+        "--sweep",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="ARGS",
+        help='Decorate the second-hand font with the sweep trail (e.g. --sweep="--trail-count 5")',
+    )
+    parser.add_argument("--arc-trail", nargs="?", const="", default=None, metavar="ARGS", help="Same for the arc trail")
+    parser.add_argument("--collection", action="store_true", help="Write the minute-hand .ttc")
+    parser.add_argument("--no-verify", action="store_true", help="Skip the size budget and inspector checks")
+    parser.add_argument(
+        "--no-budget",
+        action="store_true",
+        help="Build and report sizes without the size budgets (for a --hand-template richer than the defaults)",
+    )
+    parser.add_argument("--goldens", default=None, help="Run the visual regression against this golden directory")
+    parser.add_argument("--previews", default=None, metavar="DIR", help="Write PNG preview strips here")
+    parser.add_argument("--outline-pack", default=None, metavar="PATH", help="Export the hand outline pack here")
+    return parser
+
+
+def asset_steps(ns: argparse.Namespace) -> List[BuildStep]:
+    """The clock asset steps, in an order where every step follows the steps it depends on."""
+    fonts = (SECOND_TTF, MINUTE_TTF, MINUTE_ICON_TTF)
+    second_args = tuple(shlex.split(ns.second_args))
+    minute_args = tuple(shlex.split(ns.minute_args))
+
+    budget_args = ("--no-budget",) if ns.no_budget else ()
+    minute_args += budget_args
+
+    # The trails on the output are exactly the ones requested: a dropped --sweep goes away.
+    second_args = ("--undecorated",) + second_args + budget_args
+    steps = [BuildStep("second", COMMANDS["second"].module, second_args, (SECOND_TTF,), (SECOND_TTF,))]
+    if ns.sweep is not None:
+        args = (SECOND_TTF, SECOND_TTF) + tuple(shlex.split(ns.sweep))
+        steps.append(BuildStep("sweep", COMMANDS["sweep"].module, args, (SECOND_TTF,), (SECOND_TTF,)))
+    if ns.arc_trail is not None:
+        args = (SECOND_TTF, SECOND_TTF) + tuple(shlex.split(ns.arc_trail))
+        steps.append(BuildStep("arc-trail", COMMANDS["arc-trail"].module, args, (SECOND_TTF,), (SECOND_TTF,)))
+    steps.append(BuildStep("minute", COMMANDS["minute"].module, minute_args, (SECOND_TTF,), (MINUTE_TTF,)))
+    steps.append(BuildStep("minute-icon", COMMANDS["minute-icon"].module, minute_args, (SECOND_TTF,), (MINUTE_ICON_TTF,)))
+
+    if ns.collection:
+        steps.append(BuildStep("collection", "font_collection", (), (MINUTE_TTF, MINUTE_ICON_TTF), (COLLECTION_TTC,)))
+    if not ns.no_verify:
+        steps.append(BuildStep("verify", "report_font_sizes", fonts + budget_args, fonts))
+        steps.append(BuildStep("inspect", "inspect_clock_fonts", fonts, fonts))
+    if ns.goldens:
+        steps.append(BuildStep("regression", "clock_font_visual_regression", fonts + ("--goldens", ns.goldens), fonts))
+    if ns.previews:
+        for name, font in zip(("second", "minute", "minute-icon"), fonts):
+            png = os.path.join(ns.previews, os.path.splitext(os.path.basename(font))[0] + ".png")
+            steps.append(
+                BuildStep(f"preview-{name}", "render_clock_hand_previews", (font, "--out-dir", ns.previews), (font,), (png,))
+            )
+    if ns.outline_pack:
+        steps.append(
+            BuildStep(
+                "outline-pack",
+                "export_hand_outline_pack",
+                (MINUTE_TTF, SECOND_TTF, "-o", ns.outline_pack),
+                (MINUTE_TTF, SECOND_TTF),
+                (ns.outline_pack,),
+            )
+        )
+    return steps
+
+
+def step_dependencies(steps: List[BuildStep]) -> Dict[str, List[str]]:
+    """
+    Edges from file hazards, in declaration order: a step follows the last earlier writer of
+    each file it reads or writes, and every earlier reader of a file it overwrites.
+    """
+    last_writer: Dict[str, str] = {}
+    readers: Dict[str, List[str]] = {}
+    deps: Dict[str, List[str]] = {}
+    for step in steps:
+        found: List[str] = []
+        for path in map(os.path.abspath, step.inputs + step.outputs):
+            if path in last_writer:
+                found.append(last_writer[path])
+        for path in map(os.path.abspath, step.outputs):
+            found.extend(readers.get(path, []))
+        deps[step.name] = [name for name in dict.fromkeys(found) if name != step.name]
+        for path in map(os.path.abspath, step.inputs):
+            readers.setdefault(path, []).append(step.name)
+        for path in map(os.path.abspath, step.outputs):
+            last_writer[path] = step.name
+            readers[path] = []
+    return deps
+
+
+def _step_keys(steps: List[BuildStep], sources: str) -> Dict[str, str]:
+    """
+    Input key per step. A file another step writes enters as its producer's key, so a key
+    is known before anything runs; a file the graph reads before (or without) writing it
+    is pinned by its recorded final hash instead (in-place steps), and only files no step
+    writes are hashed.
+    """
+    written = {os.path.abspath(p) for step in steps for p in step.outputs}
+    producer: Dict[str, str] = {}
+    keys: Dict[str, str] = {}
+    for step in steps:
+        h = hashlib.sha256()
+        h.update(json.dumps([step.name, step.module, list(step.args)]).encode("utf-8"))
+        h.update(sources.encode("ascii"))
+        for path in map(os.path.abspath, step.inputs):
+            if path in producer:
+                h.update(producer[path].encode("ascii"))
+            elif path not in written:
+                h.update((_sha256_file(path) or "missing").encode("ascii"))
+        keys[step.name] = h.hexdigest()
+        for path in map(os.path.abspath, step.outputs):
+            producer[path] = keys[step.name]
+    return keys
+
+
+def stale_steps(
+    steps: List[BuildStep],
+    deps: Dict[str, List[str]],
+    keys: Dict[str, str],
+    cache: Dict[str, Dict[str, str]],
+    force: bool,
+) -> List[str]:
+    """
+    Steps whose key or output files changed since they last built, plus everything downstream.
+    An output also counts as changed when its final writer is not the one that wrote it last
+    time (e.g. --sweep dropped), so an in-place chain restarts from its first step.
+    """
+    last_writer = {os.path.abspath(p): step.name for step in steps for p in step.outputs}
+
+    def output_ok(path: str) -> bool:
+        path = os.path.abspath(path)
+        record = cache.get(f"file:{path}", {})
+        return record.get("key") == keys[last_writer[path]] and record.get("hash") == _sha256_file(path)
+
+    stale: List[str] = []
+    for step in steps:
+        outputs_ok = all(output_ok(path) for path in step.outputs)
+        if (
+            force
+            or cache.get(f"step:{step.name}", {}).get("key") != keys[step.name]
+            or not outputs_ok
+            or any(d in stale for d in deps[step.name])
+        ):
+            stale.append(step.name)
+    return stale
+
+
+def _run_step_process(step: BuildStep, queue) -> None:
+    buf = io.StringIO()
+    t0 = time.perf_counter()
+    rc = 0
+    try:
+        with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+            rc = importlib.import_module(step.module).main(list(step.args)) or 0
+    except SystemExit as e:
+        rc = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except BaseException:
+        buf.write(traceback.format_exc())
+        rc = 1
+    queue.put((step.name, rc, time.perf_counter() - t0, buf.getvalue()))
+
+
+def critical_path(
+    steps: List[BuildStep], deps: Dict[str, List[str]], durations: Dict[str, float]
+) -> Tuple[float, List[str]]:
+    """Longest chain of step durations through the graph (up-to-date steps count 0)."""
+    finish: Dict[str, float] = {}
+    previous: Dict[str, Optional[str]] = {}
+    for step in steps:
+        before = max(deps[step.name], key=lambda d: finish[d], default=None)
+        finish[step.name] = (finish[before] if before else 0.0) + durations.get(step.name, 0.0)
+        previous[step.name] = before
+    if not finish:
+        return 0.0, []
+    name: Optional[str] = max(finish, key=lambda n: finish[n])
+    total = finish[name]
+    chain = []
+    while name is not None:
+        chain.append(name)
+        name = previous[name]
+    return total, chain[::-1]
+
+
+def run_assets(argv: List[str], cache: Dict[str, Dict[str, str]], sources: str, force: bool) -> int:
+    """
+    Runs the asset graph: stale steps only, each in a forked worker process as soon as the
+    steps it depends on have finished, up to --jobs at a time. Returns the failed step count.
+    """
+    import multiprocessing
+
+    ns = _assets_parser().parse_args(argv)
+    steps = asset_steps(ns)
+    by_name = {step.name: step for step in steps}
+    deps = step_dependencies(steps)
+    keys = _step_keys(steps, sources)
+    stale = stale_steps(steps, deps, keys, cache, force)
+    last_writer = {os.path.abspath(p): step.name for step in steps for p in step.outputs}
+
+    for step in steps:
+        after = f" (after {', '.join(deps[step.name])})" if deps[step.name] else ""
+        log(f"[{step.name}] {'stale' if step.name in stale else 'up to date'}{after}")
+
+    # Import in the parent so every forked worker starts with the modules loaded.
+    t0 = time.perf_counter()
+    if TOOLS_DIR not in sys.path:
+        sys.path.append(TOOLS_DIR)
+    for module in dict.fromkeys(by_name[name].module for name in stale):
+        importlib.import_module(module)
+    if stale:
+        log(f"Imports: {(time.perf_counter() - t0) * 1000.0:.0f} ms")
+
+    ctx = multiprocessing.get_context("fork")
+    queue = ctx.Queue()
+    jobs = max(1, ns.jobs)
+    pending = list(stale)
+    done = {step.name for step in steps if step.name not in stale}
+    running: Dict[str, Tuple[object, float]] = {}
+    durations: Dict[str, float] = {}
+    failed: List[str] = []
+    t_start = time.perf_counter()
+
+    while pending or running:
+        if not failed:
+            for name in list(pending):
+                if len(running) >= jobs:
+                    break
+                if all(d in done for d in deps[name]):
+                    pending.remove(name)
+                    proc = ctx.Process(target=_run_step_process, args=(by_name[name], queue))
+                    proc.start()
+                    running[name] = (proc, time.perf_counter() - t_start)
+        if not running:
+            break
+
+        name, rc, elapsed, output = queue.get()
+        proc, started = running.pop(name)
+        proc.join()
+        for line in output.splitlines():
+            log(f"[{name}] {line}")
+        if rc:
+            failed.append(name)
+            log(f"[{name}] FAILED (exit {rc}) after {elapsed:.2f} s")
+            continue
+
+        durations[name] = elapsed
+        done.add(name)
+        log(f"[{name}] built in {elapsed:.2f} s (started +{started:.2f} s)")
+        cache[f"step:{name}"] = {"key": keys[name]}
+        for path in by_name[name].outputs:
+            if last_writer[os.path.abspath(path)] == name:
+                cache[f"file:{os.path.abspath(path)}"] = {"hash": _sha256_file(path) or "", "key": keys[name]}
+
+    wall = time.perf_counter() - t_start
+    skipped = [name for name in pending if name not in failed]
+    total, chain = critical_path(steps, deps, durations)
+    log(
+        f"Critical path {total:.2f} s: "
+        + (" -> ".join(f"{name} {durations[name]:.2f} s" for name in chain if name in durations) or "nothing built")
+    )
+    log(
+        f"Steps: {len(durations)} built, {len(steps) - len(stale)} up to date"
+        + (f", {len(failed)} failed, {len(skipped)} not run" if failed else "")
+        + f"; wall {wall:.2f} s for {sum(durations.values()):.2f} s of step time at --jobs {jobs}"
+    )
+    return len(failed)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("command", choices=sorted(list(COMMANDS) + ["all", "assets"]))
+    parser.add_argument("--force", action="store_true", help="Rebuild even if up to date")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="Arguments for the underlying script")
+    ns = parser.parse_args()
+
+    log(
+        f"Startup: interpreter {_INTERPRETER_CPU_S * 1000.0:.0f} ms CPU, "
+        f"entry point {(time.perf_counter() - _T0) * 1000.0:.0f} ms"
+    )
+
+    repo_root = os.getcwd()
+    cache_path = os.path.join(repo_root, CACHE_FILE)
+    cache = _load_cache(cache_path)
+    sources = _sources_digest()
+
+    if ns.command == "assets":
+        try:
+            failed = run_assets(list(ns.args), cache, sources, ns.force)
+        finally:
+            _save_cache(cache_path, cache)
+        log(f"Done: {(time.perf_counter() - _T0):.2f} s total")
+        return 1 if failed else 0
+
+    names = list(ALL_ORDER) if ns.command == "all" else [ns.command]
+    built = 0
+    try:
+        for name in names:
+            if run_command(name, list(ns.args), cache, sources, ns.force):
+                built += 1
+    finally:
+        _save_cache(cache_path, cache)
+
+    log(f"Done: {built} built, {len(names) - built} up to date, {(time.perf_counter() - _T0):.2f} s total")
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        raise SystemExit(main())
+    except Exception as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        raise
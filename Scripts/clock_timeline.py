@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+clock_timeline.py
+
+WidgetKit timeline budget for the clock widget's timer-driven hands.
+
+Every timeline entry renders WidgetWeaverClockWidgetLiveView once; after that the hands
+are moved by Text(timerInterval:) strings shaped by the clock fonts. Each string stops
+driving its hand at a fixed point after the entry was rendered:
+
+- second hand: timer anchored on the entry's minute (minus timerStartBiasSeconds). The
+  second-hand font maps m:ss / mm:ss only, so the hand drops out when the elapsed time
+  reaches its 59:59 ceiling, and the text freezes at secondsHandTimerWindowSeconds.
+- minute hand: timer anchored on the entry's hour. The minute-hand fonts map h:mm:ss for
+  hours below WINDOW_HOURS, and the text freezes at minuteHandTimerWindowSeconds.
+
+The next entry has to be rendered by the earlier of those points. simulate() places
+entries greedily over the visible part of a day: each one at the moment the previous one
+stops covering the widget, which is the minimum, because a later render never expires
+earlier. It reports the entry count, which hand forced each entry, and the reloads that
+costs at a given number of entries per timeline. The hour hand and the view-level minute
+heartbeat are not modelled: the host may not re-run the body between entries, so only
+the entry date anchors the timers.
+
+Dependencies:
+  none (standard library)
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Tuple
+
+
+# Must match WidgetWeaverClockWidgetLiveView (WidgetWeaverClockWidgetLiveView.swift).
+SECONDS_HAND_TIMER_WINDOW_SECONDS = 2.0 * 60.0 * 60.0
+MINUTE_HAND_TIMER_WINDOW_SECONDS = 2.0 * 60.0 * 60.0
+TIMER_START_BIAS_SECONDS = 0.25
+
+# generate_second_hand_font.py maps up to 59:59; with --multi-hour it has no ceiling (math.inf,
+# or --second-ceiling-hours inf), and only secondsHandTimerWindowSeconds limits the second hand.
+SECOND_FONT_CEILING_SECONDS = 3600.0
+
+# Ligatures outside the h:mm:ss form: mm:ss (3600) + m:ss (600).
+_MINUTE_FONT_SHORT_FORM_LIGATURES = 4200
+
+# WidgetKit gives a frequently viewed widget roughly 40-70 reloads a day; plan for the low end.
+DAILY_RELOAD_BUDGET = 40
+
+DAY_SECONDS = 24 * 3600
+
+
+@dataclass(frozen=True)
+class TimerConfig:
+    window_hours: int
+    minute_window_seconds: float = MINUTE_HAND_TIMER_WINDOW_SECONDS
+    second_window_seconds: float = SECONDS_HAND_TIMER_WINDOW_SECONDS
+    second_ceiling_seconds: float = SECOND_FONT_CEILING_SECONDS
+    start_bias_seconds: float = TIMER_START_BIAS_SECONDS
+    show_seconds: bool = True
+
+    @property
+    def label(self) -> str:
+        parts = [
+            f"WINDOW_HOURS={self.window_hours}",
+            f"minute window {self.minute_window_seconds / 3600.0:g} h",
+        ]
+        if self.show_seconds:
+            parts.append(f"second window {self.second_window_seconds / 3600.0:g} h")
+            parts.append(f"second ceiling {self.second_ceiling_seconds / 3600.0:g} h")
+        else:
+            parts.append("no second hand")
+        return ", ".join(parts)
+
+    @property
+    def minute_font_ligatures(self) -> int:
+        return self.window_hours * 3600 + _MINUTE_FONT_SHORT_FORM_LIGATURES
+
+    def second_expiry(self, t: float) -> float:
+        anchor = math.floor(t / 60.0) * 60.0
+        return anchor + min(self.second_ceiling_seconds - self.start_bias_seconds, self.second_window_seconds)
+
+    def minute_expiry(self, t: float) -> float:
+        anchor = math.floor(t / 3600.0) * 3600.0
+        return anchor + min(self.window_hours * 3600.0 - self.start_bias_seconds, self.minute_window_seconds)
+
+    def expiry(self, t: float) -> Tuple[float, str]:
+        """When an entry rendered at t stops driving a hand, and which hand that is."""
+        minute = self.minute_expiry(t)
+        if self.show_seconds:
+            second = self.second_expiry(t)
+            if second < minute:
+                return second, "second"
+        return minute, "minute"
+
+
+@dataclass
+class TimelineSimulation:
+    config: TimerConfig
+    visible_seconds: float
+    entries_per_timeline: int
+    entries: List[float] = field(default_factory=list)
+    # hand whose timer ran out -> entries it forced (the first entry of each visible span is "visible")
+    forced_by: Dict[str, int] = field(default_factory=dict)
+    # visible time no entry can cover: the window ends before the anchor rolls over
+    uncovered_seconds: float = 0.0
+
+    @property
+    def reloads(self) -> int:
+        return math.ceil(len(self.entries) / max(1, self.entries_per_timeline))
+
+    @property
+    def min_reload_gap_seconds(self) -> float:
+        starts = self.entries[:: max(1, self.entries_per_timeline)]
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        return min(gaps) if gaps else float("inf")
+
+    def minute_reload_policy_reloads(self) -> int:
+        """Reloads of the current one-entry, next-minute-boundary timeline over the same visibility."""
+        return math.ceil(self.visible_seconds / 60.0)
+
+    def summary_lines(self, budget: int = DAILY_RELOAD_BUDGET) -> List[str]:
+        forced = ", ".join(f"{hand} {n}" for hand, n in sorted(self.forced_by.items()))
+        gap = self.min_reload_gap_seconds
+        gap_text = f"{gap / 60.0:.1f} min" if math.isfinite(gap) else "n/a"
+        status = "within" if self.reloads <= budget else "OVER"
+        lines = [
+            f"{self.config.label}: {self.config.minute_font_ligatures} minute-font ligatures",
+            f"  entries {len(self.entries)} ({forced}), reloads {self.reloads} at "
+            f"{self.entries_per_timeline} entries per timeline, min reload gap {gap_text}; "
+            f"{status} the {budget}/day budget (minute reloads: {self.minute_reload_policy_reloads()})",
+        ]
+        if self.uncovered_seconds:
+            lines.append(
+                f"  {self.uncovered_seconds:g} s of visible time past every mapped range "
+                "(hand missing until the next anchor)"
+            )
+        return lines
+
+
+def merge_spans(spans: Sequence[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    merged: List[Tuple[float, float]] = []
+    for a, b in sorted((max(0.0, a), min(float(DAY_SECONDS), b)) for a, b in spans):
+        if b <= a:
+            continue
+        if merged and a <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], b))
+        else:
+            merged.append((a, b))
+    return merged
+
+
+def parse_visibility(spec: str) -> List[Tuple[float, float]]:
+    """ "7-9,12:30-13,18-24" -> [(start, end)] in seconds after midnight."""
+
+    def seconds(text: str) -> float:
+        hours, _, minutes = text.strip().partition(":")
+        return float(hours) * 3600.0 + (float(minutes) * 60.0 if minutes else 0.0)
+
+    spans = []
+    for part in spec.split(","):
+        if not part.strip():
+            continue
+        start, sep, end = part.partition("-")
+        if not sep:
+            raise ValueError(f"Visibility span {part!r} is not START-END")
+        spans.append((seconds(start), seconds(end)))
+    return merge_spans(spans)
+
+
+def simulate(
+    config: TimerConfig,
+    visibility: Sequence[Tuple[float, float]] = ((0.0, float(DAY_SECONDS)),),
+    entries_per_timeline: int = 1,
+) -> TimelineSimulation:
+    spans = merge_spans(visibility)
+    sim = TimelineSimulation(
+        config=config,
+        visible_seconds=sum(b - a for a, b in spans),
+        entries_per_timeline=entries_per_timeline,
+    )
+
+    covered_until = -math.inf
+    hand = "visible"
+    for start, end in spans:
+        if covered_until < start:
+            t, reason = start, "visible"
+        else:
+            t, reason = covered_until, hand
+        while t < end:
+            expiry, hand = config.expiry(t)
+            if expiry <= t:
+                # Past the mapped range for this anchor: nothing drives the hand until the
+                # anchor rolls over (the next hour for the minute hand, minute for the second).
+                period = 3600.0 if hand == "minute" else 60.0
+                boundary = math.floor(t / period) * period + period
+                sim.uncovered_seconds += min(boundary, end) - t
+                t, reason = boundary, hand
+                continue
+            sim.entries.append(t)
+            sim.forced_by[reason] = sim.forced_by.get(reason, 0) + 1
+            t = covered_until = expiry
+            reason = hand
+    return sim
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+clock_widget_metrics.py
+
+Widget-side sizes the clock fonts are drawn at, for tools that rasterize glyphs offline.
+
+The Home Screen clock widget only supports .systemSmall. The hand glyph views draw the
+fonts at size == dialDiameter (points), so one em spans the dial. The dial diameter
+follows WWClockDialLayout in WidgetWeaverClockWidgetLiveView.swift, including the
+WWClock.pixel(...) snapping.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List
+
+
+# Must match WWClock.outerBezelInsetScale (WidgetWeaverClockSupport.swift).
+OUTER_BEZEL_INSET_SCALE = 0.925
+
+# Must match WWClockDialLayout.metalThicknessRatio.
+METAL_THICKNESS_RATIO = 0.062
+
+
+@dataclass(frozen=True)
+class WidgetFamilySize:
+    name: str
+    side_points: float
+    display_scale: float
+
+    @property
+    def dial_diameter_points(self) -> float:
+        return dial_diameter_points(self.side_points, self.display_scale)
+
+    @property
+    def dial_pixels(self) -> int:
+        return int(round(self.dial_diameter_points * self.display_scale))
+
+
+# .systemSmall side lengths (points) across the device classes we ship to.
+WIDGET_FAMILY_SIZES: Dict[str, WidgetFamilySize] = {
+    "small-compact": WidgetFamilySize("small-compact", 148.0, 2.0),
+    "small-standard": WidgetFamilySize("small-standard", 158.0, 3.0),
+    "small-max": WidgetFamilySize("small-max", 170.0, 3.0),
+}
+
+
+def _pixel(value: float, scale: float) -> float:
+    if scale <= 0:
+        return value
+    # Swift .toNearestOrAwayFromZero; values here are always positive.
+    return float(int(value * scale + 0.5)) / scale
+
+
+def _clamp(value: float, lo: float, hi: float) -> float:
+    return min(max(value, lo), hi)
+
+
+def dial_diameter_points(side_points: float, scale: float) -> float:
+    outer_diameter = _pixel(side_points * OUTER_BEZEL_INSET_SCALE, scale)
+    outer_radius = outer_diameter * 0.5
+
+    provisional_r = outer_radius / (1.0 + METAL_THICKNESS_RATIO)
+
+    ring_a = _pixel(provisional_r * 0.010, scale)
+    ring_c = _pixel(
+        _clamp(provisional_r * 0.0095, provisional_r * 0.008, provisional_r * 0.012),
+        scale,
+    )
+
+    min_b = 1.0 / scale if scale > 0 else 1.0
+    ring_b = _pixel(max(min_b, outer_radius - provisional_r - ring_a - ring_c), scale)
+
+    r = outer_radius - ring_a - ring_b - ring_c
+    return r * 2.0
+
+
+def dial_pixel_sizes() -> List[int]:
+    """Distinct dial sizes in device pixels, smallest first."""
+    return sorted({f.dial_pixels for f in WIDGET_FAMILY_SIZES.values()})
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+combined_hands.py
+
+Combined minute + second hand glyphs: one glyph per second of the hour.
+
+The live widget draws the minute and second hands as two Text(timerInterval:) views in
+two fonts, so every tick shapes two timer strings against two ligature tables. With the
+combined glyphs, one timer string shapes to hs0000..hs3599, and each of those draws both
+hands. The minute generators' --combined mode adds them to the minute-hand font and points
+its ligature lookup at them.
+
+Each hs<second-of-hour> glyph is a composite of two components: the mh**** glyph for that
+second's minute bucket and sec<ss>. The outlines are stored once, and each combined glyph
+costs about 20 bytes of glyf plus its loca/hmtx/post entries. Both components carry the
+same keeper squares, so the 0..1000 bounds are unchanged.
+
+A combined glyph renders both hands with the single style of its Text view. Faces that
+tint the second hand differently, or draw the minute hand with the metal fill and edge,
+would need a COLR layer per hand to keep those styles.
+
+combined_report() compares a combined font with the two-font setup: glyph counts, file and
+GSUB bytes, timer-string shaping cost per tick (the timer_shaping.py model of CoreText's
+ligature pass), and a parity check of every combined glyph against what the two fonts
+shape to separately.
+
+Dependencies:
+  python3 -m pip install --user fonttools
+"""
+
+from __future__ import annotations
+
+import io
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+from fontTools.ttLib import TTFont
+
+from timer_shaping import TimerShaper, format_timer
+
+
+COMBINED_GLYPH_PREFIX = "hs"
+
+SECONDS_PER_HOUR = 3600
+
+
+def combined_glyph_name(second_of_hour: int) -> str:
+    return f"{COMBINED_GLYPH_PREFIX}{second_of_hour:04d}"
+
+
+def combined_glyph_for_time(h: int, m: int, s: int) -> str:
+    return combined_glyph_name(m * 60 + s)
+
+
+def add_combined_glyphs(
+    font: TTFont,
+    minute_glyph_for_second: Callable[[int], str],
+    log_fn: Callable[[str], None] = print,
+) -> List[str]:
+    """Adds hs0000..hs3599 as (minute glyph, sec<ss>) composites; returns their names."""
+    glyf = font["glyf"]
+    hmtx = font["hmtx"]
+    base_aw = hmtx["sec00"][0] if "sec00" in hmtx.metrics else 1000
+
+    # TTGlyphPen only checks component names against the glyph set.
+    existing = set(font.getGlyphOrder())
+
+    names: List[str] = []
+    for t in range(SECONDS_PER_HOUR):
+        pen = TTGlyphPen(existing)
+        pen.addComponent(minute_glyph_for_second(t), (1, 0, 0, 1, 0, 0))
+        pen.addComponent(f"sec{t % 60:02d}", (1, 0, 0, 1, 0, 0))
+        glyph = pen.glyph()
+
+        name = combined_glyph_name(t)
+        glyf[name] = glyph
+        glyph.recalcBounds(glyf)
+        hmtx.metrics[name] = (base_aw, 0)
+        names.append(name)
+
+    log_fn(f"Added {len(names)} combined glyphs ({names[0]}..{names[-1]}, minute + second composites)")
+    return names
+
+
+@dataclass
+class CombinedReport:
+    combined_glyphs: int
+    combined_bytes: int
+    combined_gsub: int
+    two_font_glyphs: int
+    two_font_bytes: int
+    two_font_gsub: int
+    combined_shape_us: float
+    two_font_shape_us: float
+    ticks_checked: int
+    mismatches: List[str]
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches
+
+    def summary_lines(self, limit: int = 10) -> List[str]:
+        def delta(a: int, b: int) -> str:
+            return f"{a - b:+d} ({(a - b) / b * 100.0:+.1f}%)" if b else f"{a - b:+d}"
+
+        lines = [
+            f"Combined font: {self.combined_glyphs} glyphs, {self.combined_bytes} B (GSUB {self.combined_gsub} B)",
+            f"Two-font setup: {self.two_font_glyphs} glyphs, {self.two_font_bytes} B (GSUB {self.two_font_gsub} B)",
+            f"  glyphs {delta(self.combined_glyphs, self.two_font_glyphs)}, "
+            f"bytes {delta(self.combined_bytes, self.two_font_bytes)}, "
+            f"GSUB {delta(self.combined_gsub, self.two_font_gsub)}",
+            f"  per tick: 1 timer string vs 2; shaping {self.combined_shape_us:.1f} µs vs "
+            f"{self.two_font_shape_us:.1f} µs (timer_shaping model, {self.ticks_checked} ticks)",
+        ]
+        for m in self.mismatches[:limit]:
+            lines.append(f"  MISMATCH {m}")
+        lines.append("  parity OK" if self.ok else f"  parity FAIL ({len(self.mismatches)} ticks)")
+        return lines
+
+
+def _font(data: bytes) -> TTFont:
+    return TTFont(io.BytesIO(data), lazy=True)
+
+
+def _components(font: TTFont, name: str) -> List[str]:
+    glyph = font["glyf"][name]
+    return [c.glyphName for c in glyph.components] if glyph.isComposite() else [name]
+
+
+def combined_report(
+    combined: bytes,
+    minute: bytes,
+    second: bytes,
+    window_seconds: Optional[int] = None,
+) -> CombinedReport:
+    """
+    Compares the combined font with the minute + second fonts over every tick of the
+    window (default: two hours, minuteHandTimerWindowSeconds). The second-hand font only maps
+    m:ss / mm:ss, so its half of the comparison uses the seconds of the hour.
+    """
+    fonts = {"combined": _font(combined), "minute": _font(minute), "second": _font(second)}
+    shapers = {key: TimerShaper(font) for key, font in fonts.items()}
+    ticks = range(window_seconds if window_seconds is not None else 2 * SECONDS_PER_HOUR)
+
+    timings = {}
+    for key, shaper in shapers.items():
+        texts = [format_timer(t if key != "second" else t % SECONDS_PER_HOUR) for t in ticks]
+        t0 = time.perf_counter()
+        for text in texts:
+            shaper.shape(text)
+        timings[key] = (time.perf_counter() - t0) / max(1, len(texts)) * 1e6
+
+    mismatches: List[str] = []
+    for t in ticks:
+        text = format_timer(t)
+        try:
+            got = _components(fonts["combined"], shapers["combined"].hand_glyph(text))
+            want = [
+                shapers["minute"].hand_glyph(text),
+                shapers["second"].hand_glyph(format_timer(t % SECONDS_PER_HOUR)),
+            ]
+        except ValueError as e:
+            mismatches.append(f"{text!r}: {e}")
+            continue
+        if got != want:
+            mismatches.append(f"{text!r}: {'+'.join(got)}, expected {'+'.join(want)}")
+
+    def glyph_count(font: TTFont) -> int:
+        return len(font.getGlyphOrder())
+
+    def gsub_bytes(font: TTFont) -> int:
+        return font.reader.tables["GSUB"].length if "GSUB" in font.reader.tables else 0
+
+    return CombinedReport(
+        combined_glyphs=glyph_count(fonts["combined"]),
+        combined_bytes=len(combined),
+        combined_gsub=gsub_bytes(fonts["combined"]),
+        two_font_glyphs=glyph_count(fonts["minute"]) + glyph_count(fonts["second"]),
+        two_font_bytes=len(minute) + len(second),
+        two_font_gsub=gsub_bytes(fonts["minute"]) + gsub_bytes(fonts["second"]),
+        combined_shape_us=timings["combined"],
+        two_font_shape_us=timings["minute"] + timings["second"],
+        ticks_checked=len(ticks),
+        mismatches=mismatches,
+    )
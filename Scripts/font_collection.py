@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+font_collection.py
+
+TrueType Collection (.ttc) output for the minute-hand font variants.
+
+WWClockMinuteHand-Regular.ttf and WWClockMinuteHandIcon-Regular.ttf differ only in hand
+width, so their GSUB, cmap, hmtx, post, hhea, maxp and OS/2 tables are byte for byte
+identical. In a collection each table is stored once and referenced from both faces'
+table directories; only glyf, loca, name and head (checksum, timestamp) stay per face.
+
+collection_bytes() builds the collection from already-built fonts without decompiling
+any table: identical compiled tables are written once (TTCollection shareTables).
+collection_report() lists which tables are shared and what deduplication saves against
+the separate files, and checks that every face reads back from the collection with the
+same tables it had on its own.
+
+CoreText registers every face in a .ttc (CTFontManagerRegisterFontsForURL), by the same
+PostScript names as the separate files.
+
+Dependencies:
+  python3 -m pip install --user fonttools
+
+Run from repo root (after both minute-hand generators):
+  python3 -u Scripts/font_collection.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import os
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from fontTools.ttLib import TTFont
+from fontTools.ttLib.ttCollection import TTCollection
+
+from font_io import write_bytes_atomic
+
+
+REPO_REL_COLLECTION_TTC = os.path.join(
+    "WidgetWeaverWidget",
+    "Clock",
+    "WWClockMinuteHands-Regular.ttc",
+)
+
+# Faces of REPO_REL_COLLECTION_TTC, in collection order.
+REPO_REL_COLLECTION_MEMBERS = (
+    os.path.join("WidgetWeaverWidget", "Clock", "WWClockMinuteHand-Regular.ttf"),
+    os.path.join("WidgetWeaverWidget", "Clock", "WWClockMinuteHandIcon-Regular.ttf"),
+)
+
+
+def _tables(data: bytes, font_number: int = -1) -> Dict[str, bytes]:
+    font = TTFont(io.BytesIO(data), lazy=True, fontNumber=font_number)
+    return {tag: font.reader[tag] for tag in font.reader.keys()}
+
+
+def collection_bytes(fonts: Sequence[bytes]) -> bytes:
+    """Compiled .ttc of the given fonts, storing identical tables once."""
+    collection = TTCollection()
+    collection.fonts = [TTFont(io.BytesIO(data), recalcTimestamp=False) for data in fonts]
+    buf = io.BytesIO()
+    collection.save(buf, shareTables=True)
+    return buf.getvalue()
+
+
+@dataclass
+class CollectionReport:
+    names: List[str]
+    separate_bytes: int
+    collection_bytes: int
+    # tag -> bytes saved by storing the table once
+    shared: Dict[str, int] = field(default_factory=dict)
+    # tag -> per-face sizes of tables that differ between faces
+    distinct: Dict[str, Tuple[int, ...]] = field(default_factory=dict)
+    mismatches: List[str] = field(default_factory=list)
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.separate_bytes - self.collection_bytes
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches
+
+    def summary_lines(self) -> List[str]:
+        pct = self.saved_bytes / self.separate_bytes * 100.0 if self.separate_bytes else 0.0
+        lines = [
+            f"Collection of {len(self.names)} faces ({', '.join(self.names)}): "
+            f"{self.collection_bytes} B vs {self.separate_bytes} B separate, "
+            f"saves {self.saved_bytes} B ({pct:.1f}%)",
+        ]
+        if self.shared:
+            lines.append(
+                "  shared: " + ", ".join(f"{tag} {n} B" for tag, n in sorted(self.shared.items(), key=lambda i: -i[1]))
+            )
+        if self.distinct:
+            lines.append(
+                "  per face: "
+                + ", ".join(f"{tag} {'/'.join(str(n) for n in sizes)} B" for tag, sizes in sorted(self.distinct.items()))
+            )
+        for m in self.mismatches:
+            lines.append(f"  MISMATCH {m}")
+        return lines
+
+
+def collection_report(fonts: Sequence[bytes], names: Sequence[str], ttc: bytes) -> CollectionReport:
+    """Compares a collection built by collection_bytes() with the separate fonts."""
+    sources = [_tables(data) for data in fonts]
+
+    shared: Dict[str, int] = {}
+    distinct: Dict[str, Tuple[int, ...]] = {}
+    for tag in sorted(set().union(*sources)):
+        blobs = [tables.get(tag) for tables in sources]
+        if all(b is not None and b == blobs[0] for b in blobs):
+            shared[tag] = len(blobs[0]) * (len(blobs) - 1)
+        else:
+            distinct[tag] = tuple(len(b) if b is not None else 0 for b in blobs)
+
+    mismatches: List[str] = []
+    for i, (name, tables) in enumerate(zip(names, sources)):
+        packed = _tables(ttc, i)
+        for tag in sorted(set(tables) | set(packed)):
+            # head.checksumAdjustment is recomputed for the collection.
+            want, got = tables.get(tag), packed.get(tag)
+            if tag == "head" and want is not None and got is not None:
+                want, got = want[:8] + want[12:], got[:8] + got[12:]
+            if want != got:
+                mismatches.append(f"{name}: table {tag!r} differs in the collection")
+
+    return CollectionReport(
+        names=list(names),
+        separate_bytes=sum(len(data) for data in fonts),
+        collection_bytes=len(ttc),
+        shared=shared,
+        distinct=distinct,
+        mismatches=mismatches,
+    )
+
+
+def write_minute_collection(repo_root: str, log_fn: Callable[[str], None] = print) -> bool:
+    """
+    Writes REPO_REL_COLLECTION_TTC from the minute-hand variants on disk and logs the
+    savings. Returns False (and writes nothing) while a variant has not been built yet.
+    """
+    paths = [os.path.join(repo_root, rel) for rel in REPO_REL_COLLECTION_MEMBERS]
+    missing = [p for p in paths if not os.path.exists(p)]
+    if missing:
+        log_fn(f"Collection skipped, not built yet: {', '.join(missing)}")
+        return False
+
+    fonts = []
+    for path in paths:
+        with open(path, "rb") as f:
+            fonts.append(f.read())
+
+    ttc = collection_bytes(fonts)
+    report = collection_report(fonts, [os.path.basename(p) for p in paths], ttc)
+    for line in report.summary_lines():
+        log_fn(line)
+    if not report.ok:
+        raise RuntimeError("Collection faces do not match the separate fonts")
+
+    out_path = os.path.join(repo_root, REPO_REL_COLLECTION_TTC)
+    write_bytes_atomic(out_path, ttc)
+    log_fn(f"Wrote: {out_path}")
+    return True
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Write the minute-hand .ttc from the built variants")
+    parser.parse_args(argv)
+    return 0 if write_minute_collection(os.getcwd()) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
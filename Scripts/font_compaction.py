@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+font_compaction.py
+
+hmtx/loca layout for the uniform-advance generated glyphs.
+
+Every generated hand glyph (sec**, mh****) has the same advance and, thanks to the keeper
+squares, the same 0..1000 bounds and a zero left side bearing. Two table layouts benefit:
+
+- hmtx: hhea.numberOfHMetrics only needs to cover glyphs up to the start of the trailing
+  run of equal advances; everything after stores just a 2-byte lsb instead of a 4-byte
+  longHorMetric. arrange_uniform_advance_tail() keeps the hand glyphs as one trailing block
+  (.notdef and template glyphs first, in their original order), and fontTools' hmtx compiler
+  then collapses the run.
+- loca: short (uint16, offset/2) entries halve the table whenever glyf is under 128 KB with
+  even glyph offsets; fontTools pads odd-length glyphs to make that possible when it fits.
+  The 1 s-tick minute fonts are past that limit, so they keep long offsets; the report says
+  how far off they are.
+
+Identical glyph data cannot share loca offsets: the spec requires ascending offsets and
+derives each glyph's length from the next entry.
+
+compaction_report() reads the saved table directory and reports the layout and bytes saved.
+
+Dependencies:
+  python3 -m pip install --user fonttools
+"""
+
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass
+from typing import Iterable, List, Union
+
+from fontTools.ttLib import TTFont
+
+
+# Largest glyf size short loca offsets can address (uint16 * 2).
+SHORT_LOCA_LIMIT = 0x1FFFE
+
+
+@dataclass
+class CompactionReport:
+    glyphs: int
+    number_of_hmetrics: int
+    min_number_of_hmetrics: int
+    hmtx_bytes: int
+    glyf_bytes: int
+    loca_bytes: int
+    short_loca: bool
+
+    @property
+    def hmtx_uncollapsed_bytes(self) -> int:
+        return 4 * self.glyphs
+
+    @property
+    def hmtx_saved(self) -> int:
+        return self.hmtx_uncollapsed_bytes - self.hmtx_bytes
+
+    @property
+    def loca_long_bytes(self) -> int:
+        return 4 * (self.glyphs + 1)
+
+    @property
+    def loca_saved(self) -> int:
+        return self.loca_long_bytes - self.loca_bytes
+
+    @property
+    def hmtx_optimal(self) -> bool:
+        return self.number_of_hmetrics <= self.min_number_of_hmetrics
+
+    def summary_lines(self) -> List[str]:
+        lines = [
+            f"hmtx: numberOfHMetrics {self.number_of_hmetrics} of {self.glyphs} glyphs "
+            f"(minimum {self.min_number_of_hmetrics}), {self.hmtx_bytes} B, "
+            f"saves {self.hmtx_saved} B vs one longHorMetric per glyph"
+        ]
+        if self.short_loca:
+            lines.append(f"loca: short offsets, {self.loca_bytes} B, saves {self.loca_saved} B vs long offsets")
+        else:
+            over = self.glyf_bytes - SHORT_LOCA_LIMIT
+            lines.append(
+                f"loca: long offsets, {self.loca_bytes} B "
+                + (
+                    f"(glyf {self.glyf_bytes} B is {over} B over the {SHORT_LOCA_LIMIT} B short-offset range; "
+                    f"short offsets would save {self.loca_bytes // 2} B)"
+                    if over > 0
+                    else "(glyf fits the short-offset range; check for odd glyph offsets)"
+                )
+            )
+        return lines
+
+
+def arrange_uniform_advance_tail(font: TTFont, names: Iterable[str]) -> None:
+    """
+    Moves the given (uniform-advance) glyphs to the end of the glyph order as one block,
+    keeping every other glyph, .notdef first, in its original order. Call before GSUB or
+    other glyph-ID-dependent data is compiled; tables refer to glyphs by name until then.
+    """
+    tail = list(dict.fromkeys(names))
+    tail_set = set(tail)
+    head = [g for g in font.getGlyphOrder() if g not in tail_set]
+    font.setGlyphOrder(head + tail)
+    if "maxp" in font:
+        font["maxp"].numGlyphs = len(head) + len(tail)
+
+
+def min_number_of_hmetrics(advances: List[int]) -> int:
+    n = len(advances)
+    k = n
+    while k > 1 and advances[k - 2] == advances[n - 1]:
+        k -= 1
+    return k
+
+
+def compaction_report(source: Union[str, bytes]) -> CompactionReport:
+    if isinstance(source, (bytes, bytearray)):
+        font = TTFont(io.BytesIO(bytes(source)), lazy=True)
+    else:
+        font = TTFont(source, lazy=True)
+
+    order = font.getGlyphOrder()
+    hmtx = font["hmtx"]
+    advances = [hmtx[g][0] for g in order]
+    tables = font.reader.tables
+
+    return CompactionReport(
+        glyphs=len(order),
+        number_of_hmetrics=font["hhea"].numberOfHMetrics,
+        min_number_of_hmetrics=min_number_of_hmetrics(advances),
+        hmtx_bytes=tables["hmtx"].length,
+        glyf_bytes=tables["glyf"].length,
+        loca_bytes=tables["loca"].length,
+        short_loca=font["head"].indexToLocFormat == 0,
+    )
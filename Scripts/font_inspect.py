@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+font_inspect.py
+
+Fast structural summary of a built clock font, for sanity checks on every font change.
+
+Nothing glyph-sized is decompiled beyond a few sampled hand glyphs. The font is opened
+lazily and the big tables are read as raw bytes: GSUB lookups, subtables and ligature sets
+are walked by their offsets, and glyph contour and point counts come straight from each
+glyf record's header via loca. Only post (glyph names), name and the small header tables
+go through fontTools.
+
+inspect_font() reports, per requested section:
+- gsub:   per lookup its type, features and subtables; per subtable the glyphs it covers and,
+          for ligature subtables, the ligature count, component lengths and target glyphs
+- glyf:   per hand family (sec**, mh****, hs****) the glyph count, bucket range (and gaps),
+          and contour / point statistics
+- trails: whether the hand glyphs carry a trail, read from the outlines of a few glyphs per
+          family (glyph_family.decoration_contours), so copied or freshly checked-out fonts
+          report it too; then the base-glyph store (base_glyphs.py; in the font, or saved
+          beside the font file) if there is one, how many glyphs differ from their stored
+          base and which decoration layers are recorded, plus COLR / sbix layers
+- name:   family, subfamily, full name, version and PostScript name
+
+Problems that make the font unusable as a timer font (bucket gaps, ligatures targeting
+glyphs past the glyph count, no ligature lookup) are collected in issues.
+
+Dependencies:
+  python3 -m pip install --user fonttools numpy
+"""
+
+from __future__ import annotations
+
+import re
+import struct
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from fontTools.ttLib import TTFont
+
+from base_glyphs import BASE_GLYPHS_TAG, parse_glyph_store, saved_base_glyphs
+from glyph_family import decoration_contours
+
+
+SECTIONS = ("gsub", "glyf", "trails", "name")
+
+# Hand glyph families: second hand, minute hand, combined minute + second (combined_hands.py).
+FAMILY_PREFIXES = ("sec", "mh", "hs")
+
+_NAME_IDS = ((1, "family"), (2, "subfamily"), (4, "full name"), (5, "version"), (6, "PostScript"))
+
+# Glyphs per hand family checked for trail contours (decoration_contours decompiles them).
+TRAIL_SAMPLES = 8
+
+_LOOKUP_TYPES = {1: "single", 2: "multiple", 3: "alternate", 4: "ligature", 5: "context", 6: "chained context"}
+
+
+@dataclass
+class SubtableInfo:
+    lookup_type: int
+    covered: int
+    ligatures: int = 0
+    # ligature length (components + 1) -> count
+    lengths: Dict[int, int] = field(default_factory=dict)
+    targets: List[int] = field(default_factory=list)
+
+
+@dataclass
+class LookupInfo:
+    index: int
+    lookup_type: int
+    features: List[str]
+    extension: bool
+    subtables: List[SubtableInfo]
+
+
+@dataclass
+class FamilyInfo:
+    prefix: str
+    glyphs: int
+    first_bucket: int
+    last_bucket: int
+    gaps: List[int]
+    composites: int
+    contours: Tuple[int, float, int]
+    points: Tuple[int, float, int]
+    glyf_bytes: int
+
+
+@dataclass
+class FontInspection:
+    label: str
+    glyph_count: int
+    units_per_em: int
+    table_bytes: Dict[str, int]
+    lookups: List[LookupInfo] = field(default_factory=list)
+    families: List[FamilyInfo] = field(default_factory=list)
+    trails: List[str] = field(default_factory=list)
+    names: Dict[str, str] = field(default_factory=dict)
+    issues: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.issues
+
+    def summary_lines(self) -> List[str]:
+        total = sum(self.table_bytes.values())
+        lines = [f"{self.label}: {self.glyph_count} glyphs, unitsPerEm {self.units_per_em}, {total} B in tables"]
+
+        if self.names:
+            lines.append("  name: " + ", ".join(f"{k} {v!r}" for k, v in self.names.items()))
+
+        for lk in self.lookups:
+            kind = _LOOKUP_TYPES.get(lk.lookup_type, f"type {lk.lookup_type}")
+            ext = " (extension)" if lk.extension else ""
+            feats = ", ".join(lk.features) or "no feature"
+            lines.append(f"  GSUB lookup {lk.index}: {kind}{ext}, {feats}, {len(lk.subtables)} subtables")
+            for i, st in enumerate(lk.subtables):
+                if st.lookup_type == 4:
+                    lengths = ", ".join(f"{n}x{length}" for length, n in sorted(st.lengths.items()))
+                    targets = sorted(set(st.targets))
+                    span = f"gid {targets[0]}..{targets[-1]}" if targets else "none"
+                    lines.append(
+                        f"    subtable {i}: {st.ligatures} ligatures over {st.covered} first glyphs "
+                        f"(length {lengths}), {len(targets)} target glyphs ({span})"
+                    )
+                else:
+                    lines.append(f"    subtable {i}: {st.covered} glyphs covered")
+
+        for fam in self.families:
+            gaps = f", {len(fam.gaps)} gaps (first {fam.gaps[0]})" if fam.gaps else ""
+            composite = f", {fam.composites} composites" if fam.composites else ""
+            lines.append(
+                f"  {fam.prefix}: {fam.glyphs} glyphs, buckets {fam.first_bucket}..{fam.last_bucket}{gaps}{composite}; "
+                f"contours {fam.contours[0]}/{fam.contours[1]:.1f}/{fam.contours[2]}, "
+                f"points {fam.points[0]}/{fam.points[1]:.1f}/{fam.points[2]} (min/mean/max), "
+                f"glyf {fam.glyf_bytes} B"
+            )
+
+        for line in self.trails:
+            lines.append(f"  trails: {line}")
+        for issue in self.issues:
+            lines.append(f"  ISSUE {issue}")
+        return lines
+
+
+# -- raw table walkers ------------------------------------------------------------------
+
+
+def _u16(data: bytes, pos: int) -> int:
+    return (data[pos] << 8) | data[pos + 1]
+
+
+def _u32(data: bytes, pos: int) -> int:
+    return struct.unpack_from(">I", data, pos)[0]
+
+
+def _coverage_count(data: bytes, pos: int) -> int:
+    fmt, count = _u16(data, pos), _u16(data, pos + 2)
+    if fmt == 1:
+        return count
+    return sum(_u16(data, pos + 4 + 6 * i + 2) - _u16(data, pos + 4 + 6 * i) + 1 for i in range(count))
+
+
+def _subtable_info(data: bytes, pos: int, lookup_type: int) -> SubtableInfo:
+    coverage = pos + _u16(data, pos + 2)
+    if lookup_type == 6 and _u16(data, pos) == 3:
+        # Format 3 has one coverage per position: count the first input position.
+        inputs = pos + 4 + 2 * _u16(data, pos + 2)
+        coverage = pos + _u16(data, inputs + 2)
+    info = SubtableInfo(lookup_type=lookup_type, covered=_coverage_count(data, coverage))
+    if lookup_type != 4:
+        return info
+
+    lengths: Dict[int, int] = {}
+    for i in range(_u16(data, pos + 4)):
+        set_pos = pos + _u16(data, pos + 6 + 2 * i)
+        for j in range(_u16(data, set_pos)):
+            lig_pos = set_pos + _u16(data, set_pos + 2 + 2 * j)
+            info.targets.append(_u16(data, lig_pos))
+            length = _u16(data, lig_pos + 2)
+            lengths[length] = lengths.get(length, 0) + 1
+    info.ligatures = len(info.targets)
+    info.lengths = lengths
+    return info
+
+
+def _feature_tags(gsub: bytes) -> Dict[int, List[str]]:
+    """lookup index -> feature tags (de-duplicated, in FeatureList order)."""
+    out: Dict[int, List[str]] = {}
+    fl = _u16(gsub, 6)
+    for i in range(_u16(gsub, fl)):
+        rec = fl + 2 + 6 * i
+        tag = gsub[rec : rec + 4].decode("latin-1")
+        feat = fl + _u16(gsub, rec + 4)
+        for j in range(_u16(gsub, feat + 2)):
+            tags = out.setdefault(_u16(gsub, feat + 4 + 2 * j), [])
+            if tag not in tags:
+                tags.append(tag)
+    return out
+
+
+def gsub_lookups(gsub: bytes) -> List[LookupInfo]:
+    features = _feature_tags(gsub)
+    ll = _u16(gsub, 8)
+    lookups = []
+    for i in range(_u16(gsub, ll)):
+        lk = ll + _u16(gsub, ll + 2 + 2 * i)
+        lookup_type = _u16(gsub, lk)
+        extension = lookup_type == 7
+        subtables = []
+        for j in range(_u16(gsub, lk + 4)):
+            st = lk + _u16(gsub, lk + 6 + 2 * j)
+            st_type = lookup_type
+            if extension:
+                st_type = _u16(gsub, st + 2)
+                st += _u32(gsub, st + 4)
+            subtables.append(_subtable_info(gsub, st, st_type))
+        if extension and subtables:
+            lookup_type = subtables[0].lookup_type
+        lookups.append(LookupInfo(i, lookup_type, features.get(i, []), extension, subtables))
+    return lookups
+
+
+def glyph_offsets(font: TTFont) -> List[int]:
+    """glyf byte offset per glyph id, plus the end of the last glyph, from the raw loca table."""
+    loca = font.reader["loca"]
+    n = _u16(font.reader["maxp"], 4)
+    if _u16(font.reader["head"], 50) == 0:
+        return [2 * v for v in struct.unpack_from(f">{n + 1}H", loca)]
+    return list(struct.unpack_from(f">{n + 1}I", loca))
+
+
+def glyph_records(font: TTFont) -> List[Tuple[int, int, int]]:
+    """(byte length, numberOfContours, point count) per glyph id, from the raw loca and glyf tables."""
+    glyf = font.reader["glyf"]
+    offsets = glyph_offsets(font)
+    n = len(offsets) - 1
+
+    out = []
+    for gid in range(n):
+        start, end = offsets[gid], offsets[gid + 1]
+        if end <= start:
+            out.append((0, 0, 0))
+            continue
+        contours = struct.unpack_from(">h", glyf, start)[0]
+        points = _u16(glyf, start + 10 + 2 * (contours - 1)) + 1 if contours > 0 else 0
+        out.append((end - start, contours, points))
+    return out
+
+
+def _stats(values: Sequence[int]) -> Tuple[int, float, int]:
+    if not values:
+        return 0, 0.0, 0
+    return min(values), sum(values) / len(values), max(values)
+
+
+def family_infos(order: Sequence[str], records: Sequence[Tuple[int, int, int]]) -> List[FamilyInfo]:
+    members: Dict[str, List[Tuple[int, int]]] = {prefix: [] for prefix in FAMILY_PREFIXES}
+    patterns = {prefix: re.compile(rf"^{prefix}(\d+)$") for prefix in FAMILY_PREFIXES}
+    for gid, name in enumerate(order):
+        for prefix, pattern in patterns.items():
+            m = pattern.match(name)
+            if m:
+                members[prefix].append((int(m.group(1)), gid))
+                break
+
+    out = []
+    for prefix, items in members.items():
+        if not items:
+            continue
+        items.sort()
+        buckets = [b for b, _ in items]
+        present = set(buckets)
+        recs = [records[gid] for _, gid in items]
+        simple = [r for r in recs if r[1] >= 0]
+        out.append(
+            FamilyInfo(
+                prefix=prefix,
+                glyphs=len(items),
+                first_bucket=buckets[0],
+                last_bucket=buckets[-1],
+                gaps=[b for b in range(buckets[0], buckets[-1] + 1) if b not in present],
+                composites=len(recs) - len(simple),
+                contours=_stats([r[1] for r in simple]),
+                points=_stats([r[2] for r in simple]),
+                glyf_bytes=sum(r[0] for r in recs),
+            )
+        )
+    return out
+
+
+def _same_glyph(a: bytes, b: bytes) -> bool:
+    # glyf records are padded in the file; stored data may or may not carry the padding.
+    if len(a) > len(b):
+        a, b = b, a
+    return b[: len(a)] == a and not b[len(a) :].strip(b"\0")
+
+
+def _sample(count: int, samples: int) -> List[int]:
+    """Up to samples indices spread evenly over range(count), starting at 0."""
+    if count <= samples:
+        return list(range(count))
+    return sorted({round(i * count / samples) for i in range(samples)})
+
+
+def detected_trails(font: TTFont, order: Sequence[str], families: Sequence[FamilyInfo]) -> List[str]:
+    """
+    Trail contours per hand family, read from the glyph outlines themselves (no store needed):
+    TRAIL_SAMPLES glyphs spread over the family, bucket 0 first, through
+    glyph_family.decoration_contours(), plus the glyphs whose contour count differs from
+    bucket 0 (a family only partly trailed).
+    """
+    glyf = font.reader["glyf"]
+    offsets = glyph_offsets(font)
+    records = glyph_records(font)
+    lines = []
+    for fam in families:
+        if fam.composites:
+            continue
+        pattern = re.compile(rf"^{fam.prefix}(\d+)$")
+        gids = sorted(
+            ((int(m.group(1)), gid) for gid, m in ((gid, pattern.match(name)) for gid, name in enumerate(order)) if m)
+        )
+        found: Dict[str, List[int]] = {}
+        sampled = _sample(len(gids), TRAIL_SAMPLES)
+        for i in sampled:
+            gid = gids[i][1]
+            for decoration, count in decoration_contours(glyf[offsets[gid] : offsets[gid + 1]]).items():
+                found.setdefault(decoration, []).append(count)
+        first = records[gids[0][1]][1]
+        uneven = sum(1 for _, gid in gids if records[gid][1] != first)
+
+        if found:
+            kinds = ", ".join(
+                f"{d} ({min(c)}..{max(c)} contours)" if min(c) != max(c) else f"{d} ({c[0]} contours)"
+                for d, c in sorted(found.items())
+            )
+            on = max(len(c) for c in found.values())
+            line = f"{fam.prefix}: trail contours in {on} of {len(sampled)} sampled glyphs: {kinds}"
+        else:
+            line = f"{fam.prefix}: no trail contours in {len(sampled)} sampled glyphs"
+        if uneven:
+            line += f"; {uneven} glyphs differ from bucket {gids[0][0]} in contour count"
+        lines.append(line)
+    return lines
+
+
+def trail_lines(
+    font: TTFont, order: Sequence[str], families: Sequence[FamilyInfo], saved_store: Optional[bytes] = None
+) -> List[str]:
+    tags = set(font.reader.keys())
+    lines = detected_trails(font, order, families)
+    raw = font.reader[BASE_GLYPHS_TAG] if BASE_GLYPHS_TAG in tags else saved_store
+    if raw is not None:
+        store = parse_glyph_store(raw)
+        glyf = font.reader["glyf"]
+        offsets = glyph_offsets(font)
+        gids = {name: gid for gid, name in enumerate(order)}
+        # family prefix -> (stored, decorated)
+        counts: Dict[str, List[int]] = {}
+        # decoration -> glyphs carrying its layer
+        layers: Dict[str, int] = {}
+        for name, entry in store.items():
+            for decoration in entry.layers:
+                layers[decoration] = layers.get(decoration, 0) + 1
+            gid = gids.get(name)
+            if gid is None:
+                continue
+            prefix = re.sub(r"\d+$", "", name)
+            count = counts.setdefault(prefix, [0, 0])
+            count[0] += 1
+            count[1] += not _same_glyph(glyf[offsets[gid] : offsets[gid + 1]], entry.base)
+        per_family = ", ".join(f"{prefix} {n} of {stored}" for prefix, (stored, n) in sorted(counts.items()))
+        where = "" if BASE_GLYPHS_TAG in tags else " (saved beside the font file)"
+        lines.append(
+            f"{BASE_GLYPHS_TAG} base store{where} holds {len(store)} glyphs; decorated (differ from base): {per_family}"
+        )
+        if layers:
+            lines.append("  layers: " + ", ".join(f"{d} on {n} glyphs" for d, n in sorted(layers.items())))
+    else:
+        lines.append(f"no {BASE_GLYPHS_TAG} base store available (not in the font, none saved beside it)")
+    if "COLR" in tags:
+        lines.append(f"COLR paint layers present ({len(font.reader['COLR'])} B)")
+    if "sbix" in tags:
+        # sbix header: version, flags, numStrikes
+        lines.append(f"sbix bitmap strikes: {_u32(font.reader['sbix'], 4)}")
+    return lines
+
+
+def name_identity(font: TTFont) -> Dict[str, str]:
+    name = font["name"]
+    out = {}
+    for name_id, label in _NAME_IDS:
+        value = name.getDebugName(name_id)
+        if value is not None:
+            out[label] = value
+    return out
+
+
+def inspect_font(
+    font: TTFont, label: str, sections: Iterable[str] = SECTIONS, saved_store: Optional[bytes] = None
+) -> FontInspection:
+    sections = set(sections)
+    tables = {tag: font.reader.tables[tag].length for tag in font.reader.keys()}
+    report = FontInspection(
+        label=label,
+        glyph_count=_u16(font.reader["maxp"], 4),
+        units_per_em=_u16(font.reader["head"], 18),
+        table_bytes=tables,
+    )
+
+    if "name" in sections:
+        report.names = name_identity(font)
+
+    if "gsub" in sections:
+        if "GSUB" not in tables:
+            report.issues.append("no GSUB table")
+        else:
+            report.lookups = gsub_lookups(font.reader["GSUB"])
+            ligature_lookups = [lk for lk in report.lookups if lk.lookup_type == 4]
+            if not ligature_lookups:
+                report.issues.append("no ligature lookup")
+            for lk in ligature_lookups:
+                past = sum(1 for st in lk.subtables for t in st.targets if t >= report.glyph_count)
+                if past:
+                    report.issues.append(f"lookup {lk.index}: {past} ligatures target glyph ids past {report.glyph_count}")
+
+    if sections & {"glyf", "trails"}:
+        order = font.getGlyphOrder()
+        families = family_infos(order, glyph_records(font))
+        if "glyf" in sections:
+            report.families = families
+            for fam in families:
+                if fam.gaps:
+                    report.issues.append(f"{fam.prefix}: {len(fam.gaps)} missing buckets")
+            if not families:
+                report.issues.append(f"no {'/'.join(FAMILY_PREFIXES)} hand glyphs")
+        if "trails" in sections:
+            report.trails = trail_lines(font, order, families, saved_store)
+
+    return report
+
+
+def open_faces(path: str) -> List[Tuple[TTFont, str]]:
+    """(lazy font, label) per face: one for a .ttf/.otf, one per face of a .ttc."""
+    with open(path, "rb") as f:
+        tag = f.read(4)
+    if tag != b"ttcf":
+        return [(TTFont(path, lazy=True), path)]
+    with open(path, "rb") as f:
+        f.seek(8)
+        (count,) = struct.unpack(">I", f.read(4))
+    return [(TTFont(path, lazy=True, fontNumber=i), f"{path}#{i}") for i in range(count)]
+
+
+def inspect_path(path: str, sections: Optional[Iterable[str]] = None) -> List[FontInspection]:
+    faces = open_faces(path)
+    saved_store = None
+    if len(faces) == 1:
+        with open(path, "rb") as f:
+            saved_store = saved_base_glyphs(path, f.read())
+    return [inspect_font(font, label, sections or SECTIONS, saved_store) for font, label in faces]
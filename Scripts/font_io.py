@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+font_io.py
+
+In-memory font plumbing for the build functions.
+
+The generators' build_*() functions take a TTFont (modified in place) or raw font bytes and
+return a TTFont; font_bytes() serialises it through BytesIO. Only the CLI wrappers touch
+the disk, via write_bytes_atomic() (temp file in the target directory + os.replace, so an
+in-place rebuild never leaves a truncated font behind). The written file keeps the
+target's permissions, or gets the umask default for a new file, as font.save() did.
+
+Dependencies:
+  python3 -m pip install --user fonttools
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import stat
+import tempfile
+from typing import Union
+
+from fontTools.ttLib import TTFont
+
+
+FontSource = Union[TTFont, bytes, bytearray]
+
+
+def load_font(source: FontSource) -> TTFont:
+    """Returns source itself for a TTFont, otherwise a TTFont parsed from the bytes."""
+    if isinstance(source, TTFont):
+        return source
+    return TTFont(io.BytesIO(bytes(source)))
+
+
+def font_bytes(font: TTFont) -> bytes:
+    buf = io.BytesIO()
+    font.save(buf)
+    return buf.getvalue()
+
+
+def _target_mode(path: str) -> int:
+    """The existing file's permission bits, else what open() would create under the umask."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def write_bytes_atomic(path: str, data: bytes) -> None:
+    out_dir = os.path.dirname(os.path.abspath(path)) or "."
+    os.makedirs(out_dir, exist_ok=True)
+
+    # mkstemp creates 0600; the replaced file keeps the target's mode.
+    mode = _target_mode(path)
+    fd, tmp_path = tempfile.mkstemp(prefix=".build_", suffix=".ttf", dir=out_dir)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+font_parts.py
+
+Input fingerprints for incremental regeneration of the generated minute-hand fonts.
+
+A generated font is made of parts that depend on different inputs:
+
+- "base":   everything cloned from the template font, the glyph set and the name table
+            (template font tables, TICK_SECONDS, glyph naming)
+- "glyphs": the mh**** outlines (hand geometry code, hand template, simplify tolerance)
+- "gsub":   the timer ligature lookup (WINDOW_HOURS, TICK_SECONDS, the time -> glyph mapping)
+
+The generators hash the inputs of each part (PART_NAMES) into a key. After a build, the keys
+and the sha256 of the written font are recorded in .clock_font_parts.json at the repo root.
+On the next run stale_parts() compares them: if the output file is still the recorded one
+and "base" is unchanged, only the parts whose key changed are rebuilt and patched into the
+existing output (an outline tweak leaves GSUB as raw bytes, a window change leaves glyf
+as raw bytes); anything else means a full build.
+
+Code inputs are fingerprinted by source text (inspect.getsource), so editing the hand
+proportions in make_hand_glyph() invalidates "glyphs" only.
+
+The template key ignores head.checksumAdjustment and head.modified, so an in-place rebuild
+of the second-hand font that only bumps its timestamp does not force a full minute build.
+
+Dependencies:
+  python3 -m pip install --user fonttools
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import io
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from fontTools.ttLib import TTFont
+
+
+PARTS_FILE = ".clock_font_parts.json"
+
+PART_NAMES = ("base", "glyphs", "gsub")
+
+# head: checksumAdjustment (offset 8, 4 bytes) and modified (offset 28, 8 bytes).
+_HEAD_VOLATILE = ((8, 12), (28, 36))
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def template_key(data: bytes) -> str:
+    """Hash of the raw table data of a font, ignoring its checksum and modification time."""
+    font = TTFont(io.BytesIO(data), lazy=True)
+    h = hashlib.sha256()
+    for tag in sorted(font.reader.keys()):
+        raw = bytearray(font.reader[tag])
+        if tag == "head":
+            for start, end in _HEAD_VOLATILE:
+                raw[start:end] = bytes(end - start)
+        h.update(tag.encode("latin-1"))
+        h.update(_sha256(bytes(raw)).encode("ascii"))
+    return h.hexdigest()
+
+
+def hand_template_key(hand_template: Any) -> str:
+    """Key for a --hand-template spec ('hand.svg' / 'FONT.ttf:glyph'), a HandTemplate or None."""
+    if hand_template is None:
+        return "built-in"
+    if isinstance(hand_template, str):
+        path = hand_template
+        if not hand_template.lower().endswith(".svg"):
+            path = hand_template.rpartition(":")[0]
+        with open(path, "rb") as f:
+            return fingerprint(hand_template, f.read())
+    return fingerprint(hand_template.points.tobytes(), hand_template.flags, hand_template.end_pts)
+
+
+def fingerprint(*items: Any) -> str:
+    """Hash of values, bytes, and the source text of functions/modules."""
+    h = hashlib.sha256()
+    for item in items:
+        if isinstance(item, (bytes, bytearray)):
+            data = bytes(item)
+        elif inspect.isfunction(item) or inspect.ismodule(item):
+            data = inspect.getsource(item).encode("utf-8")
+        else:
+            data = repr(item).encode("utf-8")
+        h.update(_sha256(data).encode("ascii"))
+    return h.hexdigest()
+
+
+def _load(path: str) -> Dict[str, Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def stale_parts(out_path: str, out_data: Optional[bytes], keys: Dict[str, str]) -> Optional[List[str]]:
+    """
+    Parts whose key changed since out_path was written ([] = up to date), or None when the
+    output has to be built from scratch: no output or record, the output was replaced since,
+    or "base" changed.
+    """
+    if out_data is None:
+        return None
+    entry = _load(PARTS_FILE).get(os.path.abspath(out_path))
+    if not entry or entry.get("output") != _sha256(out_data):
+        return None
+    recorded = entry.get("keys", {})
+    stale = [part for part in PART_NAMES if recorded.get(part) != keys.get(part)]
+    if "base" in stale:
+        return None
+    return stale
+
+
+def record_parts(out_path: str, out_data: bytes, keys: Dict[str, str]) -> None:
+    records = _load(PARTS_FILE)
+    records[os.path.abspath(out_path)] = {"output": _sha256(out_data), "keys": dict(keys)}
+    tmp = PARTS_FILE + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(records, f, indent=2, sort_keys=True)
+    os.replace(tmp, PARTS_FILE)
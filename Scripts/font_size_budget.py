@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+font_size_budget.py
+
+Per-table size breakdown and size budgets for the clock fonts.
+
+The widget extension runs under a tight memory limit and loads these fonts on every
+timeline render, so size regressions (another trail layer, a wider ligature window, a finer
+TICK_SECONDS) are checked at build time rather than found on device. Table sizes are read
+from the sfnt table directory, so the report costs little more than reading the glyph order
+and GSUB.
+
+The report shows, for glyf/loca/GSUB/post/hmtx/name, the byte count, share of the file and
+a per-unit cost (bytes per hand glyph for glyf, per glyph for loca/hmtx/post, per ligature
+for GSUB). FONT_BUDGETS holds the configured ceilings per shipped font file. They are sized
+for the default hands; a richer --hand-template can be built with --no-budget (report only)
+or --budget-as NAME (another shipped font's ceilings), which the generators and
+Tools/report_font_sizes.py share through add_budget_arguments.
+
+Dependencies:
+  python3 -m pip install --user fonttools
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Union
+
+from fontTools.ttLib import TTFont
+
+from font_compaction import compaction_report
+from timer_shaping import feature_lookup_indices, unwrap_subtable
+
+
+REPORT_TABLES = ("glyf", "loca", "GSUB", "post", "hmtx", "name")
+
+HAND_GLYPH_RE = re.compile(r"^(?:sec\d{2}|mh\d{4}|hs\d{4})$")
+
+
+@dataclass
+class FontBudget:
+    total: int
+    tables: Dict[str, int] = field(default_factory=dict)
+
+
+# Ceilings in bytes, roughly 10% above the current builds (second-hand font: room for the
+# sweep + arc trails, which add ~17 KB).
+FONT_BUDGETS: Dict[str, FontBudget] = {
+    "WWClockMinuteHand-Regular.ttf": FontBudget(
+        total=420_000,
+        tables={"glyf": 225_000, "loca": 16_384, "GSUB": 135_000, "post": 36_864, "hmtx": 8_192, "name": 1_024},
+    ),
+    "WWClockMinuteHandIcon-Regular.ttf": FontBudget(
+        total=420_000,
+        tables={"glyf": 225_000, "loca": 16_384, "GSUB": 135_000, "post": 36_864, "hmtx": 8_192, "name": 1_024},
+    ),
+    "WWClockHands-Regular.ttf": FontBudget(
+        total=570_000,
+        tables={"glyf": 310_000, "loca": 32_768, "GSUB": 135_000, "post": 73_728, "hmtx": 16_384, "name": 1_024},
+    ),
+    "WWClockHandsIcon-Regular.ttf": FontBudget(
+        total=570_000,
+        tables={"glyf": 310_000, "loca": 32_768, "GSUB": 135_000, "post": 73_728, "hmtx": 16_384, "name": 1_024},
+    ),
+    "WWClockSecondHand-Regular.ttf": FontBudget(
+        total=40_960,
+        tables={"glyf": 24_576, "loca": 512, "GSUB": 10_240, "post": 2_048, "hmtx": 1_024, "name": 1_024},
+    ),
+}
+
+
+@dataclass
+class FontSizeReport:
+    name: str
+    total: int
+    tables: Dict[str, int]
+    glyphs: int
+    hand_glyphs: int
+    ligatures: int
+
+    def per_unit(self, tag: str) -> Optional[str]:
+        size = self.tables.get(tag, 0)
+        if tag == "glyf" and self.hand_glyphs:
+            return f"{size / self.hand_glyphs:.1f} B/hand glyph"
+        if tag in ("loca", "hmtx", "post") and self.glyphs:
+            return f"{size / self.glyphs:.2f} B/glyph"
+        if tag == "GSUB" and self.ligatures:
+            return f"{size / self.ligatures:.2f} B/ligature"
+        return None
+
+    def summary_lines(self, budget: Optional[FontBudget] = None) -> List[str]:
+        lines = [
+            f"{self.name}: {self.total} bytes, {self.glyphs} glyphs ({self.hand_glyphs} hand), "
+            f"{self.ligatures} ligatures"
+            + (f", budget {self.total / budget.total * 100.0:.0f}% of {budget.total}" if budget else "")
+        ]
+        for tag in REPORT_TABLES:
+            if tag not in self.tables:
+                continue
+            size = self.tables[tag]
+            share = 100.0 * size / self.total if self.total else 0.0
+            unit = self.per_unit(tag)
+            limit = budget.tables.get(tag) if budget else None
+            lines.append(
+                f"  {tag:<5} {size:>8} B {share:5.1f}%"
+                + (f"  {unit}" if unit else "")
+                + (f"  (budget {limit}{', OVER' if size > limit else ''})" if limit else "")
+            )
+        other = self.total - sum(self.tables.get(t, 0) for t in REPORT_TABLES)
+        lines.append(f"  other {other:>8} B (headers, directory, remaining tables)")
+        return lines
+
+
+def _count_ligatures(font: TTFont) -> int:
+    if "GSUB" not in font:
+        return 0
+    lookups = font["GSUB"].table.LookupList.Lookup
+    total = 0
+    for li in feature_lookup_indices(font):
+        for st in lookups[li].SubTable:
+            st = unwrap_subtable(st)
+            if getattr(st, "LookupType", 4) == 4:
+                total += sum(len(v) for v in st.ligatures.values())
+    return total
+
+
+def font_size_report(source: Union[str, bytes], name: Optional[str] = None) -> FontSizeReport:
+    if isinstance(source, (bytes, bytearray)):
+        data = bytes(source)
+        font = TTFont(io.BytesIO(data), lazy=True)
+        label = name or "<memory>"
+    else:
+        with open(source, "rb") as f:
+            data = f.read()
+        font = TTFont(io.BytesIO(data), lazy=True)
+        label = name or os.path.basename(source)
+
+    tables = {tag: entry.length for tag, entry in font.reader.tables.items()}
+    order = font.getGlyphOrder()
+
+    return FontSizeReport(
+        name=label,
+        total=len(data),
+        tables=tables,
+        glyphs=len(order),
+        hand_glyphs=sum(1 for g in order if HAND_GLYPH_RE.match(g)),
+        ligatures=_count_ligatures(font),
+    )
+
+
+def budget_for(path: str) -> Optional[FontBudget]:
+    return FONT_BUDGETS.get(os.path.basename(path))
+
+
+def add_budget_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--budget-as",
+        choices=sorted(FONT_BUDGETS),
+        default=None,
+        help="Check against this shipped font's budget instead of the output file's own",
+    )
+    parser.add_argument("--no-budget", action="store_true", help="Report sizes without checking a budget")
+
+
+def selected_budget(path: str, budget_as: Optional[str] = None, no_budget: bool = False) -> Optional[FontBudget]:
+    """The budget add_budget_arguments selects for path: none, a named one or path's own."""
+    if no_budget:
+        return None
+    return FONT_BUDGETS[budget_as] if budget_as else budget_for(path)
+
+
+def budget_violations(report: FontSizeReport, budget: Optional[FontBudget]) -> List[str]:
+    if budget is None:
+        return []
+    out: List[str] = []
+    if report.total > budget.total:
+        out.append(f"{report.name}: total {report.total} B exceeds budget {budget.total} B")
+    for tag, limit in budget.tables.items():
+        size = report.tables.get(tag, 0)
+        if size > limit:
+            out.append(f"{report.name}: {tag} {size} B exceeds budget {limit} B")
+    return out
+
+
+def check_font_size(
+    data: bytes,
+    out_path: str,
+    log_fn: Callable[[str], None] = print,
+    *,
+    budget_as: Optional[str] = None,
+    no_budget: bool = False,
+) -> None:
+    """
+    Logs the breakdown and hmtx/loca layout of a built font; raises if it is over budget
+    (out_path's own, or as chosen by budget_as / no_budget).
+    """
+    budget = selected_budget(out_path, budget_as, no_budget)
+    report = font_size_report(data, name=os.path.basename(out_path))
+    for line in report.summary_lines(budget):
+        log_fn(line)
+    if no_budget:
+        log_fn("  size budget not checked (--no-budget)")
+    elif budget_as:
+        log_fn(f"  checked against the {budget_as} budget (--budget-as)")
+    violations = budget_violations(report, budget)
+    if violations:
+        for v in violations:
+            log_fn(f"  {v}")
+        raise RuntimeError("Font size budget exceeded; font not saved")
+    for line in compaction_report(data).summary_lines():
+        log_fn(line)
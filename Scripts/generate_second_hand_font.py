@@ -5,7 +5,8 @@
 generate_second_hand_font.py
 
 Extends WWClockSecondHand-Regular.ttf GSUB ligature mapping so Text(timerInterval:)
-can drive a sweeping second hand for up to 59:59 (no hour field).
+can drive a sweeping second hand for up to 59:59 (no hour field), or, with --multi-hour,
+for h:mm:ss with any number of hours.
 
 This script:
 - loads WidgetWeaverWidget/Clock/WWClockSecondHand-Regular.ttf
@@ -13,27 +14,78 @@ This script:
     * mm:ss mappings for 00:00 ... 59:59
     * m:ss mappings for 0:00  ... 9:59
   Each mapping outputs sec00..sec59 based on the seconds value.
-- preserves existing outlines (sec00..sec59 already include corner markers)
-- saves in place to WidgetWeaverWidget/Clock/WWClockSecondHand-Regular.ttf
+- with --multi-hour, instead replaces it with a contextual lookup that only reads the
+  seconds pair, so any h:mm:ss string drives the hand too (no 59:59 ceiling) with a GSUB of
+  a few hundred bytes (timer_context.py); the result is shaped against the ligature mapping
+  and sampled h:mm:ss strings before saving, and the font is not saved on a mismatch
+- maps alternate digits (Arabic-Indic, Devanagari, ...) to the ASCII digit glyphs in a
+  single-substitution lookup ahead of the ligatures, so timer text in those numbering
+  systems drives the hand too (timer_numerals.py), and reports the cost
+- with --undecorated, first puts back the undecorated sec** outlines recorded by the trail
+  tools (base_glyphs.py), dropping their sweep / arc layers; glyphs that still look trailed
+  without a stored outline (a font copied without its store) stop the build
+- preserves existing outlines (sec00..sec59 already include corner markers), unless
+  --hand-template is given: then sec00..sec59 are rebuilt from an SVG path or existing glyph
+  (see hand_template.py; curves are preserved), keeping each glyph's corner markers, and
+  their stored undecorated outlines are dropped (base_glyphs.py)
+- checks the per-table size breakdown against its budget (font_size_budget.py); the budget
+  fits the shipped hand, so a richer --hand-template takes --no-budget (report only) or
+  --budget-as NAME (another shipped font's ceilings)
+- saves in place to WidgetWeaverWidget/Clock/WWClockSecondHand-Regular.ttf, without the trail
+  tools' base-glyph store, which is kept beside it in WWClockSecondHand-Regular.ttf.wwbg
+  (base_glyphs.py)
 
 Dependencies:
   python3 -m pip install --user fonttools
+  python3 -m pip install --user numpy   (only for --hand-template and --undecorated)
+
+In-process (no disk round trip):
+  from generate_second_hand_font import build_second_hand_font
+  font = build_second_hand_font(font_bytes)   # TTFont; font_io.font_bytes(font) for bytes
 
 Run from repo root:
   python3 -u Scripts/generate_second_hand_font.py
+  python3 -u Scripts/generate_second_hand_font.py --hand-template themes/hand.svg
+  python3 -u Scripts/generate_second_hand_font.py --hand-template themes/hand.svg --no-budget
+  python3 -u Scripts/generate_second_hand_font.py --multi-hour
+  python3 -u Scripts/generate_second_hand_font.py --undecorated
 """
 
 from __future__ import annotations
 
+import argparse
 import os
 import sys
 import threading
 import time
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Union
 
-from fontTools.otlLib import builder as otl
 from fontTools.ttLib import TTFont
 
+from base_glyphs import (
+    STORE_SUFFIX,
+    attach_base_glyphs,
+    forget_base_glyphs,
+    glyph_data,
+    save_base_glyphs,
+    split_base_glyphs,
+    strip_decorations,
+)
+from font_io import FontSource, font_bytes, load_font, write_bytes_atomic
+from font_size_budget import add_budget_arguments, check_font_size
+from timer_context import (
+    context_report,
+    find_seconds_context_lookup_index,
+    install_seconds_context,
+    restore_ligature_lookup,
+)
+from timer_gsub_analysis import analyze_timer_gsub
+from timer_ligatures import build_timer_ligature_subtable, entry_count
+from timer_numerals import add_numeral_normalisation, numeral_report
+
+if TYPE_CHECKING:
+    from hand_template import HandTemplate
+
 
 REPO_REL_TTF = os.path.join(
     "WidgetWeaverWidget",
@@ -41,6 +93,8 @@ REPO_REL_TTF = os.path.join(
     "WWClockSecondHand-Regular.ttf",
 )
 
+SECOND_GLYPHS = [f"sec{s:02d}" for s in range(60)]
+
 
 def log(msg: str) -> None:
     print(msg, flush=True)
@@ -78,13 +132,8 @@ def get_char_to_glyph(font: TTFont) -> Dict[str, str]:
     return out
 
 
-def glyph_seq_for_string(char_to_glyph: Dict[str, str], s: str) -> Tuple[str, ...]:
-    seq: List[str] = []
-    for ch in s:
-        if ch not in char_to_glyph:
-            raise ValueError(f"Unsupported char {ch!r} in {s!r}")
-        seq.append(char_to_glyph[ch])
-    return tuple(seq)
+def second_glyph_for_time(h: int, m: int, s: int) -> str:
+    return f"sec{s:02d}"
 
 
 def find_seconds_ligature_lookup_index(font: TTFont) -> Optional[int]:
@@ -112,60 +161,189 @@ def find_seconds_ligature_lookup_index(font: TTFont) -> Optional[int]:
     return None
 
 
-def main() -> None:
-    repo_root = os.getcwd()
-    font_path = os.path.join(repo_root, REPO_REL_TTF)
-
-    if not os.path.exists(font_path):
-        raise FileNotFoundError(f"Font missing: {font_path}")
-
-    log("Loading second-hand font…")
-    font = TTFont(font_path)
-
-    log("Reading cmap for digit/colon glyph names…")
-    char_to_glyph = get_char_to_glyph(font)
-
-    log("Building ligature mappings for mm:ss and m:ss…")
-
-    mapping_mmss: Dict[Tuple[str, ...], str] = {}
-    mapping_mss: Dict[Tuple[str, ...], str] = {}
-
-    for m in range(0, 60):
-        for s in range(0, 60):
-            out_glyph = f"sec{s:02d}"
-
-            timer_mmss = f"{m:02d}:{s:02d}"
-            mapping_mmss[glyph_seq_for_string(char_to_glyph, timer_mmss)] = out_glyph
-
-            if m < 10:
-                timer_mss = f"{m}:{s:02d}"
-                mapping_mss[glyph_seq_for_string(char_to_glyph, timer_mss)] = out_glyph
-
-    log(f"Mapping entries mm:ss: {len(mapping_mmss)}")
-    log(f"Mapping entries  m:ss: {len(mapping_mss)}")
-    log(f"Mapping total entries: {len(mapping_mmss) + len(mapping_mss)}")
+def replace_second_hand_outlines(
+    font: TTFont,
+    hand_template: Union[str, "HandTemplate"],
+    log_fn: Callable[[str], None] = log,
+) -> None:
+    from hand_template import HandTemplate, keeper_glyph
+
+    template = HandTemplate.from_spec(hand_template) if isinstance(hand_template, str) else hand_template
+    log_fn(
+        f"Hand template: {template.contour_count} contours, "
+        f"{template.point_count} points ({template.off_curve_count} off-curve)"
+    )
+
+    glyf = font["glyf"]
+    fixed = keeper_glyph(glyf["sec00"], glyf)
+    for name, glyph in zip(SECOND_GLYPHS, template.rotated_glyphs([s * 6.0 for s in range(60)], glyf, fixed=fixed)):
+        glyf[name] = glyph
+    # New base outlines: the next trail run decorates these, not the stored ones.
+    forget_base_glyphs(font, SECOND_GLYPHS)
+
+
+def replace_seconds_ligatures(
+    font: TTFont,
+    char_to_glyph: Dict[str, str],
+    log_fn: Callable[[str], None] = log,
+) -> None:
+    # A --multi-hour font goes back to a plain ligature lookup first.
+    restore_ligature_lookup(font, log_fn)
+
+    log_fn("Building ligature subtables for mm:ss and m:ss…")
+    t0 = time.perf_counter()
+    sub_mmss = build_timer_ligature_subtable(char_to_glyph, "mm:ss", second_glyph_for_time)
+    sub_mss = build_timer_ligature_subtable(char_to_glyph, "m:ss", second_glyph_for_time)
+    build_ms = (time.perf_counter() - t0) * 1000.0
+
+    log_fn(f"Mapping entries mm:ss: {entry_count(sub_mmss)}")
+    log_fn(f"Mapping entries  m:ss: {entry_count(sub_mss)}")
+    log_fn(f"Mapping total entries: {entry_count(sub_mmss) + entry_count(sub_mss)} ({build_ms:.1f} ms)")
 
     idx = find_seconds_ligature_lookup_index(font)
     if idx is None:
         raise RuntimeError("Could not locate the seconds-hand ligature lookup in GSUB")
 
-    log(f"Replacing GSUB ligature lookup at index {idx}…")
-    sub_mmss = otl.buildLigatureSubstSubtable(mapping_mmss)
-    sub_mss = otl.buildLigatureSubstSubtable(mapping_mss)
-
+    log_fn(f"Replacing GSUB ligature lookup at index {idx}…")
     gsub = font["GSUB"].table
     lookup = gsub.LookupList.Lookup[idx]
     lookup.LookupType = 4
     lookup.SubTable = [sub_mmss, sub_mss]
     lookup.SubTableCount = 2
 
+
+def build_second_hand_font(
+    source: FontSource,
+    *,
+    hand_template: Optional[Union[str, "HandTemplate"]] = None,
+    multi_hour: bool = False,
+    undecorated: bool = False,
+    log_fn: Callable[[str], None] = log,
+) -> TTFont:
+    """
+    Rebuilds the seconds ligature lookup (and, with hand_template, the sec** outlines) of the
+    second-hand font (a TTFont, modified in place, or its bytes) and returns it, without
+    touching the disk. Raises if the GSUB timer mapping analysis fails. With multi_hour, the
+    lookup is the contextual seconds lookup instead (timer_context.py); context_report()
+    compares it with a ligature build. With undecorated, trailed glyphs first go back to
+    their stored undecorated outlines.
+    """
+    font = load_font(source)
+
+    if undecorated:
+        restored = strip_decorations(font)
+        log_fn(f"Restored {len(restored)} undecorated outlines from the base-glyph store")
+        if hand_template is None:
+            from glyph_family import decoration_contours
+
+            glyf = font["glyf"]
+            trailed = [name for name in SECOND_GLYPHS if decoration_contours(glyph_data(glyf, name))]
+            if trailed:
+                raise RuntimeError(
+                    f"{len(trailed)} sec** glyphs ({trailed[0]}..) still carry trail contours and have no "
+                    f"stored undecorated outline; rebuild them with --hand-template, or keep the "
+                    f"base-glyph store (FONT.ttf{STORE_SUFFIX}) beside the font"
+                )
+
+    if hand_template is not None:
+        log_fn("Rebuilding sec00..sec59 outlines from the hand template…")
+        replace_second_hand_outlines(font, hand_template, log_fn)
+
+    log_fn("Reading cmap for digit/colon glyph names…")
+    char_to_glyph = get_char_to_glyph(font)
+
+    if multi_hour:
+        idx = find_seconds_context_lookup_index(font)
+        if idx is None:
+            idx = find_seconds_ligature_lookup_index(font)
+        if idx is None:
+            raise RuntimeError("Could not locate the seconds-hand ligature lookup in GSUB")
+
+        log_fn(f"Replacing GSUB lookup at index {idx} with the contextual seconds lookup…")
+        install_seconds_context(font, idx, char_to_glyph, second_glyph_for_time, log_fn)
+    else:
+        replace_seconds_ligatures(font, char_to_glyph, log_fn)
+
+    add_numeral_normalisation(font, log_fn=log_fn)
+
+    log_fn("Analyzing GSUB timer mapping (shadowing, buckets, coverage)…")
+    for analysis in analyze_timer_gsub(font):
+        for line in analysis.summary_lines():
+            log_fn(line)
+        if not analysis.ok:
+            raise RuntimeError("GSUB timer mapping analysis failed; font not saved")
+
+    return font
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--hand-template",
+        default=None,
+        help="Rebuild sec00..sec59 from a hand outline pointing at 12 o'clock: hand.svg or FONT.ttf:glyph",
+    )
+    parser.add_argument(
+        "--multi-hour",
+        action="store_true",
+        help="Match only the seconds pair in context, so h:mm:ss windows of any length drive the hand",
+    )
+    parser.add_argument(
+        "--undecorated",
+        action="store_true",
+        help="Put back the outlines the trail tools recorded before decorating, dropping the trails",
+    )
+    add_budget_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+
+    repo_root = os.getcwd()
+    font_path = os.path.join(repo_root, REPO_REL_TTF)
+
+    if not os.path.exists(font_path):
+        raise FileNotFoundError(f"Font missing: {font_path}")
+
+    log("Loading second-hand font…")
+    with open(font_path, "rb") as f:
+        source = f.read()
+    font = load_font(source)
+    attach_base_glyphs(font, font_path, source)
+
+    font = build_second_hand_font(
+        font, hand_template=args.hand_template, multi_hour=args.multi_hour, undecorated=args.undecorated
+    )
+
     log("Saving font (heartbeat will print if slow)…")
     stop = start_heartbeat("Saving font", interval_seconds=5.0)
     try:
-        font.save(font_path)
+        data, store = split_base_glyphs(font)
     finally:
         stop.set()
 
+    log("Checking font size budget…")
+    check_font_size(data, font_path, log, budget_as=args.budget_as, no_budget=args.no_budget)
+
+    log("Checking alternate-digit timer coverage…")
+    numerals = numeral_report(data, window_seconds=3600)
+    for line in numerals.summary_lines():
+        log(line)
+    if not numerals.ok:
+        raise RuntimeError("Alternate-digit timer strings do not shape like ASCII; font not saved")
+
+    if args.multi_hour:
+        log("Checking contextual lookup against the ligature mapping…")
+        reference = font_bytes(build_second_hand_font(source, log_fn=lambda _msg: None))
+        parity = context_report(reference, data, second_glyph_for_time)
+        for line in parity.summary_lines():
+            log(line)
+        if not parity.ok:
+            raise RuntimeError("Contextual seconds lookup does not shape like the ligature mapping; font not saved")
+
+    write_bytes_atomic(font_path, data)
+    save_base_glyphs(font_path, store, data)
     log(f"Wrote: {font_path}")
 
 
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+glyph_family.py
+
+Glyph-family selection and batched, parallel per-glyph processing for the trail tools.
+
+A family is a set of rotated hand glyphs one bucket apart: sec00..sec59 (6° per bucket),
+mh0000..mh3599 (0.1° per bucket at TICK_SECONDS = 1). It is selected by a name prefix
+followed by the bucket number, or by a regex whose first group is the bucket number. Each
+bucket maps to a hand angle in degrees clockwise from 12 o'clock:
+
+  angle = start_deg + bucket * degrees_per_bucket
+
+degrees_per_bucket defaults to 360 / number of glyphs selected.
+
+process_glyphs() hands compiled glyph data to a worker function in batches, over a
+fork-based process pool when jobs > 1. The data is the glyph's undecorated outline from
+the font's base-glyph store (base_glyphs.py), and the worker returns only the contours its
+decoration adds. Those are optionally simplified (glyph_simplify.py), recorded in the store
+as that decoration's layer, and composed with the base and the other decorations' layers
+(compose_glyph) in the same worker; the result is installed in the font. So repeated runs
+replace their own layer, and the sweep and arc trails compose in either order. Workers get
+plain (name, angle, glyph bytes) tuples, so nothing font-sized is pickled, and return
+expanded Glyph objects, built directly from numpy point arrays (glyph_arrays / make_glyph)
+instead of replaying pens point by point. The output does not depend on jobs or
+batch_size.
+
+Dependencies:
+  python3 -m pip install --user fonttools numpy
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import multiprocessing
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from fontTools.ttLib import TTFont
+from fontTools.ttLib.tables import ttProgram
+from fontTools.ttLib.tables._g_l_y_f import Glyph, GlyphCoordinates, flagOnCurve
+
+from base_glyphs import OVER, STORE_SUFFIX, UNDER, glyph_data, glyph_store, read_glyph_store, write_glyph_store
+from glyph_simplify import SimplifyStats, simplify_glyph
+
+
+# Keeper squares: bottom-left (roughly 0..32) and top-right (roughly 968..1000).
+KEEPER_LOW_MAX = 40.0
+KEEPER_HIGH_MIN = 960.0
+
+DEFAULT_BATCH_SIZE = 256
+
+# (glyph name, hand angle in degrees clockwise from 12 o'clock, compiled glyph data)
+GlyphTask = Tuple[str, float, bytes]
+
+# worker(tasks, options) -> [(glyph name, glyph of the contours the decoration adds)]
+GlyphWorker = Callable[[List[GlyphTask], Dict[str, Any]], List[Tuple[str, Glyph]]]
+
+
+@dataclass(frozen=True)
+class GlyphFamily:
+    regex: str
+    degrees_per_bucket: Optional[float] = None
+    start_deg: float = 0.0
+
+    @classmethod
+    def from_prefix(cls, prefix: str, **kwargs: Any) -> "GlyphFamily":
+        return cls(rf"^{re.escape(prefix)}(\d+)$", **kwargs)
+
+    def select(self, font: TTFont) -> List[Tuple[str, int]]:
+        """(glyph name, bucket) for every matching glyph, in bucket order."""
+        pattern = re.compile(self.regex)
+        members = []
+        for name in font.getGlyphOrder():
+            m = pattern.match(name)
+            if m:
+                members.append((name, int(m.group(1))))
+        members.sort(key=lambda item: item[1])
+        return members
+
+    def angles(self, buckets: Sequence[int]) -> List[float]:
+        step = self.degrees_per_bucket
+        if step is None:
+            step = 360.0 / len(buckets) if buckets else 0.0
+        return [self.start_deg + b * step for b in buckets]
+
+
+def default_angles(glyph_names: Sequence[str]) -> List[float]:
+    """Angles for names ending in their bucket number (sec07, mh1234), one revolution in total."""
+    buckets = [int(re.search(r"(\d+)$", name).group(1)) for name in glyph_names]
+    return GlyphFamily(r"").angles(buckets)
+
+
+def add_family_arguments(parser: argparse.ArgumentParser, default_prefix: str = "sec") -> None:
+    group = parser.add_argument_group("glyph family")
+    group.add_argument(
+        "--glyph-prefix",
+        default=default_prefix,
+        help=f"Glyphs named PREFIX + bucket number (default: {default_prefix}; mh for the minute fonts)",
+    )
+    group.add_argument("--glyph-regex", default=None, help="Regex whose first group is the bucket number")
+    group.add_argument(
+        "--degrees-per-bucket",
+        type=float,
+        default=None,
+        help="Hand angle step per bucket, clockwise (default: 360 / glyphs selected)",
+    )
+    group.add_argument("--start-deg", type=float, default=0.0, help="Hand angle of bucket 0")
+    group.add_argument("--jobs", type=int, default=multiprocessing.cpu_count(), help="Worker processes")
+    group.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Glyphs per worker task")
+
+
+def family_from_args(args: argparse.Namespace) -> GlyphFamily:
+    kwargs = {"degrees_per_bucket": args.degrees_per_bucket, "start_deg": args.start_deg}
+    if args.glyph_regex:
+        return GlyphFamily(args.glyph_regex, **kwargs)
+    return GlyphFamily.from_prefix(args.glyph_prefix, **kwargs)
+
+
+# -- glyph arrays -----------------------------------------------------------------------
+
+
+def glyph_arrays(data: bytes) -> Tuple[np.ndarray, bytes, List[int]]:
+    """(points float64 (n, 2), flags, endPtsOfContours) of compiled simple glyph data."""
+    g = Glyph(data)
+    g.expand(None)
+    if g.isComposite():
+        raise ValueError("Composite glyphs are not supported")
+    if g.numberOfContours <= 0:
+        return np.zeros((0, 2), dtype=np.float64), b"", []
+    points = np.asarray(list(g.coordinates), dtype=np.float64).reshape(-1, 2)
+    return points, bytes(b & flagOnCurve for b in g.flags), list(g.endPtsOfContours)
+
+
+def contour_ranges(end_pts: Sequence[int]) -> List[Tuple[int, int]]:
+    ranges = []
+    start = 0
+    for end in end_pts:
+        ranges.append((start, end + 1))
+        start = end + 1
+    return ranges
+
+
+def is_keeper_contour(points: np.ndarray) -> bool:
+    lo = points.min(axis=0)
+    hi = points.max(axis=0)
+    return bool((hi <= KEEPER_LOW_MAX).all() or (lo >= KEEPER_HIGH_MIN).all())
+
+
+def make_glyph(contours: Sequence[Tuple[np.ndarray, bytes]]) -> Glyph:
+    """Simple glyph from (points, flags) contours; points are rounded to the integer grid."""
+    coords: List[Tuple[int, int]] = []
+    flags = bytearray()
+    end_pts: List[int] = []
+    for points, contour_flags in contours:
+        coords.extend(map(tuple, np.rint(points).astype(np.int64).tolist()))
+        flags.extend(contour_flags)
+        end_pts.append(len(coords) - 1)
+
+    g = Glyph()
+    g.numberOfContours = len(end_pts)
+    g.coordinates = GlyphCoordinates(coords)
+    g.flags = flags
+    g.endPtsOfContours = end_pts
+    g.program = ttProgram.Program()
+    g.program.fromBytecode(b"")
+    g.recalcBounds(None)
+    return g
+
+
+def compose_glyph(base: bytes, layers: Sequence[Tuple[str, bytes]]) -> Glyph:
+    """
+    Base outline plus decoration layers ((placement, compiled layer glyph), in order): UNDER
+    layers go between the keeper squares and the first hand contour, OVER layers on top.
+    """
+    points, flags, end_pts = glyph_arrays(base)
+    ranges = contour_ranges(end_pts)
+    split = next((i for i, (a, b) in enumerate(ranges) if not is_keeper_contour(points[a:b])), len(ranges))
+    contours = [(points[a:b], flags[a:b]) for a, b in ranges]
+
+    added: Dict[str, List[Tuple[np.ndarray, bytes]]] = {UNDER: [], OVER: []}
+    for placement, data in layers:
+        layer_points, layer_flags, layer_ends = glyph_arrays(data)
+        added[placement].extend((layer_points[a:b], layer_flags[a:b]) for a, b in contour_ranges(layer_ends))
+    return make_glyph(contours[:split] + added[UNDER] + contours[split:] + added[OVER])
+
+
+def remove_decoration(font: TTFont, glyph_names: Sequence[str], decoration: str) -> int:
+    """
+    Drops decoration's layer from the named glyphs and rebuilds each from its base and the
+    remaining layers. Returns the number of glyphs that had the layer.
+    """
+    store = read_glyph_store(font)
+    glyf = font["glyf"]
+    removed = 0
+    for name in glyph_names:
+        entry = store.get(name)
+        if entry is None or decoration not in entry.layers:
+            continue
+        del entry.layers[decoration]
+        glyf[name] = compose_glyph(entry.base, [entry.layers[d] for d in sorted(entry.layers)])
+        removed += 1
+    if removed:
+        write_glyph_store(font, store)
+    return removed
+
+
+def decoration_contours(data: bytes, cx: float = 500.0, cy: float = 500.0) -> Dict[str, int]:
+    """
+    Contours of compiled hand glyph data that look like trail decorations, counted by
+    decoration, from the outline alone (for glyphs without a stored base): "sweep" for
+    copies of another contour turned by up to 45° about the centre, at the same or a smaller
+    scale, "arc" for thin sectors of a ring around the centre. Empty for an undecorated hand.
+    """
+    points, _flags, end_pts = glyph_arrays(data)
+    contours = [points[a:b] for a, b in contour_ranges(end_pts) if not is_keeper_contour(points[a:b])]
+    z = [(c[:, 0] - cx) + 1j * (c[:, 1] - cy) for c in contours]
+    found = {"sweep": 0, "arc": 0}
+
+    for i, zb in enumerate(z):
+        for j, za in enumerate(z):
+            if i == j or len(za) != len(zb):
+                continue
+            # zb ~ ratio * za: the copy's rotation and scale about the centre.
+            ratio = complex(np.vdot(za, zb) / max(float(np.vdot(za, za).real), 1e-9))
+            scale = abs(ratio)
+            turn = abs(np.degrees(np.angle(ratio)))
+            if not (0.5 <= scale <= 1.001 and 0.2 < turn <= 45.0):
+                continue
+            if float(np.abs(zb - ratio * za).max()) <= 2.5:
+                found["sweep"] += 1
+                break
+        else:
+            r = np.abs(zb)
+            if len(zb) < 4 or r.max() <= 0 or r.min() < 0.5 * r.max():
+                continue
+            # Angular extent around the contour's mean direction, as arc length at the rim.
+            mean = np.angle(zb.sum())
+            spread = np.angle(zb * np.exp(-1j * mean))
+            extent = float(spread.max() - spread.min())
+            # Rings round the pivot (hub caps) span the full circle; trail arcs a short stretch.
+            if extent <= np.radians(120.0) and r.max() * extent >= 2.5 * float(r.max() - r.min()):
+                found["arc"] += 1
+    return {name: count for name, count in found.items() if count}
+
+
+# -- batch runner -----------------------------------------------------------------------
+
+# (task, layers of the other decorations, by decoration name)
+_Batch = List[Tuple[GlyphTask, Dict[str, Tuple[str, bytes]]]]
+
+
+def _run_batch(
+    worker: GlyphWorker,
+    options: Dict[str, Any],
+    decoration: str,
+    placement: str,
+    simplify_tolerance: Optional[float],
+    batch: _Batch,
+) -> List[Tuple[str, Glyph, bytes, Tuple[int, int, int]]]:
+    others = {name: layers for (name, _angle, _data), layers in batch}
+    bases = {name: data for (name, _angle, data), _layers in batch}
+    out = []
+    for name, layer in worker([task for task, _layers in batch], options):
+        stats = (0, 0, 0)
+        if simplify_tolerance is not None:
+            stats = simplify_glyph(layer, None, simplify_tolerance)
+        layer_data = layer.compile(None)
+        layers = dict(others[name])
+        layers[decoration] = (placement, layer_data)
+        glyph = compose_glyph(bases[name], [layers[d] for d in sorted(layers)])
+        out.append((name, glyph, layer_data, stats))
+    return out
+
+
+def process_glyphs(
+    font: TTFont,
+    glyph_names: Sequence[str],
+    angles: Sequence[float],
+    worker: GlyphWorker,
+    options: Dict[str, Any],
+    *,
+    decoration: str,
+    placement: str = OVER,
+    simplify_tolerance: Optional[float] = None,
+    jobs: int = 1,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> SimplifyStats:
+    """
+    Replaces each named glyph's decoration layer (placement UNDER or OVER the hand) with
+    worker's output for its stored base outline, and the glyph with the base plus all its
+    recorded layers; batch_size glyphs per task, over jobs forked processes. Returns the
+    simplification totals of the new layers (all zero without a tolerance).
+    """
+    if placement not in (UNDER, OVER):
+        raise ValueError(f"Unknown layer placement {placement!r}")
+    glyf = font["glyf"]
+    stored = read_glyph_store(font)
+    for name in glyph_names:
+        if name in stored:
+            continue
+        found = decoration_contours(glyph_data(glyf, name))
+        if found:
+            counts = ", ".join(f"{count} {d}" for d, count in sorted(found.items()))
+            raise RuntimeError(
+                f"{name} already carries trail contours ({counts}) and the font has no stored "
+                f"undecorated outline for it; regenerate the font, or keep the base-glyph store "
+                f"(FONT.ttf{STORE_SUFFIX}) beside it"
+            )
+    store = glyph_store(font, glyph_names)
+    tasks: _Batch = []
+    for name, a in zip(glyph_names, angles):
+        entry = store[name]
+        others = {d: layer for d, layer in entry.layers.items() if d != decoration}
+        tasks.append(((name, float(a), entry.base), others))
+    batches = [tasks[i : i + max(1, batch_size)] for i in range(0, len(tasks), max(1, batch_size))]
+    run = functools.partial(_run_batch, worker, options, decoration, placement, simplify_tolerance)
+
+    if jobs > 1 and len(batches) > 1 and "fork" in multiprocessing.get_all_start_methods():
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context("fork")) as pool:
+            results = list(pool.map(run, batches))
+    else:
+        results = [run(batch) for batch in batches]
+
+    stats = SimplifyStats()
+    for batch in results:
+        for name, glyph, layer_data, (before, after, dropped) in batch:
+            glyf[name] = glyph
+            store[name].layers[decoration] = (placement, layer_data)
+            if before:
+                stats.glyphs += 1
+                stats.points_before += before
+                stats.points_after += after
+                stats.contours_dropped += dropped
+    write_glyph_store(font, store)
+    return stats
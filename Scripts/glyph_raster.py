@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+glyph_raster.py
+
+FreeType helpers for rasterizing the clock hand glyphs offline.
+
+Glyphs are loaded unhinted (CoreText does not apply TrueType hinting) and rendered
+with anti-aliasing at a pixel size where one em spans the dial, matching how the
+widget draws the timer fonts at size == dialDiameter.
+
+Dependencies:
+  python3 -m pip install --user freetype-py
+"""
+
+from __future__ import annotations
+
+import ctypes
+import io
+import math
+import re
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import Dict, List, Pattern, Tuple, Union
+
+import freetype
+
+
+LOAD_FLAGS = freetype.FT_LOAD_NO_HINTING | freetype.FT_LOAD_NO_BITMAP
+
+# Glyph families generated for the clock fonts.
+FAMILY_PATTERNS: Dict[str, Pattern[str]] = {
+    "sec": re.compile(r"^sec\d{2}$"),
+    "mh": re.compile(r"^mh\d{4}$"),
+}
+
+
+@dataclass
+class RenderedGlyph:
+    width: int
+    rows: int
+    left: int
+    top: int
+    pitch: int
+    buffer: bytes
+    contours: int
+    points: int
+
+
+def open_face(source: Union[str, bytes]) -> freetype.Face:
+    if isinstance(source, (bytes, bytearray)):
+        return freetype.Face(io.BytesIO(bytes(source)))
+    return freetype.Face(source)
+
+
+def glyph_names(face: freetype.Face) -> List[str]:
+    return [face.get_glyph_name(i).decode("ascii") for i in range(face.num_glyphs)]
+
+
+def family_glyphs(face: freetype.Face, families=("sec", "mh")) -> Dict[str, List[Tuple[str, int]]]:
+    """Returns {family: [(glyph_name, glyph_index), ...]} in glyph order."""
+    out: Dict[str, List[Tuple[str, int]]] = {fam: [] for fam in families}
+    for idx, name in enumerate(glyph_names(face)):
+        for fam in families:
+            if FAMILY_PATTERNS[fam].match(name):
+                out[fam].append((name, idx))
+                break
+    return out
+
+
+def _set_rotation(face: freetype.Face, pixel_size: int, angle_deg: float) -> None:
+    # Rotate about the dial centre (UPM/2, UPM/2), counter-clockwise for positive angles
+    # like the trail tools. FreeType applies the transform to the scaled outline, so the
+    # centre and delta are in pixels (26.6 fixed point).
+    rad = math.radians(angle_deg)
+    c = math.cos(rad)
+    s = math.sin(rad)
+    centre = pixel_size / 2.0
+
+    matrix = freetype.Matrix(
+        int(round(c * 0x10000)),
+        int(round(-s * 0x10000)),
+        int(round(s * 0x10000)),
+        int(round(c * 0x10000)),
+    )
+    dx = centre - (c * centre - s * centre)
+    dy = centre - (s * centre + c * centre)
+    delta = freetype.Vector(int(round(dx * 64)), int(round(dy * 64)))
+    face.set_transform(matrix, delta)
+
+
+def _reset_transform(face: freetype.Face) -> None:
+    face.set_transform(freetype.Matrix(0x10000, 0, 0, 0x10000), freetype.Vector(0, 0))
+
+
+def render_glyph(
+    face: freetype.Face,
+    glyph_index: int,
+    pixel_size: int,
+    angle_deg: float = 0.0,
+) -> RenderedGlyph:
+    face.set_pixel_sizes(pixel_size, pixel_size)
+    if angle_deg:
+        _set_rotation(face, pixel_size, angle_deg)
+    try:
+        face.load_glyph(glyph_index, LOAD_FLAGS)
+    finally:
+        if angle_deg:
+            _reset_transform(face)
+
+    slot = face.glyph
+    outline = slot.outline
+    contours = outline.n_contours
+    points = outline.n_points
+
+    slot.render(freetype.FT_RENDER_MODE_NORMAL)
+
+    # Copy straight from the FT_Bitmap; freetype-py's Bitmap.buffer builds a Python list
+    # per pixel, which costs far more than the rasterization itself.
+    bm = slot.bitmap._FT_Bitmap
+    size = bm.rows * abs(bm.pitch)
+    buffer = ctypes.string_at(bm.buffer, size) if size else b""
+
+    return RenderedGlyph(
+        width=bm.width,
+        rows=bm.rows,
+        left=slot.bitmap_left,
+        top=slot.bitmap_top,
+        pitch=abs(bm.pitch),
+        buffer=buffer,
+        contours=contours,
+        points=points,
+    )
+
+
+def render_to_canvas(
+    face: freetype.Face,
+    glyph_index: int,
+    pixel_size: int,
+    angle_deg: float = 0.0,
+) -> bytearray:
+    """
+    Renders a glyph into a pixel_size x pixel_size 8-bit coverage canvas (row-major,
+    top row first) covering font units 0..UPM on both axes, i.e. the dial box.
+    """
+    g = render_glyph(face, glyph_index, pixel_size, angle_deg)
+    canvas = bytearray(pixel_size * pixel_size)
+
+    # Font y = 0 is the canvas bottom edge; bitmap_top is measured up from the baseline.
+    y0 = pixel_size - g.top
+    for row in range(g.rows):
+        cy = y0 + row
+        if cy < 0 or cy >= pixel_size:
+            continue
+        src = row * g.pitch
+        x_start = max(0, g.left)
+        x_end = min(pixel_size, g.left + g.width)
+        if x_end <= x_start:
+            continue
+        dst = cy * pixel_size
+        s0 = src + (x_start - g.left)
+        canvas[dst + x_start : dst + x_end] = g.buffer[s0 : s0 + (x_end - x_start)]
+
+    return canvas
+
+
+def encode_png_rgba(width: int, height: int, rgba: bytes) -> bytes:
+    """Minimal 8-bit RGBA PNG encoder (no filtering), enough for sbix strikes and previews."""
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    stride = width * 4
+    raw = b"".join(b"\x00" + rgba[y * stride : (y + 1) * stride] for y in range(height))
+    header = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(raw, 9))
+        + chunk(b"IEND", b"")
+    )
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+glyph_simplify.py
+
+Outline simplification shared by the clock glyph generators and trail tools.
+
+Rounding rotated/scaled outlines to integer font units leaves duplicate and collinear
+points behind (make_hand_glyph rotations, _transform_points trail copies, the short
+segments near an arc tail). This module removes them:
+
+- consecutive duplicate on-curve points
+- tolerance-bounded Douglas-Peucker on runs of on-curve (line) points
+- exactly collinear on-curve points
+
+Off-curve points and the on-curve points next to them are never touched, so curves
+are preserved. Retained points are a subset of the originals, so coordinates stay on
+the integer grid and the keeper squares keep the 0..1000 bounds.
+
+Dependencies:
+  python3 -m pip install --user fonttools
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from fontTools.ttLib import TTFont
+from fontTools.ttLib.tables._g_l_y_f import (
+    GlyphCoordinates,
+    flagOnCurve,
+    flagOverlapSimple,
+)
+
+
+# Font units (1000 UPM). At widget dial sizes one unit is well under a device pixel.
+DEFAULT_TOLERANCE = 0.5
+
+Point = Tuple[float, float]
+
+
+@dataclass
+class SimplifyStats:
+    glyphs: int = 0
+    points_before: int = 0
+    points_after: int = 0
+    contours_dropped: int = 0
+
+    @property
+    def points_removed(self) -> int:
+        return self.points_before - self.points_after
+
+    def summary(self) -> str:
+        pct = (100.0 * self.points_removed / self.points_before) if self.points_before else 0.0
+        return (
+            f"Simplified {self.glyphs} glyphs: {self.points_before} → {self.points_after} points "
+            f"({self.points_removed} removed, {pct:.1f}%, {self.contours_dropped} degenerate contours dropped)"
+        )
+
+
+def _cross(o: Point, a: Point, b: Point) -> float:
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def _segment_distance_sq(p: Point, a: Point, b: Point) -> float:
+    dx = b[0] - a[0]
+    dy = b[1] - a[1]
+    len_sq = dx * dx + dy * dy
+    if len_sq == 0.0:
+        ex = p[0] - a[0]
+        ey = p[1] - a[1]
+        return ex * ex + ey * ey
+
+    t = ((p[0] - a[0]) * dx + (p[1] - a[1]) * dy) / len_sq
+    t = max(0.0, min(1.0, t))
+    ex = p[0] - (a[0] + t * dx)
+    ey = p[1] - (a[1] + t * dy)
+    return ex * ex + ey * ey
+
+
+def _douglas_peucker(points: Sequence[Point], tolerance: float) -> List[int]:
+    """
+    Returns the indices (into points) kept by Douglas-Peucker on an open polyline.
+    Both endpoints are always kept. Iterative to avoid recursion limits on long runs.
+    """
+    n = len(points)
+    if n <= 2:
+        return list(range(n))
+
+    tol_sq = tolerance * tolerance
+    keep = [False] * n
+    keep[0] = True
+    keep[n - 1] = True
+
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+
+        a = points[first]
+        b = points[last]
+        max_d = -1.0
+        max_i = -1
+        for i in range(first + 1, last):
+            d = _segment_distance_sq(points[i], a, b)
+            if d > max_d:
+                max_d = d
+                max_i = i
+
+        if max_d > tol_sq:
+            keep[max_i] = True
+            stack.append((first, max_i))
+            stack.append((max_i, last))
+
+    return [i for i in range(n) if keep[i]]
+
+
+def _polygon_area2(points: Sequence[Point]) -> float:
+    area = 0.0
+    n = len(points)
+    for i in range(n):
+        x0, y0 = points[i]
+        x1, y1 = points[(i + 1) % n]
+        area += x0 * y1 - x1 * y0
+    return area
+
+
+def _dedupe_cyclic(points: List[Point], on: List[bool]) -> Tuple[List[Point], List[bool]]:
+    out_p: List[Point] = []
+    out_on: List[bool] = []
+    for p, o in zip(points, on):
+        if out_p and o and out_on[-1] and out_p[-1] == p:
+            continue
+        out_p.append(p)
+        out_on.append(o)
+
+    while len(out_p) > 1 and out_on[0] and out_on[-1] and out_p[0] == out_p[-1]:
+        out_p.pop()
+        out_on.pop()
+
+    return out_p, out_on
+
+
+def _drop_collinear_cyclic(points: List[Point], on: List[bool]) -> Tuple[List[Point], List[bool]]:
+    changed = True
+    while changed and len(points) > 3:
+        changed = False
+        n = len(points)
+        for i in range(n):
+            prev_i = (i - 1) % n
+            next_i = (i + 1) % n
+            if not (on[i] and on[prev_i] and on[next_i]):
+                continue
+            if _cross(points[prev_i], points[i], points[next_i]) == 0.0:
+                del points[i]
+                del on[i]
+                changed = True
+                break
+
+    return points, on
+
+
+def simplify_contour(
+    points: Sequence[Point],
+    on_curve: Sequence[bool],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> Optional[Tuple[List[Point], List[bool]]]:
+    """
+    Simplifies one closed contour. Returns None when the contour is degenerate (zero area
+    after exact clean-up) and can be dropped without changing the rendering.
+    """
+    pts, on = _dedupe_cyclic(list(points), list(on_curve))
+
+    if all(on):
+        if len(pts) < 3 or _polygon_area2(pts) == 0.0:
+            return None
+
+        # Closed polygon: anchor on point 0 and the point farthest from it, then
+        # run Douglas-Peucker over both halves.
+        far = max(range(len(pts)), key=lambda i: _segment_distance_sq(pts[i], pts[0], pts[0]))
+        first_half = pts[: far + 1]
+        second_half = pts[far:] + [pts[0]]
+
+        kept_a = _douglas_peucker(first_half, tolerance)
+        kept_b = _douglas_peucker(second_half, tolerance)
+
+        simplified = [first_half[i] for i in kept_a] + [second_half[i] for i in kept_b[1:-1]]
+        if len(simplified) < 3 or _polygon_area2(simplified) == 0.0:
+            simplified = pts
+
+        simplified, simplified_on = _drop_collinear_cyclic(simplified, [True] * len(simplified))
+        return simplified, simplified_on
+
+    # Mixed contour: only simplify runs of on-curve points; run endpoints neighbour
+    # off-curve points and are kept so curve segments are untouched.
+    n = len(pts)
+    start = next(i for i in range(n) if not on[i])
+    rotated = pts[start:] + pts[:start]
+    rotated_on = on[start:] + on[:start]
+
+    out_p: List[Point] = []
+    out_on: List[bool] = []
+    i = 0
+    while i < n:
+        if not rotated_on[i]:
+            out_p.append(rotated[i])
+            out_on.append(False)
+            i += 1
+            continue
+
+        j = i
+        while j < n and rotated_on[j]:
+            j += 1
+
+        run = rotated[i:j]
+        for k in _douglas_peucker(run, tolerance):
+            out_p.append(run[k])
+            out_on.append(True)
+        i = j
+
+    return out_p, out_on
+
+
+def simplify_glyph(glyph, glyf_table, tolerance: float = DEFAULT_TOLERANCE) -> Tuple[int, int, int]:
+    """
+    Simplifies a simple TrueType glyph in place.
+    Returns (points_before, points_after, contours_dropped). Composite/empty glyphs are skipped.
+    """
+    if glyph.isComposite() or getattr(glyph, "numberOfContours", 0) <= 0:
+        return 0, 0, 0
+
+    coords, end_pts, flags = glyph.getCoordinates(glyf_table)
+    before = len(coords)
+    overlap = bool(flags[0] & flagOverlapSimple) if before else False
+
+    new_coords: List[Point] = []
+    new_flags: List[int] = []
+    new_end_pts: List[int] = []
+    dropped = 0
+
+    start = 0
+    for end in end_pts:
+        contour = [tuple(coords[i]) for i in range(start, end + 1)]
+        contour_on = [bool(flags[i] & flagOnCurve) for i in range(start, end + 1)]
+        start = end + 1
+
+        result = simplify_contour(contour, contour_on, tolerance)
+        if result is None:
+            dropped += 1
+            continue
+
+        pts, on = result
+        new_coords.extend(pts)
+        new_flags.extend(flagOnCurve if o else 0 for o in on)
+        new_end_pts.append(len(new_coords) - 1)
+
+    if not new_end_pts:
+        # Never empty a glyph; leave it as generated.
+        return before, before, 0
+
+    if overlap:
+        new_flags[0] |= flagOverlapSimple
+
+    glyph.coordinates = GlyphCoordinates(new_coords)
+    glyph.flags = bytearray(new_flags)
+    glyph.endPtsOfContours = new_end_pts
+    glyph.numberOfContours = len(new_end_pts)
+    glyph.recalcBounds(glyf_table)
+
+    return before, len(new_coords), dropped
+
+
+def simplify_font_glyphs(
+    font: TTFont,
+    glyph_names: Iterable[str],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> SimplifyStats:
+    glyf = font["glyf"]
+    stats = SimplifyStats()
+
+    for name in glyph_names:
+        before, after, dropped = simplify_glyph(glyf[name], glyf, tolerance)
+        if before == 0:
+            continue
+        stats.glyphs += 1
+        stats.points_before += before
+        stats.points_after += after
+        stats.contours_dropped += dropped
+
+    return stats
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+hand_outline_pack.py
+
+Compact, memory-mappable pack of the clock hand outlines (mh****, sec**), for renderers
+that draw the hands directly instead of shaping a timer string through GSUB.
+
+Every section is a fixed-width little-endian array at a 4-byte aligned offset, so a reader
+maps the file and indexes it in place: no parsing, no per-glyph allocation. Outlines are
+the glyf points as stored in the font (font units, y up, dial centre at UPM/2), so a
+glyph is drawn exactly as CoreText would draw it at size == dial diameter.
+
+Layout:
+  header (32 bytes)
+    char[4]  magic "WWHP"
+    uint16   version (1)
+    uint16   unitsPerEm
+    uint16   family count
+    uint16   flags (bit 0: every point is on-curve; bit 1: keeper squares stripped)
+    uint32   glyph count
+    uint32   contour count
+    uint32   point count
+    uint32   file size
+    uint32   reserved (0)
+  families   family count x (char[8] prefix, NUL-padded; uint32 first glyph; uint32 glyph count)
+  glyphs     uint32[glyph count + 1]    first contour of each glyph (last entry: contour count)
+  contours   uint32[contour count + 1]  first point of each contour (last entry: point count)
+  points     int16[point count][2]      x, y
+  on-curve   uint8[point count]         1 = on-curve, 0 = quadratic off-curve (padded to 4)
+
+Glyphs of a family are stored in bucket order, so bucket b of family f is glyph
+first_glyph(f) + b. Contour c of glyph g is points[contours[c] : contours[c + 1]] for c in
+glyphs[g] .. glyphs[g + 1] - 1.
+
+Keeper squares only pin the glyph bounds for text layout; pack_fonts() drops them by
+default.
+
+Dependencies:
+  python3 -m pip install --user fonttools numpy
+"""
+
+from __future__ import annotations
+
+import io
+import mmap
+import random
+import struct
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from fontTools.ttLib import TTFont
+
+from glyph_family import GlyphFamily, contour_ranges, glyph_arrays, is_keeper_contour
+
+
+PACK_MAGIC = b"WWHP"
+PACK_VERSION = 1
+
+FLAG_ALL_ON_CURVE = 0x1
+FLAG_KEEPERS_STRIPPED = 0x2
+
+DEFAULT_FAMILIES = ("mh", "sec")
+
+_HEADER = struct.Struct("<4sHHHHIIIII")
+_FAMILY = struct.Struct("<8sII")
+
+# (points int16 (n, 2), on-curve uint8 (n,)) per contour
+Contour = Tuple[np.ndarray, np.ndarray]
+
+
+def _align4(n: int) -> int:
+    return (n + 3) & ~3
+
+
+@dataclass
+class _Layout:
+    families: int
+    glyphs: int
+    contours: int
+    points: int
+
+    @property
+    def family_offset(self) -> int:
+        return _HEADER.size
+
+    @property
+    def glyph_offset(self) -> int:
+        return self.family_offset + self.families * _FAMILY.size
+
+    @property
+    def contour_offset(self) -> int:
+        return self.glyph_offset + 4 * (self.glyphs + 1)
+
+    @property
+    def point_offset(self) -> int:
+        return self.contour_offset + 4 * (self.contours + 1)
+
+    @property
+    def on_curve_offset(self) -> int:
+        return self.point_offset + 4 * self.points
+
+    @property
+    def size(self) -> int:
+        return _align4(self.on_curve_offset + self.points)
+
+
+def _compiled_glyph(glyf, name: str) -> bytes:
+    glyph = glyf.glyphs[name]
+    data = getattr(glyph, "data", None)
+    return data if data is not None else glyph.compile(glyf)
+
+
+def _family_sources(fonts: Sequence[TTFont], families: Sequence[str]) -> List[Tuple[str, TTFont, List[str]]]:
+    """(prefix, font, glyph names in bucket order) per family, from the first font that has it."""
+    out = []
+    for prefix in families:
+        for font in fonts:
+            members = GlyphFamily.from_prefix(prefix).select(font)
+            if members:
+                break
+        else:
+            continue
+        buckets = [bucket for _, bucket in members]
+        if buckets != list(range(len(buckets))):
+            raise ValueError(f"{prefix} buckets are not contiguous from 0 ({len(buckets)} glyphs)")
+        out.append((prefix, font, [name for name, _ in members]))
+    return out
+
+
+def pack_fonts(
+    fonts: Sequence[TTFont],
+    families: Sequence[str] = DEFAULT_FAMILIES,
+    strip_keepers: bool = True,
+) -> bytes:
+    """
+    Pack of every glyph of the given families (name prefix + bucket number), each taken from
+    the first font that has it (mh from a minute font, sec from the second font); families
+    no font has are skipped. Buckets must run 0..n-1, and the fonts must share unitsPerEm.
+    """
+    upms = {font["head"].unitsPerEm for font in fonts}
+    if len(upms) != 1:
+        raise ValueError(f"Fonts differ in unitsPerEm: {sorted(upms)}")
+
+    family_rows: List[Tuple[str, int, int]] = []
+    glyph_starts: List[int] = []
+    contour_starts: List[int] = []
+    point_parts: List[np.ndarray] = []
+    on_parts: List[bytes] = []
+    n_contours = 0
+    n_points = 0
+
+    for prefix, font, names in _family_sources(fonts, families):
+        if len(prefix.encode("ascii")) > 8:
+            raise ValueError(f"Family prefix {prefix!r} is longer than 8 bytes")
+        glyf = font["glyf"]
+        family_rows.append((prefix, len(glyph_starts), len(names)))
+        for name in names:
+            glyph_starts.append(n_contours)
+            points, flags, end_pts = glyph_arrays(_compiled_glyph(glyf, name))
+            for start, end in contour_ranges(end_pts):
+                contour = points[start:end]
+                if strip_keepers and is_keeper_contour(contour):
+                    continue
+                if np.abs(contour).max(initial=0.0) > 32767:
+                    raise ValueError(f"{name}: coordinates exceed int16")
+                contour_starts.append(n_points)
+                point_parts.append(contour.astype("<i2"))
+                on_parts.append(flags[start:end])
+                n_contours += 1
+                n_points += end - start
+
+    glyph_starts.append(n_contours)
+    contour_starts.append(n_points)
+    on_curve = b"".join(on_parts)
+
+    layout = _Layout(len(family_rows), len(glyph_starts) - 1, n_contours, n_points)
+    flags = FLAG_KEEPERS_STRIPPED if strip_keepers else 0
+    if all(on_curve):
+        flags |= FLAG_ALL_ON_CURVE
+
+    out = bytearray(layout.size)
+    _HEADER.pack_into(
+        out,
+        0,
+        PACK_MAGIC,
+        PACK_VERSION,
+        upms.pop(),
+        layout.families,
+        flags,
+        layout.glyphs,
+        layout.contours,
+        layout.points,
+        layout.size,
+        0,
+    )
+    for i, (prefix, first, count) in enumerate(family_rows):
+        _FAMILY.pack_into(out, layout.family_offset + i * _FAMILY.size, prefix.encode("ascii"), first, count)
+
+    def put(offset: int, array: np.ndarray) -> None:
+        raw = array.tobytes()
+        out[offset : offset + len(raw)] = raw
+
+    put(layout.glyph_offset, np.asarray(glyph_starts, dtype="<u4"))
+    put(layout.contour_offset, np.asarray(contour_starts, dtype="<u4"))
+    if point_parts:
+        put(layout.point_offset, np.concatenate(point_parts))
+    out[layout.on_curve_offset : layout.on_curve_offset + n_points] = on_curve
+    return bytes(out)
+
+
+def pack_font_bytes(fonts: Sequence[bytes], **kwargs) -> bytes:
+    return pack_fonts([TTFont(io.BytesIO(data), lazy=True) for data in fonts], **kwargs)
+
+
+@dataclass
+class HandOutlinePack:
+    """Zero-copy view of a pack: every array is a numpy view of the mapped (or given) buffer."""
+
+    units_per_em: int
+    flags: int
+    # prefix -> (first glyph, glyph count)
+    families: Dict[str, Tuple[int, int]]
+    glyph_starts: np.ndarray
+    contour_starts: np.ndarray
+    points: np.ndarray
+    on_curve: np.ndarray
+    _mmap: Optional[mmap.mmap] = field(default=None, repr=False)
+
+    @classmethod
+    def from_buffer(cls, buffer: Union[bytes, bytearray, memoryview, mmap.mmap]) -> "HandOutlinePack":
+        magic, version, upm, n_families, flags, n_glyphs, n_contours, n_points, size, _ = _HEADER.unpack_from(buffer, 0)
+        if magic != PACK_MAGIC:
+            raise ValueError("Not a hand outline pack")
+        if version != PACK_VERSION:
+            raise ValueError(f"Unsupported hand outline pack version {version}")
+        layout = _Layout(n_families, n_glyphs, n_contours, n_points)
+        if size != layout.size or len(buffer) < size:
+            raise ValueError(f"Hand outline pack is truncated ({len(buffer)} of {size} B)")
+
+        families = {}
+        for i in range(n_families):
+            prefix, first, count = _FAMILY.unpack_from(buffer, layout.family_offset + i * _FAMILY.size)
+            families[prefix.rstrip(b"\0").decode("ascii")] = (first, count)
+
+        return cls(
+            units_per_em=upm,
+            flags=flags,
+            families=families,
+            glyph_starts=np.frombuffer(buffer, dtype="<u4", count=n_glyphs + 1, offset=layout.glyph_offset),
+            contour_starts=np.frombuffer(buffer, dtype="<u4", count=n_contours + 1, offset=layout.contour_offset),
+            points=np.frombuffer(buffer, dtype="<i2", count=2 * n_points, offset=layout.point_offset).reshape(-1, 2),
+            on_curve=np.frombuffer(buffer, dtype=np.uint8, count=n_points, offset=layout.on_curve_offset),
+        )
+
+    @classmethod
+    def open(cls, path: str) -> "HandOutlinePack":
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        pack = cls.from_buffer(mapped)
+        pack._mmap = mapped
+        return pack
+
+    @property
+    def glyph_count(self) -> int:
+        return len(self.glyph_starts) - 1
+
+    @property
+    def all_on_curve(self) -> bool:
+        return bool(self.flags & FLAG_ALL_ON_CURVE)
+
+    def glyph_index(self, family: str, bucket: int) -> int:
+        first, count = self.families[family]
+        if not 0 <= bucket < count:
+            raise IndexError(f"{family} bucket {bucket} out of range 0..{count - 1}")
+        return first + bucket
+
+    def contours(self, glyph: int) -> List[Contour]:
+        first, last = int(self.glyph_starts[glyph]), int(self.glyph_starts[glyph + 1])
+        starts = self.contour_starts[first : last + 1].tolist()
+        return [(self.points[a:b], self.on_curve[a:b]) for a, b in zip(starts, starts[1:])]
+
+    def bucket_contours(self, family: str, bucket: int) -> List[Contour]:
+        return self.contours(self.glyph_index(family, bucket))
+
+
+@dataclass
+class PackReport:
+    families: Dict[str, int]
+    glyphs: int
+    contours: int
+    points: int
+    pack_bytes: int
+    glyf_bytes: int
+    # Random access per glyph, each glyph once: pack view vs fontTools decompile of the glyph.
+    pack_us: float
+    font_us: float
+    mismatches: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches
+
+    def summary_lines(self, limit: int = 10) -> List[str]:
+        fams = ", ".join(f"{prefix} {n}" for prefix, n in self.families.items())
+        lines = [
+            f"Outline pack: {self.glyphs} glyphs ({fams}), {self.contours} contours, {self.points} points, "
+            f"{self.pack_bytes} B (glyf + loca of the same glyphs: {self.glyf_bytes} B)",
+            f"  random access: {self.pack_us:.2f} µs/glyph from the pack vs {self.font_us:.1f} µs/glyph "
+            "decompiling glyf",
+        ]
+        for m in self.mismatches[:limit]:
+            lines.append(f"  MISMATCH {m}")
+        lines.append("  read-back OK" if self.ok else f"  read-back FAIL ({len(self.mismatches)} glyphs)")
+        return lines
+
+
+def pack_report(fonts: Sequence[bytes], pack: bytes, samples: int = 2000) -> PackReport:
+    """
+    Checks every packed glyph against its source font's outline (fonts as given to
+    pack_font_bytes()) and times random access from the pack and from the fonts.
+    """
+    view = HandOutlinePack.from_buffer(pack)
+    strip = bool(view.flags & FLAG_KEEPERS_STRIPPED)
+    sources = _family_sources([TTFont(io.BytesIO(data), lazy=True) for data in fonts], list(view.families))
+
+    # Families are stored in order, each in bucket order, so glyph index i is glyphs[i].
+    glyphs = [(font, name) for _, font, names in sources for name in names]
+    if len(glyphs) != view.glyph_count:
+        raise ValueError(f"Fonts have {len(glyphs)} glyphs of the packed families, the pack {view.glyph_count}")
+
+    mismatches: List[str] = []
+    glyf_bytes = 0
+    for index, (font, name) in enumerate(glyphs):
+        data = _compiled_glyph(font["glyf"], name)
+        glyf_bytes += len(data) + (2 if font["head"].indexToLocFormat == 0 else 4)
+        points, flags, end_pts = glyph_arrays(data)
+        want = [
+            (points[a:b], flags[a:b])
+            for a, b in contour_ranges(end_pts)
+            if not (strip and is_keeper_contour(points[a:b]))
+        ]
+        got = view.contours(index)
+        if len(want) != len(got) or any(
+            not np.array_equal(wp, gp) or bytes(gf) != wf for (wp, wf), (gp, gf) in zip(want, got)
+        ):
+            mismatches.append(f"{name}: outline differs")
+
+    # Each glyph at most once, in random order: the font side caches a glyph once decompiled.
+    picks = list(range(len(glyphs)))
+    random.Random(0).shuffle(picks)
+    picks = picks[:samples]
+
+    t0 = time.perf_counter()
+    for index in picks:
+        view.contours(index)
+    pack_us = (time.perf_counter() - t0) / max(1, len(picks)) * 1e6
+
+    # Fresh lazy fonts, so every glyph is decompiled on first access like a cold renderer.
+    cold_sources = _family_sources([TTFont(io.BytesIO(data), lazy=True) for data in fonts], list(view.families))
+    cold = [(font["glyf"], name) for _, font, names in cold_sources for name in names]
+    t0 = time.perf_counter()
+    for index in picks:
+        glyf, name = cold[index]
+        glyf[name].getCoordinates(glyf)
+    font_us = (time.perf_counter() - t0) / max(1, len(picks)) * 1e6
+
+    return PackReport(
+        families={prefix: count for prefix, (_, count) in view.families.items()},
+        glyphs=view.glyph_count,
+        contours=len(view.contour_starts) - 1,
+        points=len(view.points),
+        pack_bytes=len(pack),
+        glyf_bytes=glyf_bytes,
+        pack_us=pack_us,
+        font_us=font_us,
+        mismatches=mismatches,
+    )
@@ -0,0 +1,665 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+minute_hand_font.py
+
+Build flow shared by the minute-hand font variants.
+
+generate_minute_hand_font.py (WWClockMinuteHand) and generate_minute_hand_icon_font.py
+(WWClockMinuteHandIcon) differ only in needle width, family names and output paths. Each
+describes itself as a MinuteHandVariant; the ligature mapping, hand glyphs, incremental
+patching, checks and main() below are written once and take the variant, so a fix to the
+flow lands in both fonts.
+
+The width is part of the variant's "glyphs" key and the family names of its "base" key
+(font_parts.py), so editing either rebuilds only that variant.
+
+Fonts are written without the trail tools' base-glyph store, which is kept beside them and
+reattached when the output is patched (base_glyphs.py).
+
+Dependencies:
+  python3 -m pip install --user fonttools
+  python3 -m pip install --user numpy   (only for --hand-template)
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+from fontTools.ttLib import TTFont
+
+from base_glyphs import attach_base_glyphs, forget_base_glyphs, save_base_glyphs, split_base_glyphs
+from combined_hands import COMBINED_GLYPH_PREFIX, add_combined_glyphs, combined_glyph_for_time, combined_report
+from font_collection import REPO_REL_COLLECTION_TTC, write_minute_collection
+from font_compaction import arrange_uniform_advance_tail
+from font_io import FontSource, load_font, write_bytes_atomic
+from font_parts import fingerprint, hand_template_key, record_parts, stale_parts, template_key
+from font_size_budget import add_budget_arguments, check_font_size
+from glyph_simplify import DEFAULT_TOLERANCE, simplify_font_glyphs
+from timer_context import restore_ligature_lookup
+from timer_gsub_analysis import analyze_timer_gsub
+from timer_ligatures import build_timer_ligature_subtable, entry_count
+from timer_numerals import add_numeral_normalisation, numeral_report
+from timer_shaping import unwrap_subtable
+
+if TYPE_CHECKING:
+    from hand_template import HandTemplate
+
+
+# Must match WidgetWeaverClockWidgetLiveView.minuteHandTimerWindowSeconds (2 hours).
+WINDOW_HOURS = 2
+
+# 1 = per-second positions (3600 glyphs/hour). 5 = every 5s (720 glyphs/hour), etc.
+TICK_SECONDS = 1
+
+SECONDS_PER_HOUR = 3600
+GLYPH_PREFIX = "mh"
+
+# Matches WWClockSecondHand-Regular.ttf: two small squares in opposite corners.
+# These sit outside the dial circle and get clipped away, but they force bounds to 0..1000.
+CORNER_MARK_SIZE = 32
+
+# Douglas-Peucker tolerance (font units) for the post-rotation outline clean-up.
+SIMPLIFY_TOLERANCE = DEFAULT_TOLERANCE
+
+REPO_REL_TEMPLATE_TTF = os.path.join(
+    "WidgetWeaverWidget",
+    "Clock",
+    "WWClockSecondHand-Regular.ttf",
+)
+
+
+@dataclass(frozen=True)
+class MinuteHandVariant:
+    """One minute-hand font: its needle width, family names and repo-relative outputs."""
+
+    family_name: str
+    combined_family_name: str
+    output_ttf: str
+    # --combined: one glyph per second of the hour drawing both hands (combined_hands.py).
+    combined_output_ttf: str
+    hand_width: float
+
+    def output_path(self, combined: bool = False) -> str:
+        return self.combined_output_ttf if combined else self.output_ttf
+
+    def family(self, combined: bool = False) -> str:
+        return self.combined_family_name if combined else self.family_name
+
+
+def log(msg: str) -> None:
+    print(msg, flush=True)
+
+
+def start_heartbeat(label: str, interval_seconds: float = 5.0) -> threading.Event:
+    stop = threading.Event()
+
+    def run() -> None:
+        start = time.perf_counter()
+        while not stop.wait(interval_seconds):
+            elapsed = time.perf_counter() - start
+            log(f"{label}… ({elapsed:.0f}s elapsed)")
+
+    t = threading.Thread(target=run, daemon=True)
+    t.start()
+    return stop
+
+
+def get_char_to_glyph(font: TTFont) -> Dict[str, str]:
+    cmap = font.getBestCmap()
+    if cmap is None:
+        raise RuntimeError("Font has no cmap")
+
+    needed = "0123456789:"
+    out: Dict[str, str] = {}
+    for ch in needed:
+        g = cmap.get(ord(ch))
+        if not g:
+            raise RuntimeError(
+                f"Font cmap missing glyph for character {ch!r} (U+{ord(ch):04X})"
+            )
+        out[ch] = g
+
+    return out
+
+
+def glyph_name_for_bucket(bucket: int) -> str:
+    return f"{GLYPH_PREFIX}{bucket:04d}"
+
+
+def minute_glyph_for_time(h: int, m: int, s: int) -> str:
+    # The hour field only disambiguates the timer text; the hand position is per hour.
+    return glyph_name_for_bucket((m * 60 + s) // TICK_SECONDS)
+
+
+def add_corner_markers(pen: TTGlyphPen, dial_size: int) -> None:
+    m = CORNER_MARK_SIZE
+    maxv = dial_size
+
+    # Bottom-left square: (0,0) .. (m,m)
+    pen.moveTo((0, 0))
+    pen.lineTo((m, 0))
+    pen.lineTo((m, m))
+    pen.lineTo((0, m))
+    pen.closePath()
+
+    # Top-right square: (maxv-m, maxv-m) .. (maxv, maxv)
+    pen.moveTo((maxv - m, maxv - m))
+    pen.lineTo((maxv, maxv - m))
+    pen.lineTo((maxv, maxv))
+    pen.lineTo((maxv - m, maxv))
+    pen.closePath()
+
+
+def make_hand_glyph(
+    glyph_set,
+    angle_degrees: float,
+    *,
+    dial_size: int = 1000,
+    width: float = 18.0,
+    length: float = 420.0,
+):
+    """
+    Needle silhouette matching the Swift shape proportions:
+      shaftInset = 0.10 * width
+      tipHeight  = 0.95 * width
+
+    Coordinates:
+      - square dial box: 0..dial_size
+      - centre at (dial_size/2, dial_size/2)
+      - 0 degrees points up (12 o’clock)
+    """
+    cx = cy = dial_size / 2.0
+    x0 = cx - (width / 2.0)
+
+    shaft_inset = width * 0.10
+    tip_height = max(1.0, width * 0.95)
+
+    y_tip = cy + length
+    shaft_top_y = y_tip - tip_height
+
+    pts = [
+        (x0 + shaft_inset, cy),
+        (x0 + shaft_inset, shaft_top_y),
+        (x0 + (width / 2.0), y_tip),
+        (x0 + width - shaft_inset, shaft_top_y),
+        (x0 + width - shaft_inset, cy),
+    ]
+
+    theta = -math.radians(angle_degrees)
+    c = math.cos(theta)
+    s = math.sin(theta)
+
+    rotated: List[Tuple[int, int]] = []
+    for x, y in pts:
+        dx = x - cx
+        dy = y - cy
+        xr = cx + dx * c - dy * s
+        yr = cy + dx * s + dy * c
+        rotated.append((int(round(xr)), int(round(yr))))
+
+    pen = TTGlyphPen(glyph_set)
+
+    # Force stable 0..1000 bounds (outside-circle markers, clipped away in the widget).
+    add_corner_markers(pen, dial_size)
+
+    # Actual hand.
+    pen.moveTo(rotated[0])
+    for p in rotated[1:]:
+        pen.lineTo(p)
+    pen.closePath()
+
+    return pen.glyph()
+
+
+def find_timer_ligature_lookup_index(font: TTFont, glyph_prefix: str) -> Optional[int]:
+    if "GSUB" not in font:
+        return None
+
+    gsub = font["GSUB"].table
+    lookups = gsub.LookupList.Lookup
+
+    for idx, lookup in enumerate(lookups):
+        # A built minute font's lookup is promoted to Extension (type 7) by the compiler.
+        if getattr(lookup, "LookupType", None) not in (4, 7):
+            continue
+
+        for st in lookup.SubTable:
+            ligs = getattr(unwrap_subtable(st), "ligatures", None)
+            if not ligs:
+                continue
+
+            for _, lst in ligs.items():
+                for lig in lst:
+                    out = getattr(lig, "LigGlyph", "")
+                    if isinstance(out, str) and out.startswith(glyph_prefix):
+                        return idx
+
+    return None
+
+
+def find_seconds_ligature_lookup_index(font: TTFont) -> Optional[int]:
+    return find_timer_ligature_lookup_index(font, "sec")
+
+
+def update_name_table(font: TTFont, family: str) -> None:
+    if "name" not in font:
+        return
+
+    name_table = font["name"]
+
+    def set_name_all_platforms(name_id: int, value: str) -> None:
+        kept = []
+        for rec in name_table.names:
+            if rec.nameID == name_id and rec.platformID in (1, 3):
+                continue
+            kept.append(rec)
+        name_table.names = kept
+
+        # Mac (platform 1) — language 0 = English, encoding 0 = Roman
+        name_table.setName(value, name_id, 1, 0, 0)
+
+        # Windows (platform 3) — encoding 1 = Unicode BMP, lang 0x0409 = en-US
+        name_table.setName(value, name_id, 3, 1, 0x0409)
+
+    set_name_all_platforms(1, family)
+    set_name_all_platforms(2, "Regular")
+    set_name_all_platforms(3, f"{family}-Regular")
+    set_name_all_platforms(4, f"{family} Regular")
+    set_name_all_platforms(5, "Version 1.0")
+    set_name_all_platforms(6, f"{family}-Regular")
+
+
+def build_timer_subtables(
+    font: TTFont,
+    log_fn: Callable[[str], None] = log,
+    glyph_for_time: Callable[[int, int, int], str] = minute_glyph_for_time,
+) -> List:
+    log_fn("Reading cmap for digit/colon glyph names…")
+    char_to_glyph = get_char_to_glyph(font)
+
+    log_fn("Building ligature subtables…")
+    t0 = time.perf_counter()
+
+    # 1) Hour form: h:mm:ss (covers WINDOW_HOURS, to avoid m:ss matching the hour prefix)
+    #    Map hours 0..(WINDOW_HOURS-1). For WINDOW_HOURS=2 => 0 and 1.
+    sub_h = build_timer_ligature_subtable(
+        char_to_glyph, "h:mm:ss", glyph_for_time, hours=range(0, WINDOW_HOURS)
+    )
+    # 2) Under 1 hour: mm:ss
+    sub_mmss = build_timer_ligature_subtable(char_to_glyph, "mm:ss", glyph_for_time)
+    # 3) Under 10 minutes: m:ss
+    sub_mss = build_timer_ligature_subtable(char_to_glyph, "m:ss", glyph_for_time)
+
+    build_ms = (time.perf_counter() - t0) * 1000.0
+
+    log_fn(f"Mapping entries h:mm:ss: {entry_count(sub_h)}")
+    log_fn(f"Mapping entries mm:ss:  {entry_count(sub_mmss)}")
+    log_fn(f"Mapping entries  m:ss:  {entry_count(sub_mss)}")
+    log_fn(
+        f"Mapping total entries:  {entry_count(sub_h) + entry_count(sub_mmss) + entry_count(sub_mss)}"
+        f" ({build_ms:.1f} ms)"
+    )
+    return [sub_h, sub_mmss, sub_mss]
+
+
+def replace_timer_lookup(font: TTFont, subtables: List, glyph_prefix: str, log_fn: Callable[[str], None] = log) -> None:
+    """Replaces the subtables of the ligature lookup whose outputs start with glyph_prefix."""
+    # A --multi-hour second-hand template has a contextual lookup; start from plain ligatures.
+    restore_ligature_lookup(font, log_fn)
+    idx = find_timer_ligature_lookup_index(font, glyph_prefix)
+    if idx is None:
+        raise RuntimeError("Could not locate the timer ligature lookup in GSUB")
+
+    log_fn(f"Replacing GSUB ligature lookup at index {idx}…")
+    gsub = font["GSUB"].table
+    lookup = gsub.LookupList.Lookup[idx]
+    lookup.LookupType = 4
+    lookup.SubTable = subtables
+    lookup.SubTableCount = len(subtables)
+
+
+def install_timer_gsub(
+    font: TTFont,
+    glyph_for_time: Callable[[int, int, int], str] = minute_glyph_for_time,
+    log_fn: Callable[[str], None] = log,
+) -> None:
+    """The minute font's GSUB: the timer ligature lookup, then the numeral normalisation ahead of it."""
+    replace_timer_lookup(font, build_timer_subtables(font, log_fn, glyph_for_time), "sec", log_fn)
+    add_numeral_normalisation(font, log_fn=log_fn)
+
+
+def finish_minute_font(
+    font: TTFont,
+    variant: MinuteHandVariant,
+    hand_names: List[str],
+    *,
+    combined: bool = False,
+    log_fn: Callable[[str], None] = log,
+) -> None:
+    """Glyph order and name table once the hand glyphs (hand_names) are in the font."""
+    # sec** + mh**** (+ hs****) share base_aw: keep them as the trailing block hmtx can collapse.
+    sec_names = [g for g in font.getGlyphOrder() if len(g) == 5 and g.startswith("sec") and g[3:].isdigit()]
+    arrange_uniform_advance_tail(font, sec_names + hand_names)
+
+    log_fn("Updating name table…")
+    update_name_table(font, variant.family(combined))
+
+
+def write_hand_glyphs(
+    font: TTFont,
+    *,
+    hand_width: float = 18.0,
+    hand_template: Optional[Union[str, "HandTemplate"]] = None,
+    simplify_tolerance: float = SIMPLIFY_TOLERANCE,
+    log_fn: Callable[[str], None] = log,
+) -> List[str]:
+    """
+    Writes (adds or replaces) the mh**** outlines and metrics; returns their names. The
+    built-in needle is hand_width wide; a hand template brings its own outline.
+    """
+    positions = SECONDS_PER_HOUR // TICK_SECONDS
+    log_fn(f"Per-hour positions: {positions} (TICK_SECONDS={TICK_SECONDS})")
+
+    glyf = font["glyf"]
+    hmtx = font["hmtx"]
+    glyph_set = font.getGlyphSet()
+
+    base_aw = hmtx["sec00"][0] if "sec00" in hmtx.metrics else 1000
+
+    templated = None
+    if hand_template is not None:
+        from hand_template import HandTemplate
+
+        template = HandTemplate.from_spec(hand_template) if isinstance(hand_template, str) else hand_template
+        log_fn(
+            f"Hand template: {template.contour_count} contours, "
+            f"{template.point_count} points ({template.off_curve_count} off-curve)"
+        )
+        marker_pen = TTGlyphPen(glyph_set)
+        add_corner_markers(marker_pen, 1000)
+        angles = [(b * TICK_SECONDS / 3600.0) * 360.0 for b in range(positions)]
+        templated = template.rotated_glyphs(angles, glyf, fixed=marker_pen.glyph())
+
+    new_names: List[str] = []
+    for bucket in range(positions):
+        name = glyph_name_for_bucket(bucket)
+        new_names.append(name)
+
+        t = bucket * TICK_SECONDS
+        angle_deg = (t / 3600.0) * 360.0  # 360° per hour
+
+        if templated is not None:
+            glyf[name] = templated[bucket]
+        else:
+            glyf[name] = make_hand_glyph(glyph_set, angle_deg, width=hand_width)
+        hmtx.metrics[name] = (base_aw, 0)
+
+        if bucket % 300 == 0:
+            log_fn(f"  wrote {name} (t={t:4d}s, angle={angle_deg:7.3f}°)…")
+
+    log_fn("Simplifying mh**** outlines…")
+    stats = simplify_font_glyphs(font, new_names, simplify_tolerance)
+    log_fn(stats.summary())
+
+    # Trail tools decorate from the stored undecorated outlines (base_glyphs.py); these are new.
+    forget_base_glyphs(font, new_names)
+    return new_names
+
+
+def check_timer_gsub(font: TTFont, log_fn: Callable[[str], None] = log) -> None:
+    log_fn("Analyzing GSUB timer mapping (shadowing, buckets, coverage)…")
+    for analysis in analyze_timer_gsub(font):
+        for line in analysis.summary_lines():
+            log_fn(line)
+        if not analysis.ok:
+            raise RuntimeError("GSUB timer mapping analysis failed; font not saved")
+
+
+def part_keys(
+    template: bytes,
+    variant: MinuteHandVariant,
+    *,
+    hand_template: Optional[Union[str, "HandTemplate"]] = None,
+    simplify_tolerance: float = SIMPLIFY_TOLERANCE,
+    combined: bool = False,
+) -> Dict[str, str]:
+    """Input fingerprints of the base / glyphs / gsub parts (see font_parts.py)."""
+    import combined_hands
+    import glyph_simplify
+    import timer_ligatures
+    import timer_numerals
+
+    return {
+        "base": fingerprint(
+            template_key(template),
+            variant.family(combined),
+            TICK_SECONDS,
+            glyph_name_for_bucket,
+            update_name_table,
+            arrange_uniform_advance_tail,
+            combined,
+            combined_hands if combined else None,
+            timer_numerals,
+        ),
+        "glyphs": fingerprint(
+            TICK_SECONDS,
+            CORNER_MARK_SIZE,
+            variant.hand_width,
+            make_hand_glyph,
+            add_corner_markers,
+            write_hand_glyphs,
+            hand_template_key(hand_template),
+            simplify_tolerance,
+            glyph_simplify,
+        ),
+        "gsub": fingerprint(
+            WINDOW_HOURS, TICK_SECONDS, minute_glyph_for_time, build_timer_subtables, timer_ligatures, combined
+        ),
+    }
+
+
+def build_minute_hand_font(
+    source: FontSource,
+    variant: MinuteHandVariant,
+    *,
+    hand_template: Optional[Union[str, "HandTemplate"]] = None,
+    simplify_tolerance: float = SIMPLIFY_TOLERANCE,
+    combined: bool = False,
+    log_fn: Callable[[str], None] = log,
+) -> TTFont:
+    """
+    Builds the variant's minute-hand font from the second-hand template (a TTFont, modified in place,
+    or its bytes) and returns it, without touching the disk. With combined, the timer
+    text maps to hs0000..hs3599, which draw the minute and the second hand together.
+    Raises if the GSUB timer mapping analysis fails.
+    """
+    if SECONDS_PER_HOUR % TICK_SECONDS != 0:
+        raise ValueError("TICK_SECONDS must divide 3600 evenly")
+
+    font = load_font(source)
+
+    install_timer_gsub(font, combined_glyph_for_time if combined else minute_glyph_for_time, log_fn)
+
+    log_fn("Adding mh**** glyphs + outlines…")
+    new_names = write_hand_glyphs(
+        font,
+        hand_width=variant.hand_width,
+        hand_template=hand_template,
+        simplify_tolerance=simplify_tolerance,
+        log_fn=log_fn,
+    )
+
+    if combined:
+        new_names += add_combined_glyphs(
+            font, lambda t: glyph_name_for_bucket(t // TICK_SECONDS), log_fn=log_fn
+        )
+
+    finish_minute_font(font, variant, new_names, combined=combined, log_fn=log_fn)
+
+    check_timer_gsub(font, log_fn)
+
+    return font
+
+
+def patch_minute_hand_font(
+    existing: FontSource,
+    parts: Iterable[str],
+    variant: MinuteHandVariant,
+    *,
+    hand_template: Optional[Union[str, "HandTemplate"]] = None,
+    simplify_tolerance: float = SIMPLIFY_TOLERANCE,
+    combined: bool = False,
+    log_fn: Callable[[str], None] = log,
+) -> TTFont:
+    """
+    Rebuilds only the given parts ("glyphs", "gsub") of a previously built minute-hand font
+    (a TTFont or its bytes) and returns it; tables no part touches are written back as their
+    original bytes. The glyph set and order must be unchanged ("base" up to date).
+    """
+    parts = set(parts)
+    unknown = parts - {"glyphs", "gsub"}
+    if unknown:
+        raise ValueError(f"Cannot patch parts {sorted(unknown)}; full build required")
+
+    font = load_font(existing)
+
+    if "glyphs" in parts:
+        log_fn("Rewriting mh**** outlines…")
+        write_hand_glyphs(
+            font,
+            hand_width=variant.hand_width,
+            hand_template=hand_template,
+            simplify_tolerance=simplify_tolerance,
+            log_fn=log_fn,
+        )
+
+    if "gsub" in parts:
+        if combined:
+            subtables = build_timer_subtables(font, log_fn, combined_glyph_for_time)
+            replace_timer_lookup(font, subtables, COMBINED_GLYPH_PREFIX, log_fn)
+        else:
+            replace_timer_lookup(font, build_timer_subtables(font, log_fn), GLYPH_PREFIX, log_fn)
+        check_timer_gsub(font, log_fn)
+
+    return font
+
+
+def parse_args(variant: MinuteHandVariant, argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--hand-template",
+        default=None,
+        help="Hand outline pointing at 12 o'clock: hand.svg or FONT.ttf:glyph (default: built-in needle)",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Rebuild everything instead of patching only the parts whose inputs changed",
+    )
+    parser.add_argument(
+        "--combined",
+        action="store_true",
+        help=f"Build {variant.combined_output_ttf}: one glyph per second of the hour drawing both hands",
+    )
+    parser.add_argument(
+        "--collection",
+        action="store_true",
+        help=f"Also write {REPO_REL_COLLECTION_TTC}: both minute-hand variants sharing their identical tables",
+    )
+    add_budget_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def main(variant: MinuteHandVariant, argv: Optional[List[str]] = None) -> None:
+    args = parse_args(variant, argv)
+
+    repo_root = os.getcwd()
+    template_path = os.path.join(repo_root, REPO_REL_TEMPLATE_TTF)
+    out_path = os.path.join(repo_root, variant.output_path(args.combined))
+
+    if not os.path.exists(template_path):
+        raise FileNotFoundError(f"Template font missing: {template_path}")
+
+    log("Loading template font…")
+    with open(template_path, "rb") as f:
+        template = f.read()
+
+    existing: Optional[bytes] = None
+    if os.path.exists(out_path):
+        with open(out_path, "rb") as f:
+            existing = f.read()
+
+    keys = part_keys(
+        template,
+        variant,
+        hand_template=args.hand_template,
+        simplify_tolerance=SIMPLIFY_TOLERANCE,
+        combined=args.combined,
+    )
+    stale = None if args.full else stale_parts(out_path, existing, keys)
+
+    t0 = time.perf_counter()
+    if stale is None:
+        log("Full build…")
+        source = load_font(template)
+        attach_base_glyphs(source, template_path, template)
+        font = build_minute_hand_font(source, variant, hand_template=args.hand_template, combined=args.combined)
+    elif not stale:
+        log(f"Up to date: {out_path}")
+        if args.collection:
+            write_minute_collection(repo_root, log)
+        return
+    else:
+        log(f"Patching stale parts into the existing font: {', '.join(stale)}")
+        source = load_font(existing)
+        attach_base_glyphs(source, out_path, existing)
+        font = patch_minute_hand_font(
+            source, stale, variant, hand_template=args.hand_template, combined=args.combined
+        )
+
+    log("Saving font (heartbeat will print if slow)…")
+    stop = start_heartbeat("Saving font", interval_seconds=5.0)
+    try:
+        data, store = split_base_glyphs(font)
+    finally:
+        stop.set()
+
+    log("Checking font size budget…")
+    check_font_size(data, out_path, log, budget_as=args.budget_as, no_budget=args.no_budget)
+
+    log("Checking alternate-digit timer coverage…")
+    numerals = numeral_report(data, window_seconds=WINDOW_HOURS * SECONDS_PER_HOUR)
+    for line in numerals.summary_lines():
+        log(line)
+    if not numerals.ok:
+        raise RuntimeError("Alternate-digit timer strings do not shape like ASCII; font not saved")
+
+    write_bytes_atomic(out_path, data)
+    save_base_glyphs(out_path, store, data)
+    record_parts(out_path, data, keys)
+    log(f"Wrote: {out_path} ({time.perf_counter() - t0:.2f} s build + save)")
+
+    minute_path = os.path.join(repo_root, variant.output_ttf)
+    if args.combined and os.path.exists(minute_path):
+        log("Comparing with the two-font setup (minute + second font)…")
+        with open(minute_path, "rb") as f:
+            minute = f.read()
+        report = combined_report(data, minute, template, window_seconds=WINDOW_HOURS * SECONDS_PER_HOUR)
+        for line in report.summary_lines():
+            log(line)
+        if not report.ok:
+            raise RuntimeError("Combined font does not match the two-font setup")
+
+    if args.collection:
+        log("Writing the minute-hand collection…")
+        write_minute_collection(repo_root, log)
+
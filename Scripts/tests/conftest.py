@@ -0,0 +1,38 @@
+"""
+Shared fixtures for the font tooling tests.
+
+The tests import the Scripts/ and Tools/ modules the way the tools do (flat module names on
+sys.path) and read the shipped clock fonts without modifying them.
+
+Run from repo root:
+  python3 -m pytest -q Scripts/tests
+"""
+
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+CLOCK_DIR = os.path.join(REPO_ROOT, "WidgetWeaverWidget", "Clock")
+
+for _sub in ("Scripts", "Tools"):
+    _path = os.path.join(REPO_ROOT, _sub)
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+
+def _read(name: str) -> bytes:
+    with open(os.path.join(CLOCK_DIR, name), "rb") as f:
+        return f.read()
+
+
+@pytest.fixture(scope="session")
+def second_font_bytes() -> bytes:
+    return _read("WWClockSecondHand-Regular.ttf")
+
+
+@pytest.fixture(scope="session")
+def minute_font_bytes() -> bytes:
+    return _read("WWClockMinuteHand-Regular.ttf")
+
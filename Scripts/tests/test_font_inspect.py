@@ -0,0 +1,42 @@
+"""
+font_inspect trail section: trails are read from the outlines, with or without a store.
+"""
+
+from add_seconds_arc_trail import build_arc_trail_font
+from base_glyphs import save_base_glyphs, split_base_glyphs
+from font_inspect import inspect_path
+from font_io import write_bytes_atomic
+from make_seconds_sweep_font import build_sweep_font
+
+
+def _quiet(_msg: str) -> None:
+    pass
+
+
+def _trails(path: str):
+    (report,) = inspect_path(path, ["glyf", "trails"])
+    return report.trails
+
+
+def test_shipped_font_has_no_trails(second_font_bytes, tmp_path):
+    path = str(tmp_path / "plain.ttf")
+    write_bytes_atomic(path, second_font_bytes)
+    trails = _trails(path)
+    assert trails[0] == "sec: no trail contours in 8 sampled glyphs"
+    assert trails[1].startswith("no WWbg base store available")
+
+
+def test_trails_found_without_the_store(second_font_bytes, tmp_path):
+    font = build_arc_trail_font(build_sweep_font(second_font_bytes, log_fn=_quiet), log_fn=_quiet)
+    data, store = split_base_glyphs(font)
+
+    written = str(tmp_path / "trailed.ttf")
+    write_bytes_atomic(written, data)
+    save_base_glyphs(written, store, data)
+    copied = str(tmp_path / "copied.ttf")
+    write_bytes_atomic(copied, data)
+
+    detected = "sec: trail contours in 8 of 8 sampled glyphs: arc (3 contours), sweep (10 contours)"
+    assert _trails(written)[0] == detected
+    assert "layers: arc on 60 glyphs, sweep on 60 glyphs" in _trails(written)[2]
+    assert _trails(copied) == [detected, "no WWbg base store available (not in the font, none saved beside it)"]
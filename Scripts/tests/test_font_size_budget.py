@@ -0,0 +1,48 @@
+"""
+Size budgets: the generators' --budget-as / --no-budget choices, checked with the minute-hand
+font saved under the second-hand font's name (far over that budget).
+"""
+
+import argparse
+
+import pytest
+
+from font_size_budget import FONT_BUDGETS, add_budget_arguments, check_font_size, selected_budget
+
+SECOND = "WWClockSecondHand-Regular.ttf"
+MINUTE = "WWClockMinuteHand-Regular.ttf"
+
+
+def _quiet(_msg: str) -> None:
+    pass
+
+
+def _parse(argv) -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    add_budget_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def test_selected_budget():
+    assert selected_budget(f"/tmp/{SECOND}") is FONT_BUDGETS[SECOND]
+    assert selected_budget(f"/tmp/{SECOND}", budget_as=MINUTE) is FONT_BUDGETS[MINUTE]
+    assert selected_budget(f"/tmp/{SECOND}", budget_as=MINUTE, no_budget=True) is None
+    assert selected_budget("/tmp/other.ttf") is None
+
+    args = _parse(["--budget-as", MINUTE])
+    assert (args.budget_as, args.no_budget) == (MINUTE, False)
+    with pytest.raises(SystemExit):
+        _parse(["--budget-as", "other.ttf"])
+
+
+def test_over_budget_font_is_refused(minute_font_bytes):
+    with pytest.raises(RuntimeError, match="budget exceeded"):
+        check_font_size(minute_font_bytes, SECOND, _quiet)
+
+
+def test_override_lets_the_font_through(minute_font_bytes):
+    lines = []
+    check_font_size(minute_font_bytes, SECOND, lines.append, no_budget=True)
+    assert "  size budget not checked (--no-budget)" in lines
+
+    check_font_size(minute_font_bytes, SECOND, _quiet, budget_as=MINUTE)
@@ -0,0 +1,48 @@
+"""
+Contextual seconds lookup: context_report() parity of a --multi-hour second-hand font with
+the ligature font it replaces (what generate_second_hand_font.py --multi-hour checks before
+saving), and a glyph mapping it does not draw is reported.
+"""
+
+import pytest
+
+from font_io import font_bytes
+from generate_second_hand_font import build_second_hand_font, second_glyph_for_time
+from timer_context import context_report, find_seconds_context_lookup_index
+
+
+def _quiet(_msg: str) -> None:
+    pass
+
+
+@pytest.fixture(scope="module")
+def second_fonts(second_font_bytes):
+    ligature = font_bytes(build_second_hand_font(second_font_bytes, log_fn=_quiet))
+    context = build_second_hand_font(second_font_bytes, multi_hour=True, log_fn=_quiet)
+    assert find_seconds_context_lookup_index(context) is not None
+    return ligature, font_bytes(context)
+
+
+def test_context_lookup_shapes_like_the_ligatures(second_fonts):
+    ligature, context = second_fonts
+    report = context_report(ligature, context, second_glyph_for_time)
+
+    assert report.ok, report.mismatches[:10]
+    assert report.mapping_strings == 3600 + 600
+    assert report.hour_strings > 0
+    # Past 59:59 the ligature font draws the wrong hand; the contextual one does not.
+    assert report.ligature_hour_misses > 0
+    assert report.context_gsub < report.ligature_gsub
+    assert report.summary_lines()[-1] == "  parity OK"
+
+
+def test_wrong_hand_is_reported(second_fonts):
+    ligature, context = second_fonts
+
+    def next_second(h: int, m: int, s: int) -> str:
+        return f"sec{(s + 1) % 60:02d}"
+
+    report = context_report(ligature, context, next_second, hours=(1, 100))
+    assert not report.ok
+    assert len(report.mismatches) == report.hour_strings
+    assert report.summary_lines()[-1] == f"  parity FAIL ({report.hour_strings} strings)"
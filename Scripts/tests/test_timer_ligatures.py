@@ -0,0 +1,46 @@
+"""
+Timer ligatures: the direct subtable builder against fontTools' generic
+buildLigatureSubstSubtable on the same mapping (what timer_ligatures.main checks from the
+command line), for each timer form with the second- and minute-hand glyph functions.
+"""
+
+import pytest
+from fontTools.otlLib import builder as otl
+
+from timer_ligatures import (
+    build_timer_ligature_subtable,
+    check_parity,
+    entry_count,
+    generic_mapping,
+    subtable_signature,
+)
+
+CHAR_TO_GLYPH = {
+    **{str(d): name for d, name in enumerate(
+        ["zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+    )},
+    ":": "colon",
+}
+
+
+def sec_glyph(h: int, m: int, s: int) -> str:
+    return f"sec{s:02d}"
+
+
+def mh_glyph(h: int, m: int, s: int) -> str:
+    return f"mh{m * 60 + s:04d}"
+
+
+@pytest.mark.parametrize("out_glyph", [sec_glyph, mh_glyph], ids=["sec", "mh"])
+@pytest.mark.parametrize(
+    "form, hours",
+    [("mm:ss", (0,)), ("m:ss", (0,)), ("ss", (0,)), ("h:mm:ss", (0, 1)), ("h:mm:ss", tuple(range(24)))],
+)
+def test_direct_builder_matches_generic(form, hours, out_glyph):
+    direct = build_timer_ligature_subtable(CHAR_TO_GLYPH, form, out_glyph, hours)
+    mapping = generic_mapping(CHAR_TO_GLYPH, form, out_glyph, hours)
+    generic = otl.buildLigatureSubstSubtable(mapping)
+
+    assert subtable_signature(direct) == subtable_signature(generic)
+    assert entry_count(direct) == len(mapping)
+    assert check_parity(CHAR_TO_GLYPH, form, out_glyph, hours)[0]
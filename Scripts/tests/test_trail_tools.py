@@ -0,0 +1,226 @@
+"""
+Trail tools: glyph-family selection, pool/serial parity of process_glyphs, sweep + arc
+composition through the base-glyph store, the store's file round trip, and fonts copied
+without it.
+"""
+
+import os
+import struct
+import zlib
+
+import pytest
+from fontTools.ttLib import TTFont, newTable
+
+from add_seconds_arc_trail import add_arc_trail, build_arc_trail_font
+from base_glyphs import (
+    BASE_GLYPHS_TAG,
+    attach_base_glyphs,
+    base_store_path,
+    read_base_glyphs,
+    read_glyph_store,
+    save_base_glyphs,
+    split_base_glyphs,
+    strip_decorations,
+)
+from font_io import load_font, write_bytes_atomic
+from glyph_family import GlyphFamily, decoration_contours, remove_decoration
+from make_seconds_sweep_font import add_sweep_trail, build_sweep_font
+
+SEC = [f"sec{s:02d}" for s in range(60)]
+
+# Every tenth minute-hand glyph: 360 glyphs, 1 degree apart, enough for several batches.
+MINUTE_SAMPLE = GlyphFamily(r"^mh(\d{3}0)$", degrees_per_bucket=0.1)
+
+
+def _quiet(_msg: str) -> None:
+    pass
+
+
+def _contours(font: TTFont, name: str) -> int:
+    return font["glyf"][name].numberOfContours
+
+
+def _glyph_bytes(font: TTFont, names) -> dict:
+    glyf = font["glyf"]
+    return {name: glyf[name].compile(glyf) for name in names}
+
+
+# -- glyph families ---------------------------------------------------------------------
+
+
+def test_degrees_per_bucket_defaults_to_one_revolution(second_font_bytes, minute_font_bytes):
+    sec = GlyphFamily.from_prefix("sec")
+    members = sec.select(load_font(second_font_bytes))
+    assert [name for name, _ in members] == SEC
+    assert sec.angles([b for _, b in members])[:3] == [0.0, 6.0, 12.0]
+
+    mh = GlyphFamily.from_prefix("mh")
+    members = mh.select(load_font(minute_font_bytes))
+    assert len(members) == 3600
+    assert mh.angles([b for _, b in members])[1] == pytest.approx(0.1)
+
+
+def test_explicit_degrees_per_bucket_and_start():
+    family = GlyphFamily.from_prefix("sec", degrees_per_bucket=3.0, start_deg=90.0)
+    assert family.angles([0, 1, 2]) == [90.0, 93.0, 96.0]
+
+
+def test_regex_selects_in_bucket_order(minute_font_bytes):
+    members = MINUTE_SAMPLE.select(load_font(minute_font_bytes))
+    assert len(members) == 360
+    assert members[:2] == [("mh0000", 0), ("mh0010", 10)]
+    assert MINUTE_SAMPLE.angles([10]) == [pytest.approx(1.0)]
+
+
+# -- process_glyphs parity ----------------------------------------------------------------
+
+
+@pytest.mark.parametrize("build", [build_sweep_font, build_arc_trail_font])
+def test_pool_output_matches_serial(build, minute_font_bytes):
+    names = [name for name, _ in MINUTE_SAMPLE.select(load_font(minute_font_bytes))]
+    serial = build(minute_font_bytes, log_fn=_quiet, family=MINUTE_SAMPLE, jobs=1, batch_size=32)
+    pooled = build(minute_font_bytes, log_fn=_quiet, family=MINUTE_SAMPLE, jobs=4, batch_size=32)
+
+    assert _glyph_bytes(pooled, names) == _glyph_bytes(serial, names)
+    assert pooled[BASE_GLYPHS_TAG].data == serial[BASE_GLYPHS_TAG].data
+
+
+def test_batch_size_does_not_change_output(second_font_bytes):
+    small = build_sweep_font(second_font_bytes, log_fn=_quiet, batch_size=7)
+    large = build_sweep_font(second_font_bytes, log_fn=_quiet, batch_size=256)
+    assert _glyph_bytes(small, SEC) == _glyph_bytes(large, SEC)
+
+
+# -- composition ----------------------------------------------------------------------------
+
+
+def test_sweep_then_arc_keeps_both_trails(second_font_bytes):
+    font = load_font(second_font_bytes)
+    base = _contours(font, "sec17")  # two keepers + the hand
+
+    add_sweep_trail(font, SEC, trail_count=5)
+    hand = _contours(font, "sec17") - base
+    assert hand > 0
+    swept = _contours(font, "sec17")
+
+    add_arc_trail(font, SEC, layers=3)
+    assert _contours(font, "sec17") == swept + 3
+    assert sorted(read_glyph_store(font)["sec17"].layers) == ["arc", "sweep"]
+
+
+def test_trail_order_does_not_matter(minute_font_bytes):
+    names = [name for name, _ in MINUTE_SAMPLE.select(load_font(minute_font_bytes))]
+
+    sweep_first = load_font(minute_font_bytes)
+    add_sweep_trail(sweep_first, names)
+    add_arc_trail(sweep_first, names)
+
+    arc_first = load_font(minute_font_bytes)
+    add_arc_trail(arc_first, names)
+    add_sweep_trail(arc_first, names)
+
+    # 2 keepers + 1 hand, 5 sweep copies under the hand, 3 arc layers over it.
+    assert _contours(sweep_first, "mh0450") == 3 + 5 + 3
+    assert _glyph_bytes(sweep_first, names) == _glyph_bytes(arc_first, names)
+
+
+def test_rerun_replaces_only_its_own_layer(second_font_bytes):
+    font = load_font(second_font_bytes)
+    base = _contours(font, "sec17")
+    add_sweep_trail(font, SEC, trail_count=5)
+    per_copy = (_contours(font, "sec17") - base) // 5
+    add_arc_trail(font, SEC, layers=3)
+
+    add_sweep_trail(font, SEC, trail_count=2)
+    assert _contours(font, "sec17") == base + 2 * per_copy + 3
+
+    add_sweep_trail(font, SEC, trail_count=2)
+    assert _contours(font, "sec17") == base + 2 * per_copy + 3
+
+
+def test_remove_and_strip_decorations(second_font_bytes):
+    font = load_font(second_font_bytes)
+    original = _glyph_bytes(font, SEC)
+    base = _contours(font, "sec17")
+    add_sweep_trail(font, SEC)
+    add_arc_trail(font, SEC)
+
+    assert remove_decoration(font, SEC, "sweep") == 60
+    assert _contours(font, "sec17") == base + 3
+
+    assert strip_decorations(font) == SEC
+    assert BASE_GLYPHS_TAG not in font
+    assert _glyph_bytes(load_font(font), SEC) == original
+
+
+def test_version_1_store_is_read(second_font_bytes):
+    font = load_font(second_font_bytes)
+    data = font["glyf"].glyphs["sec05"].data
+    payload = struct.pack(">HH", 1, 5) + b"sec05" + struct.pack(">I", len(data)) + data
+    table = newTable(BASE_GLYPHS_TAG)
+    table.data = struct.pack(">H", 1) + zlib.compress(payload)
+    font[BASE_GLYPHS_TAG] = table
+
+    assert read_base_glyphs(font) == {"sec05": data}
+    assert read_glyph_store(font)["sec05"].layers == {}
+
+
+# -- written fonts --------------------------------------------------------------------------
+
+
+def _write(font: TTFont, path: str) -> bytes:
+    data, store = split_base_glyphs(font)
+    write_bytes_atomic(path, data)
+    save_base_glyphs(path, store, data)
+    return data
+
+
+def test_written_font_keeps_the_store_beside_it(second_font_bytes, tmp_path):
+    font = build_sweep_font(second_font_bytes, log_fn=_quiet)
+    path = str(tmp_path / "sweep.ttf")
+    data = _write(font, path)
+
+    assert BASE_GLYPHS_TAG in font
+    assert BASE_GLYPHS_TAG not in TTFont(path)
+    assert os.path.exists(base_store_path(path))
+
+    # Font and store moved together (a fresh clone, another checkout) still chain.
+    moved = tmp_path / "clone"
+    moved.mkdir()
+    for src in (path, base_store_path(path)):
+        os.replace(src, str(moved / os.path.basename(src)))
+    moved_path = str(moved / "sweep.ttf")
+    reloaded = load_font(data)
+    assert attach_base_glyphs(reloaded, moved_path, data)
+    build_arc_trail_font(reloaded, log_fn=_quiet)
+    assert sorted(read_glyph_store(reloaded)["sec00"].layers) == ["arc", "sweep"]
+
+    # A file changed since it was written does not get the old store back.
+    assert not attach_base_glyphs(load_font(second_font_bytes), moved_path, second_font_bytes)
+
+
+def test_decorated_font_without_its_store_is_not_trailed_again(second_font_bytes, tmp_path):
+    font = build_sweep_font(second_font_bytes, log_fn=_quiet)
+    path = str(tmp_path / "sweep.ttf")
+    data = _write(font, path)
+    copy = str(tmp_path / "copy.ttf")
+    write_bytes_atomic(copy, data)
+
+    reloaded = load_font(data)
+    assert not attach_base_glyphs(reloaded, copy, data)
+    swept = _contours(reloaded, "sec00")
+    with pytest.raises(RuntimeError, match="already carries trail contours"):
+        build_sweep_font(reloaded, log_fn=_quiet)
+    assert _contours(reloaded, "sec00") == swept
+    assert BASE_GLYPHS_TAG not in reloaded
+
+
+def test_decoration_contours(second_font_bytes):
+    font = load_font(second_font_bytes)
+    glyf = font["glyf"]
+    assert decoration_contours(glyf["sec17"].compile(glyf)) == {}
+
+    add_sweep_trail(font, SEC, trail_count=5)
+    add_arc_trail(font, SEC, layers=3)
+    hand = _contours(load_font(second_font_bytes), "sec17") - 2
+    assert decoration_contours(glyf["sec17"].compile(glyf)) == {"arc": 3, "sweep": 5 * hand}
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+timer_context.py
+
+Seconds-only timer lookup for the second-hand font, for h:mm:ss windows of any length.
+
+The second-hand ligature table maps 3600 mm:ss and 600 m:ss strings to sec00..sec59, but
+the output only depends on the last two digits, and it stops at 59:59: past the first hour
+"1:23:45" starts with the m:ss ligature "1:23" and draws sec23. generate_second_hand_font.py
+--multi-hour replaces it with one chained contextual lookup (GSUB type 6, format 3), tried
+at every position with its two subtables in order:
+
+  1. input [0-5][0-9], lookahead [:]               no substitution: skips a minutes pair
+  2. backtrack [:][0-9], input [0-5][0-9]          pair ligature lookup on the input
+
+The pair ligature lookup (type 4, the 60 ligatures "00".."59" -> sec00..sec59) is not in
+any feature; only rule 2 runs it. Rule 1 consumes the minutes of "m:ss" / "mm:ss" /
+"h:mm:ss" before rule 2 could see them after a colon, so only the final pair becomes the
+hand glyph, whatever the number of hour digits. The digits and colons in front of it are
+empty glyphs with no advance in this font, so the run draws and measures exactly like the
+single ligature glyph did. The whole lookup is a few hundred bytes, independent of the
+window; with it the second hand no longer drops out at 59:59 (clock_timeline.py's second
+ceiling becomes the secondsHandTimerWindowSeconds freeze).
+
+The mm:ss / m:ss table stays the default, and restore_ligature_lookup() turns a contextual
+font back into one, so the minute generators can still use it as their template.
+
+context_report() shapes every string of the ligature mapping through both fonts, and a
+sample of h:mm:ss strings over many hours against sec<ss>, with the timer_shaping.py model.
+
+Dependencies:
+  python3 -m pip install --user fonttools
+"""
+
+from __future__ import annotations
+
+import io
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence
+
+from fontTools.ttLib import TTFont
+from fontTools.ttLib.tables import otTables as ot
+
+from timer_ligatures import OutGlyphFn, build_timer_ligature_subtable, entry_count
+from timer_shaping import TimerShaper, feature_lookup_indices, format_timer, unwrap_subtable
+
+
+# Hours sampled by context_report(): the first day, and every hour width up to four digits.
+PARITY_HOURS = tuple(range(1, 25)) + (99, 100, 999, 1000)
+
+SECONDS_PER_HOUR = 3600
+
+
+def _coverage(glyphs: Sequence[str]) -> ot.Coverage:
+    cov = ot.Coverage()
+    cov.glyphs = list(glyphs)
+    return cov
+
+
+def _chain_subtable(
+    backtrack: Sequence[Sequence[str]],
+    inputs: Sequence[Sequence[str]],
+    lookahead: Sequence[Sequence[str]],
+    nested: Optional[int],
+) -> ot.ChainContextSubst:
+    st = ot.ChainContextSubst()
+    st.Format = 3
+    st.BacktrackCoverage = [_coverage(g) for g in backtrack]
+    st.BacktrackGlyphCount = len(backtrack)
+    st.InputCoverage = [_coverage(g) for g in inputs]
+    st.InputGlyphCount = len(inputs)
+    st.LookAheadCoverage = [_coverage(g) for g in lookahead]
+    st.LookAheadGlyphCount = len(lookahead)
+    st.SubstLookupRecord = []
+    if nested is not None:
+        rec = ot.SubstLookupRecord()
+        rec.SequenceIndex = 0
+        rec.LookupListIndex = nested
+        st.SubstLookupRecord.append(rec)
+    st.SubstCount = len(st.SubstLookupRecord)
+    return st
+
+
+def _nested_indices(lookup: ot.Lookup) -> List[int]:
+    return sorted(
+        {
+            rec.LookupListIndex
+            for st in lookup.SubTable
+            for rec in getattr(unwrap_subtable(st), "SubstLookupRecord", None) or ()
+        }
+    )
+
+
+def find_seconds_context_lookup_index(font: TTFont) -> Optional[int]:
+    """Index of the feature-referenced chained contextual timer lookup, if the font has one."""
+    if "GSUB" not in font:
+        return None
+
+    lookups = font["GSUB"].table.LookupList.Lookup
+    for idx in feature_lookup_indices(font):
+        subtables = [unwrap_subtable(st) for st in lookups[idx].SubTable]
+        if subtables and all(getattr(st, "LookupType", 0) == 6 for st in subtables):
+            return idx
+    return None
+
+
+def install_seconds_context(
+    font: TTFont,
+    lookup_index: int,
+    char_to_glyph: Dict[str, str],
+    out_glyph: OutGlyphFn,
+    log_fn: Callable[[str], None] = print,
+) -> int:
+    """
+    Turns the feature lookup at lookup_index into the contextual seconds lookup and returns
+    the index of its nested pair ligature lookup (reused if the font already has one).
+    """
+    lookups = font["GSUB"].table.LookupList.Lookup
+    lookup = lookups[lookup_index]
+
+    pair = build_timer_ligature_subtable(char_to_glyph, "ss", out_glyph)
+    nested_indices = _nested_indices(lookup) if lookup.LookupType == 6 else []
+    if nested_indices:
+        nested_index = nested_indices[0]
+        nested = lookups[nested_index]
+    else:
+        nested = ot.Lookup()
+        nested.LookupFlag = 0
+        lookups.append(nested)
+        font["GSUB"].table.LookupList.LookupCount = len(lookups)
+        nested_index = len(lookups) - 1
+    nested.LookupType = 4
+    nested.SubTable = [pair]
+    nested.SubTableCount = 1
+
+    digits = [char_to_glyph[str(d)] for d in range(10)]
+    tens = digits[:6]
+    colon = [char_to_glyph[":"]]
+    lookup.LookupType = 6
+    lookup.SubTable = [
+        _chain_subtable([], [tens, digits], [colon], None),
+        _chain_subtable([colon, digits], [tens, digits], [], nested_index),
+    ]
+    lookup.SubTableCount = 2
+
+    log_fn(
+        f"Contextual seconds lookup at index {lookup_index}: 2 rules, "
+        f"{entry_count(pair)} pair ligatures in nested lookup {nested_index}"
+    )
+    return nested_index
+
+
+def _remove_lookup(gsub, index: int) -> None:
+    """Deletes a lookup that no feature references, renumbering nested references past it."""
+    lookups = gsub.LookupList.Lookup
+    del lookups[index]
+    gsub.LookupList.LookupCount = len(lookups)
+    for rec in gsub.FeatureList.FeatureRecord:
+        rec.Feature.LookupListIndex = [i - 1 if i > index else i for i in rec.Feature.LookupListIndex]
+    for lk in lookups:
+        for st in lk.SubTable:
+            for rec in getattr(unwrap_subtable(st), "SubstLookupRecord", None) or ():
+                if rec.LookupListIndex > index:
+                    rec.LookupListIndex -= 1
+
+
+def restore_ligature_lookup(font: TTFont, log_fn: Callable[[str], None] = print) -> Optional[int]:
+    """
+    Turns a contextual seconds lookup back into a plain ligature lookup holding the pair
+    ligatures, drops the nested lookup, and returns the lookup's index (None if the font has
+    no contextual lookup). Callers then replace its subtables with their timer mapping.
+    """
+    idx = find_seconds_context_lookup_index(font)
+    if idx is None:
+        return None
+
+    gsub = font["GSUB"].table
+    lookup = gsub.LookupList.Lookup[idx]
+    nested = _nested_indices(lookup)
+    lookup.LookupType = 4
+    lookup.SubTable = [st for n in nested for st in gsub.LookupList.Lookup[n].SubTable]
+    lookup.SubTableCount = len(lookup.SubTable)
+    for n in reversed(nested):
+        _remove_lookup(gsub, n)
+        if n < idx:
+            idx -= 1
+
+    log_fn(f"Contextual seconds lookup at index {idx} turned back into a ligature lookup")
+    return idx
+
+
+@dataclass
+class ContextReport:
+    ligature_gsub: int
+    context_gsub: int
+    ligature_shape_us: float
+    context_shape_us: float
+    mapping_strings: int = 0
+    hour_strings: int = 0
+    hours: List[int] = field(default_factory=list)
+    # h:mm:ss strings on which the ligature font draws a wrong hand or none.
+    ligature_hour_misses: int = 0
+    mismatches: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches
+
+    def summary_lines(self, limit: int = 10) -> List[str]:
+        saved = self.ligature_gsub - self.context_gsub
+        lines = [
+            f"Contextual seconds lookup: GSUB {self.context_gsub} B vs {self.ligature_gsub} B for the "
+            f"mm:ss / m:ss ligatures (-{saved} B, {self.context_gsub / max(1, self.ligature_gsub) * 100.0:.1f}%)",
+            f"  shaping {self.context_shape_us:.1f} µs vs {self.ligature_shape_us:.1f} µs per string "
+            f"(timer_shaping model, {self.mapping_strings} mapping strings)",
+            f"  h:mm:ss: {self.hour_strings} strings over {len(self.hours)} hours "
+            f"({self.hours[0] if self.hours else 0}..{self.hours[-1] if self.hours else 0}); "
+            f"the ligature font draws a wrong hand or none on {self.ligature_hour_misses}",
+        ]
+        for m in self.mismatches[:limit]:
+            lines.append(f"  MISMATCH {m}")
+        lines.append("  parity OK" if self.ok else f"  parity FAIL ({len(self.mismatches)} strings)")
+        return lines
+
+
+def _mapping_texts() -> List[str]:
+    """Every string of the second-hand ligature mapping: mm:ss, then m:ss."""
+    return [f"{t // 60:02d}:{t % 60:02d}" for t in range(SECONDS_PER_HOUR)] + [
+        f"{t // 60}:{t % 60:02d}" for t in range(600)
+    ]
+
+
+def context_report(
+    ligature: bytes,
+    context: bytes,
+    out_glyph: OutGlyphFn,
+    hours: Sequence[int] = PARITY_HOURS,
+    stride: int = 7,
+) -> ContextReport:
+    """
+    Shaping parity of a contextual second-hand font with the ligature font it replaces:
+    every mm:ss / m:ss string must draw the same glyph, and every stride-th second of each
+    sampled hour must draw out_glyph(h, m, s).
+    """
+    fonts = {"ligature": TTFont(io.BytesIO(ligature), lazy=True), "context": TTFont(io.BytesIO(context), lazy=True)}
+    shapers = {key: TimerShaper(font) for key, font in fonts.items()}
+    texts = _mapping_texts()
+
+    timings = {}
+    for key, shaper in shapers.items():
+        best = float("inf")
+        for _ in range(3):
+            t0 = time.perf_counter()
+            for text in texts:
+                shaper.shape(text)
+            best = min(best, time.perf_counter() - t0)
+        timings[key] = best / len(texts) * 1e6
+
+    mismatches: List[str] = []
+    for text in texts:
+        want = shapers["ligature"].visible_glyphs(text)
+        got = shapers["context"].visible_glyphs(text)
+        if got != want:
+            mismatches.append(f"{text!r}: {got}, ligature font {want}")
+
+    hour_strings = 0
+    ligature_misses = 0
+    for h in hours:
+        # Offset by hour so the samples cover every seconds value across hours.
+        for t in range(h * SECONDS_PER_HOUR + h % stride, (h + 1) * SECONDS_PER_HOUR, stride):
+            text = format_timer(t)
+            want = [out_glyph(h, t % SECONDS_PER_HOUR // 60, t % 60)]
+            got = shapers["context"].visible_glyphs(text)
+            if got != want:
+                mismatches.append(f"{text!r}: {got}, expected {want}")
+            if shapers["ligature"].visible_glyphs(text) != want:
+                ligature_misses += 1
+            hour_strings += 1
+
+    def gsub_bytes(font: TTFont) -> int:
+        return font.reader.tables["GSUB"].length if "GSUB" in font.reader.tables else 0
+
+    return ContextReport(
+        ligature_gsub=gsub_bytes(fonts["ligature"]),
+        context_gsub=gsub_bytes(fonts["context"]),
+        ligature_shape_us=timings["ligature"],
+        context_shape_us=timings["context"],
+        mapping_strings=len(texts),
+        hour_strings=hour_strings,
+        hours=list(hours),
+        ligature_hour_misses=ligature_misses,
+        mismatches=mismatches,
+    )
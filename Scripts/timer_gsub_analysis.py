@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+timer_gsub_analysis.py
+
+Static analysis of the timer ligature lookups, without shaping.
+
+All ligature inputs of a lookup go into one trie, ranked by (subtable, position in its
+LigatureSet) — the order in which a shaper tries them. From that trie:
+
+- shadowed entries: an earlier-ranked ligature matches the same input or a prefix of it
+  (earlier subtable, or a shorter ligature listed first), so the entry can never fire on
+  its own timer text. This is the "m:ss matching the h:mm:ss prefix" hazard.
+- bucket correctness: every entry's timer text is parsed back from its glyphs and the
+  output glyph is compared with the expected bucket (sec<ss>, mh<bucket>, or
+  hs<second-of-hour> in a combined-hands font).
+- effective coverage: every timer string Text(timerInterval:) produces inside the window
+  is walked through the trie; the winning ligature must consume the whole string and
+  produce the expected glyph.
+
+Each check is a bounded walk per entry/timer value, so the whole pass is linear.
+
+A contextual seconds lookup (timer_context.py) has no timer-string ligatures to walk: its
+nested pair ligatures get the shadowing and bucket checks ("ss" -> sec<ss>), and coverage
+is checked by shaping every timer value of a two-hour window (secondsHandTimerWindowSeconds)
+with the timer_shaping.py model.
+
+Dependencies:
+  python3 -m pip install --user fonttools
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from fontTools.ttLib import TTFont
+
+from timer_shaping import TimerShaper, feature_lookup_indices, format_timer, unwrap_subtable
+
+
+TIMER_RE = re.compile(r"^(?:(\d+):)?(\d{1,2}):(\d{2})$")
+PAIR_RE = re.compile(r"^\d{2}$")
+
+# Shaped window for a contextual seconds lookup: WidgetWeaverClockWidgetLiveView's
+# secondsHandTimerWindowSeconds.
+CONTEXT_WINDOW_HOURS = 2
+
+# expected_glyph(hours, minutes, seconds) -> glyph name
+ExpectedGlyphFn = Callable[[int, int, int], str]
+
+
+@dataclass
+class LigEntry:
+    seq: Tuple[str, ...]
+    out: str
+    subtable: int
+    order: int
+
+    @property
+    def rank(self) -> Tuple[int, int]:
+        return (self.subtable, self.order)
+
+
+class _Node:
+    __slots__ = ("children", "entry")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _Node] = {}
+        self.entry: Optional[LigEntry] = None
+
+
+@dataclass
+class TimerGsubAnalysis:
+    lookup_index: int
+    per_subtable: List[int]
+    window_hours: int
+    shadowed: List[Tuple[LigEntry, LigEntry]] = field(default_factory=list)
+    wrong_bucket: List[Tuple[str, str, str]] = field(default_factory=list)
+    unparseable: List[LigEntry] = field(default_factory=list)
+    uncovered: List[Tuple[str, str]] = field(default_factory=list)
+    timer_values_checked: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return not (self.shadowed or self.wrong_bucket or self.unparseable or self.uncovered)
+
+    def summary_lines(self, limit: int = 10) -> List[str]:
+        lines = [
+            f"lookup {self.lookup_index}: subtables {self.per_subtable} "
+            f"({sum(self.per_subtable)} ligatures), window {self.window_hours}h, "
+            f"{self.timer_values_checked} timer values checked"
+        ]
+        for victim, winner in self.shadowed[:limit]:
+            lines.append(
+                f"  SHADOWED {victim.out} (subtable {victim.subtable}, {len(victim.seq)} glyphs) "
+                f"by {winner.out} (subtable {winner.subtable}, {len(winner.seq)} glyphs)"
+            )
+        for text, got, want in self.wrong_bucket[:limit]:
+            lines.append(f"  WRONG BUCKET {text!r}: {got} (expected {want})")
+        for entry in self.unparseable[:limit]:
+            lines.append(f"  UNPARSEABLE input {' '.join(entry.seq)} -> {entry.out}")
+        for text, why in self.uncovered[:limit]:
+            lines.append(f"  UNCOVERED {text!r}: {why}")
+        counts = (len(self.shadowed), len(self.wrong_bucket), len(self.unparseable), len(self.uncovered))
+        lines.append(
+            "  OK" if self.ok else
+            f"  FAIL shadowed={counts[0]} wrong_bucket={counts[1]} unparseable={counts[2]} uncovered={counts[3]}"
+        )
+        return lines
+
+
+def expected_glyph_rule(font: TTFont) -> Tuple[str, ExpectedGlyphFn]:
+    """Infers the bucket rule from the glyph families present (hs**** over mh**** over sec**)."""
+    order = font.getGlyphOrder()
+    if any(g.startswith("hs") and g[2:].isdigit() for g in order):
+        return "hs", lambda h, m, s: f"hs{m * 60 + s:04d}"
+    mh = [g for g in order if g.startswith("mh") and g[2:].isdigit()]
+    if mh:
+        tick = 3600 // len(mh)
+        width = len(mh[0]) - 2
+        return "mh", lambda h, m, s: f"mh{(m * 60 + s) // tick:0{width}d}"
+    return "sec", lambda h, m, s: f"sec{s:02d}"
+
+
+def _entries_for_lookup(font: TTFont, lookup_index: int) -> Tuple[List[LigEntry], List[int]]:
+    lookup = font["GSUB"].table.LookupList.Lookup[lookup_index]
+    entries: List[LigEntry] = []
+    per_subtable: List[int] = []
+    for si, st in enumerate(lookup.SubTable):
+        st = unwrap_subtable(st)
+        if getattr(st, "LookupType", 4) != 4:
+            per_subtable.append(0)
+            continue
+        count = 0
+        for first, ligs in st.ligatures.items():
+            for oi, lig in enumerate(ligs):
+                entries.append(LigEntry((first,) + tuple(lig.Component), lig.LigGlyph, si, oi))
+                count += 1
+        per_subtable.append(count)
+    return entries, per_subtable
+
+
+def _build_trie(entries: List[LigEntry]) -> _Node:
+    root = _Node()
+    for e in entries:
+        node = root
+        for g in e.seq:
+            nxt = node.children.get(g)
+            if nxt is None:
+                nxt = node.children[g] = _Node()
+            node = nxt
+        if node.entry is None or e.rank < node.entry.rank:
+            node.entry = e
+    return root
+
+
+def _winner(root: _Node, seq: Tuple[str, ...]) -> Optional[LigEntry]:
+    """Best-ranked ligature whose input is a prefix of seq (what a shaper applies at seq[0])."""
+    best: Optional[LigEntry] = None
+    node = root
+    for g in seq:
+        node = node.children.get(g)
+        if node is None:
+            break
+        if node.entry is not None and (best is None or node.entry.rank < best.rank):
+            best = node.entry
+    return best
+
+
+def analyze_lookup(
+    font: TTFont,
+    lookup_index: int,
+    expected_glyph: ExpectedGlyphFn,
+    family: str,
+) -> TimerGsubAnalysis:
+    cmap = font.getBestCmap() or {}
+    glyph_to_char = {g: chr(u) for u, g in cmap.items()}
+    char_to_glyph = {chr(u): g for u, g in cmap.items()}
+
+    entries, per_subtable = _entries_for_lookup(font, lookup_index)
+    root = _build_trie(entries)
+
+    result = TimerGsubAnalysis(lookup_index=lookup_index, per_subtable=per_subtable, window_hours=1)
+
+    max_hour = -1
+    for e in entries:
+        # Shadowing: any better-ranked terminal on the entry's own path.
+        winner = _winner(root, e.seq)
+        if winner is not None and winner is not e:
+            result.shadowed.append((e, winner))
+
+        text = "".join(glyph_to_char.get(g, "?") for g in e.seq)
+        m = TIMER_RE.match(text)
+        if m is None:
+            result.unparseable.append(e)
+            continue
+
+        h = int(m.group(1)) if m.group(1) is not None else 0
+        mins = int(m.group(2))
+        secs = int(m.group(3))
+        if m.group(1) is not None:
+            max_hour = max(max_hour, h)
+
+        want = expected_glyph(h, mins, secs)
+        if e.out != want:
+            result.wrong_bucket.append((text, e.out, want))
+
+    # Second-hand fonts stop at 59:59; minute fonts cover every mapped hour.
+    result.window_hours = max(1, max_hour + 1) if family == "mh" else 1
+
+    for t in range(result.window_hours * 3600):
+        text = format_timer(t)
+        h, rem = divmod(t, 3600)
+        mins, secs = divmod(rem, 60)
+        seq = tuple(char_to_glyph[ch] for ch in text)
+        winner = _winner(root, seq)
+        result.timer_values_checked += 1
+        if winner is None:
+            result.uncovered.append((text, "no ligature matches"))
+        elif len(winner.seq) != len(seq):
+            result.uncovered.append((text, f"{winner.out} consumes only {len(winner.seq)} of {len(seq)} glyphs"))
+        elif winner.out != expected_glyph(h, mins, secs):
+            result.uncovered.append((text, f"shapes to {winner.out}, expected {expected_glyph(h, mins, secs)}"))
+
+    return result
+
+
+def analyze_context_lookup(
+    font: TTFont,
+    lookup_index: int,
+    expected_glyph: ExpectedGlyphFn,
+    window_hours: int = CONTEXT_WINDOW_HOURS,
+) -> TimerGsubAnalysis:
+    cmap = font.getBestCmap() or {}
+    glyph_to_char = {g: chr(u) for u, g in cmap.items()}
+
+    lookups = font["GSUB"].table.LookupList.Lookup
+    nested = sorted(
+        {
+            rec.LookupListIndex
+            for st in lookups[lookup_index].SubTable
+            for rec in getattr(unwrap_subtable(st), "SubstLookupRecord", None) or ()
+        }
+    )
+
+    result = TimerGsubAnalysis(lookup_index=lookup_index, per_subtable=[], window_hours=window_hours)
+    for li in nested:
+        entries, per_subtable = _entries_for_lookup(font, li)
+        result.per_subtable.extend(per_subtable)
+        root = _build_trie(entries)
+        for e in entries:
+            winner = _winner(root, e.seq)
+            if winner is not None and winner is not e:
+                result.shadowed.append((e, winner))
+
+            text = "".join(glyph_to_char.get(g, "?") for g in e.seq)
+            if PAIR_RE.match(text) is None:
+                result.unparseable.append(e)
+                continue
+            want = expected_glyph(0, 0, int(text))
+            if e.out != want:
+                result.wrong_bucket.append((text, e.out, want))
+
+    shaper = TimerShaper(font)
+    for t in range(window_hours * 3600):
+        text = format_timer(t)
+        h, rem = divmod(t, 3600)
+        want = expected_glyph(h, rem // 60, rem % 60)
+        result.timer_values_checked += 1
+        try:
+            got = shaper.hand_glyph(text)
+        except ValueError as e:
+            result.uncovered.append((text, str(e)))
+            continue
+        if got != want:
+            result.uncovered.append((text, f"shapes to {got}, expected {want}"))
+
+    return result
+
+
+def analyze_timer_gsub(font: TTFont) -> List[TimerGsubAnalysis]:
+    if "GSUB" not in font:
+        raise RuntimeError("Font has no GSUB")
+
+    family, rule = expected_glyph_rule(font)
+    out: List[TimerGsubAnalysis] = []
+    gsub = font["GSUB"].table
+    for li in feature_lookup_indices(font):
+        subtables = [unwrap_subtable(st) for st in gsub.LookupList.Lookup[li].SubTable]
+        if subtables and all(getattr(st, "LookupType", 4) == 4 for st in subtables):
+            out.append(analyze_lookup(font, li, rule, family))
+        elif subtables and all(getattr(st, "LookupType", 0) == 6 for st in subtables):
+            out.append(analyze_context_lookup(font, li, rule))
+    return out
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+timer_ligatures.py
+
+Direct GSUB ligature subtable builder for the timer mappings.
+
+otl.buildLigatureSubstSubtable takes a dict keyed by glyph-name tuples, so the generators
+used to format every timer string, convert it to a tuple, hash it, and then let the builder
+sort and group ~11,400 entries generically. The timer forms are pure digit arithmetic, so
+this module emits ot.Ligature records straight into their LigatureSets, already in the
+order the generic builder produces (grouped by first glyph, longest first, otherwise in
+generation order).
+
+Supported forms (matching Text(timerInterval:) output plus the mm:ss safety net):
+  "h:mm:ss"  hours from the given range (any number of hour digits)
+  "mm:ss"    00:00 ... 59:59
+  "m:ss"     0:00  ... 9:59
+  "ss"       00 ... 59, the seconds pair alone (nested under a contextual lookup, see
+             timer_context.py)
+
+Parity check against the generic builder:
+  python3 Scripts/timer_ligatures.py
+
+Dependencies:
+  python3 -m pip install --user fonttools
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from fontTools.ttLib.tables import otTables as ot
+
+
+TIMER_FORMS = ("h:mm:ss", "mm:ss", "m:ss", "ss")
+
+# out_glyph(hours, minutes, seconds) -> ligature glyph name
+OutGlyphFn = Callable[[int, int, int], str]
+
+
+def _ligature(components: Tuple[str, ...], lig_glyph: str) -> ot.Ligature:
+    lig = ot.Ligature()
+    lig.Component = components
+    lig.CompCount = len(components) + 1
+    lig.LigGlyph = lig_glyph
+    return lig
+
+
+def build_timer_ligature_subtable(
+    char_to_glyph: Dict[str, str],
+    form: str,
+    out_glyph: OutGlyphFn,
+    hours: Iterable[int] = (0,),
+) -> ot.LigatureSubst:
+    if form not in TIMER_FORMS:
+        raise ValueError(f"Unsupported timer form {form!r}")
+
+    digit = [char_to_glyph[str(d)] for d in range(10)]
+    colon = char_to_glyph[":"]
+
+    # Two-digit fields (00..59) as glyph pairs.
+    pair = [(digit[v // 10], digit[v % 10]) for v in range(60)]
+
+    ligatures: Dict[str, List[ot.Ligature]] = {}
+
+    if form == "h:mm:ss":
+        for h in hours:
+            h_glyphs = [digit[int(ch)] for ch in str(h)]
+            first = h_glyphs[0]
+            prefix = tuple(h_glyphs[1:]) + (colon,)
+            bucket = ligatures.setdefault(first, [])
+            for m in range(60):
+                mt, mo = pair[m]
+                head = prefix + (mt, mo, colon)
+                for s in range(60):
+                    bucket.append(_ligature(head + pair[s], out_glyph(h, m, s)))
+
+        # Mixed hour widths share first glyphs; longest first, stable otherwise.
+        for first, ligs in ligatures.items():
+            if len({lig.CompCount for lig in ligs}) > 1:
+                ligs.sort(key=lambda lig: -lig.CompCount)
+
+    elif form == "mm:ss":
+        for tens in range(6):
+            bucket = ligatures.setdefault(digit[tens], [])
+            for ones in range(10):
+                m = tens * 10 + ones
+                head = (digit[ones], colon)
+                for s in range(60):
+                    bucket.append(_ligature(head + pair[s], out_glyph(0, m, s)))
+
+    elif form == "m:ss":
+        for m in range(10):
+            bucket = ligatures.setdefault(digit[m], [])
+            for s in range(60):
+                bucket.append(_ligature((colon,) + pair[s], out_glyph(0, m, s)))
+
+    else:  # "ss"
+        for s in range(60):
+            ligatures.setdefault(pair[s][0], []).append(_ligature(pair[s][1:], out_glyph(0, 0, s)))
+
+    st = ot.LigatureSubst()
+    st.ligatures = ligatures
+    return st
+
+
+def entry_count(st: ot.LigatureSubst) -> int:
+    return sum(len(v) for v in st.ligatures.values())
+
+
+def generic_mapping(
+    char_to_glyph: Dict[str, str],
+    form: str,
+    out_glyph: OutGlyphFn,
+    hours: Iterable[int] = (0,),
+) -> Dict[Tuple[str, ...], str]:
+    """The string-formatting mapping the generators used to build, for parity checks."""
+    mapping: Dict[Tuple[str, ...], str] = {}
+
+    def seq(text: str) -> Tuple[str, ...]:
+        return tuple(char_to_glyph[ch] for ch in text)
+
+    if form == "h:mm:ss":
+        for h in hours:
+            for m in range(60):
+                for s in range(60):
+                    mapping[seq(f"{h}:{m:02d}:{s:02d}")] = out_glyph(h, m, s)
+    elif form == "mm:ss":
+        for m in range(60):
+            for s in range(60):
+                mapping[seq(f"{m:02d}:{s:02d}")] = out_glyph(0, m, s)
+    elif form == "m:ss":
+        for m in range(10):
+            for s in range(60):
+                mapping[seq(f"{m}:{s:02d}")] = out_glyph(0, m, s)
+    else:
+        for s in range(60):
+            mapping[seq(f"{s:02d}")] = out_glyph(0, 0, s)
+    return mapping
+
+
+def subtable_signature(st: ot.LigatureSubst) -> Dict[str, List[Tuple[Tuple[str, ...], str]]]:
+    return {
+        first: [(tuple(lig.Component), lig.LigGlyph) for lig in ligs]
+        for first, ligs in st.ligatures.items()
+    }
+
+
+def check_parity(
+    char_to_glyph: Dict[str, str],
+    form: str,
+    out_glyph: OutGlyphFn,
+    hours: Sequence[int] = (0,),
+) -> Tuple[bool, float, float]:
+    """Returns (identical, direct_seconds, generic_seconds)."""
+    # Only the parity check needs the generic builder; keep it off the generators' import path.
+    from fontTools.otlLib import builder as otl
+
+    t0 = time.perf_counter()
+    direct = build_timer_ligature_subtable(char_to_glyph, form, out_glyph, hours)
+    t1 = time.perf_counter()
+    generic = otl.buildLigatureSubstSubtable(generic_mapping(char_to_glyph, form, out_glyph, hours))
+    t2 = time.perf_counter()
+
+    a = subtable_signature(direct)
+    b = subtable_signature(generic)
+    same = sorted(a) == sorted(b) and all(a[k] == b[k] for k in a)
+    return same, t1 - t0, t2 - t1
+
+
+def main() -> int:
+    char_to_glyph = {str(d): name for d, name in enumerate(
+        ["zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+    )}
+    char_to_glyph[":"] = "colon"
+
+    def sec_glyph(h: int, m: int, s: int) -> str:
+        return f"sec{s:02d}"
+
+    def mh_glyph(h: int, m: int, s: int) -> str:
+        return f"mh{m * 60 + s:04d}"
+
+    cases = [
+        ("second mm:ss", "mm:ss", sec_glyph, (0,)),
+        ("second m:ss", "m:ss", sec_glyph, (0,)),
+        ("second ss", "ss", sec_glyph, (0,)),
+        ("minute h:mm:ss x2", "h:mm:ss", mh_glyph, tuple(range(2))),
+        ("minute h:mm:ss x24", "h:mm:ss", mh_glyph, tuple(range(24))),
+        ("minute mm:ss", "mm:ss", mh_glyph, (0,)),
+        ("minute m:ss", "m:ss", mh_glyph, (0,)),
+    ]
+
+    ok = True
+    for label, form, fn, hours in cases:
+        same, direct_s, generic_s = check_parity(char_to_glyph, form, fn, hours)
+        ok = ok and same
+        print(
+            f"{'OK  ' if same else 'FAIL'} {label:<20} direct {direct_s * 1000:8.1f}ms  "
+            f"generic {generic_s * 1000:8.1f}ms  (x{generic_s / max(direct_s, 1e-9):.1f})"
+        )
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
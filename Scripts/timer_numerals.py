@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+timer_numerals.py
+
+Timer ligatures for numbering systems other than ASCII digits.
+
+The timer ligature lookups are keyed on the glyphs of "0123456789:". A Text(timerInterval:)
+formatted with another numbering system (Arabic-Indic, Devanagari, ...) would reach the
+font as other code points, no ligature would fire, and the hand would disappear. Adding
+those digits to the ligature table would multiply its ~11,400 entries per system.
+
+Instead, each alternate digit gets its own empty glyph (uni0660 ..., the AGL name of its
+code point, with the ASCII digit's metrics) and a cmap entry, and one single-substitution
+lookup, placed before the ligature lookup in the same features, maps it back to the ASCII
+digit glyph. The ligature table does not grow. The timer separator is ":" in every system.
+
+numeral_report() measures what the coverage costs in a built font (cmap, the lookup, the
+per-glyph loca/hmtx/post entries) and the timer_shaping.py model of the extra lookup pass,
+and shapes a sample of timer strings in every system against the ASCII result.
+
+Dependencies:
+  python3 -m pip install --user fonttools
+"""
+
+from __future__ import annotations
+
+import copy
+import io
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence
+
+from fontTools.ttLib import TTFont
+from fontTools.ttLib.tables import otTables as ot
+from fontTools.ttLib.tables.otBase import OTTableWriter
+
+from timer_shaping import (
+    TimerShaper,
+    apply_context_lookup,
+    apply_ligature_lookup,
+    format_timer,
+    timer_char_glyphs,
+    unwrap_subtable,
+)
+
+
+# Numbering system (CLDR id) -> code point of its zero; digits 0..9 are consecutive.
+NUMERAL_SYSTEMS: Dict[str, int] = {
+    "arab": 0x0660,  # Arabic-Indic (ar)
+    "arabext": 0x06F0,  # Extended Arabic-Indic (fa, ur)
+    "deva": 0x0966,  # Devanagari (hi/mr/ne with -u-nu-deva)
+    "beng": 0x09E6,  # Bengali (bn)
+    "mymr": 0x1040,  # Myanmar (my)
+}
+
+
+def alternate_glyph_name(code_point: int) -> str:
+    return f"uni{code_point:04X}"
+
+
+def translate_digits(text: str, system: str) -> str:
+    zero = NUMERAL_SYSTEMS[system]
+    return "".join(chr(zero + int(ch)) if "0" <= ch <= "9" else ch for ch in text)
+
+
+def _digit_glyphs(font: TTFont) -> List[str]:
+    char_to_glyph = timer_char_glyphs(font)
+    return [char_to_glyph[str(d)] for d in range(10)]
+
+
+def find_numeral_lookup_index(font: TTFont) -> Optional[int]:
+    """Index of the single-substitution lookup that maps alternate digits to ASCII digit glyphs."""
+    if "GSUB" not in font:
+        return None
+
+    digits = set(_digit_glyphs(font))
+    for idx, lookup in enumerate(font["GSUB"].table.LookupList.Lookup):
+        subtables = [unwrap_subtable(st) for st in lookup.SubTable]
+        if not subtables or any(getattr(st, "LookupType", 0) != 1 for st in subtables):
+            continue
+        values = {g for st in subtables for g in st.mapping.values()}
+        if values and values <= digits:
+            return idx
+    return None
+
+
+def _insert_lookup_first(gsub, lookup: ot.Lookup) -> None:
+    """
+    Inserts lookup at index 0 of the LookupList and prepends it to every feature with a timer
+    (ligature or chained contextual) lookup. Nested lookup references move up by one.
+    """
+    lookups = gsub.LookupList.Lookup
+    timer_indices = {
+        i
+        for i, lk in enumerate(lookups)
+        if any(getattr(unwrap_subtable(st), "LookupType", 0) in (4, 6) for st in lk.SubTable)
+    }
+    for lk in lookups:
+        for st in lk.SubTable:
+            for rec in getattr(unwrap_subtable(st), "SubstLookupRecord", None) or ():
+                rec.LookupListIndex += 1
+    lookups.insert(0, lookup)
+    gsub.LookupList.LookupCount = len(lookups)
+
+    for rec in gsub.FeatureList.FeatureRecord:
+        old = list(rec.Feature.LookupListIndex)
+        new = [i + 1 for i in old]
+        if timer_indices.intersection(old):
+            new.insert(0, 0)
+        rec.Feature.LookupListIndex = new
+        rec.Feature.LookupCount = len(new)
+
+
+def add_numeral_normalisation(
+    font: TTFont,
+    systems: Sequence[str] = tuple(NUMERAL_SYSTEMS),
+    log_fn: Callable[[str], None] = print,
+) -> List[str]:
+    """
+    Adds (or refreshes) the alternate digit glyphs, their cmap entries and the normalisation
+    lookup in place; returns the alternate glyph names. Safe to run on a font that already has them.
+    """
+    digits = _digit_glyphs(font)
+    glyf = font["glyf"]
+    hmtx = font["hmtx"]
+
+    mapping: Dict[str, str] = {}
+    code_points: Dict[int, str] = {}
+    for system in systems:
+        zero = NUMERAL_SYSTEMS[system]
+        for d, digit in enumerate(digits):
+            name = alternate_glyph_name(zero + d)
+            if name not in glyf:
+                glyf[name] = copy.deepcopy(glyf[digit])
+            hmtx.metrics[name] = hmtx.metrics[digit]
+            mapping[name] = digit
+            code_points[zero + d] = name
+
+    # Keep the alternates next to the ASCII digits, ahead of any uniform-advance hand tail.
+    alternates = set(mapping)
+    order = [g for g in font.getGlyphOrder() if g not in alternates]
+    at = max(order.index(g) for g in digits) + 1
+    font.setGlyphOrder(order[:at] + list(mapping) + order[at:])
+    if "maxp" in font:
+        font["maxp"].numGlyphs = len(font.getGlyphOrder())
+
+    for st in font["cmap"].tables:
+        if st.isUnicode():
+            st.cmap.update(code_points)
+
+    subtable = ot.SingleSubst()
+    subtable.mapping = mapping
+    gsub = font["GSUB"].table
+    idx = find_numeral_lookup_index(font)
+    if idx is None:
+        lookup = ot.Lookup()
+        lookup.LookupType = 1
+        lookup.LookupFlag = 0
+        lookup.SubTable = [subtable]
+        lookup.SubTableCount = 1
+        _insert_lookup_first(gsub, lookup)
+        idx = 0
+    else:
+        lookup = gsub.LookupList.Lookup[idx]
+        lookup.LookupType = 1
+        lookup.SubTable = [subtable]
+        lookup.SubTableCount = 1
+
+    log_fn(
+        f"Numeral normalisation: {len(systems)} systems ({', '.join(systems)}), "
+        f"{len(mapping)} alternate digits -> ASCII digit glyphs (GSUB lookup {idx})"
+    )
+    return list(mapping)
+
+
+@dataclass
+class NumeralReport:
+    systems: List[str]
+    glyphs: int
+    cmap_bytes: int
+    lookup_bytes: int
+    glyph_bytes: int
+    ligatures: int
+    # Per timer string, timer_shaping model: the normalisation pass vs the ligature (or
+    # contextual) pass.
+    normalise_us: float
+    ligature_us: float
+    strings_checked: int = 0
+    mismatches: List[str] = field(default_factory=list)
+
+    @property
+    def total_bytes(self) -> int:
+        return self.cmap_bytes + self.lookup_bytes + self.glyph_bytes
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches
+
+    def summary_lines(self, limit: int = 10) -> List[str]:
+        lines = [
+            f"Numeral coverage: {len(self.systems)} systems, {self.glyphs} alternate digits, "
+            f"+{self.total_bytes} B (cmap {self.cmap_bytes} B, lookup {self.lookup_bytes} B, "
+            f"loca/hmtx/post/glyf {self.glyph_bytes} B); ligature table unchanged at {self.ligatures} entries",
+            f"  shaping: normalisation pass {self.normalise_us:.2f} µs/string on top of the ligature pass "
+            f"{self.ligature_us:.1f} µs (timer_shaping model, {self.strings_checked} strings per system)",
+        ]
+        for m in self.mismatches[:limit]:
+            lines.append(f"  MISMATCH {m}")
+        lines.append("  parity OK" if self.ok else f"  parity FAIL ({len(self.mismatches)} strings)")
+        return lines
+
+
+def _cmap_bytes_without(font: TTFont, code_points: Sequence[int]) -> int:
+    cmap = font["cmap"]
+    saved = [st.cmap for st in cmap.tables]
+    try:
+        for st in cmap.tables:
+            st.cmap = {u: g for u, g in st.cmap.items() if u not in code_points}
+        return len(cmap.compile(font))
+    finally:
+        for st, m in zip(cmap.tables, saved):
+            st.cmap = m
+
+
+def _lookup_bytes(font: TTFont, lookup_index: int) -> int:
+    gsub = font["GSUB"].table
+    writer = OTTableWriter(tableTag="GSUB")
+    gsub.LookupList.Lookup[lookup_index].compile(writer, font)
+    references = sum(rec.Feature.LookupListIndex.count(lookup_index) for rec in gsub.FeatureList.FeatureRecord)
+    # LookupList offset + one index per feature that runs it.
+    return len(writer.getAllData()) + 2 + 2 * references
+
+
+def numeral_report(data: bytes, window_seconds: int = 3600, stride: int = 61) -> NumeralReport:
+    """
+    Cost and parity of the alternate-digit coverage in a built font. Every stride-th timer
+    value of the window is shaped in ASCII and in each numbering system.
+    """
+    font = TTFont(io.BytesIO(data), lazy=True)
+    idx = find_numeral_lookup_index(font)
+    if idx is None:
+        raise RuntimeError("Font has no numeral normalisation lookup")
+
+    mapping = {}
+    for st in font["GSUB"].table.LookupList.Lookup[idx].SubTable:
+        mapping.update(unwrap_subtable(st).mapping)
+    cmap = font.getBestCmap() or {}
+    code_points = [u for u, g in cmap.items() if g in mapping]
+    systems = [s for s in NUMERAL_SYSTEMS if NUMERAL_SYSTEMS[s] in cmap and cmap[NUMERAL_SYSTEMS[s]] in mapping]
+
+    order = font.getGlyphOrder()
+    short_loca = font["head"].indexToLocFormat == 0
+    n_hmetrics = font["hhea"].numberOfHMetrics
+    post_v2 = font["post"].formatType == 2.0
+    glyph_bytes = 0
+    glyf = font["glyf"]
+    for name in mapping:
+        gid = order.index(name)
+        glyph_bytes += 2 if short_loca else 4
+        glyph_bytes += 4 if gid < n_hmetrics else 2
+        glyph_bytes += 2 + 1 + len(name) if post_v2 else 0
+        glyph_bytes += len(glyf[name].compile(glyf))
+
+    cmap_bytes = font.reader.tables["cmap"].length - _cmap_bytes_without(font, code_points)
+    lookup_bytes = _lookup_bytes(font, idx)
+
+    shaper = TimerShaper(font)
+    ligatures = sum(
+        len(ligs)
+        for lookup in font["GSUB"].table.LookupList.Lookup
+        for st in lookup.SubTable
+        for ligs in (getattr(unwrap_subtable(st), "ligatures", None) or {}).values()
+    )
+    texts = [format_timer(t) for t in range(0, window_seconds, max(1, stride))]
+
+    # Time each lookup pass on its own (best of 3) over the glyph runs it actually sees.
+    pass_us = {"single": 0.0, "ligature": 0.0}
+    runs = [shaper.glyphs_for_text(translate_digits(text, systems[0]) if systems else text) for text in texts]
+    for kind, data in shaper.steps:
+        best = float("inf")
+        for _ in range(3):
+            t0 = time.perf_counter()
+            if kind == "single":
+                out = [[data.get(g, g) for g in run] for run in runs]
+            elif kind == "context":
+                out = [apply_context_lookup(data, run) for run in runs]
+            else:
+                out = [apply_ligature_lookup(data, run) for run in runs]
+            best = min(best, time.perf_counter() - t0)
+        pass_us["single" if kind == "single" else "ligature"] += best / max(1, len(runs)) * 1e6
+        runs = out
+
+    report = NumeralReport(
+        systems=systems,
+        glyphs=len(mapping),
+        cmap_bytes=cmap_bytes,
+        lookup_bytes=lookup_bytes,
+        glyph_bytes=glyph_bytes,
+        ligatures=ligatures,
+        normalise_us=pass_us["single"],
+        ligature_us=pass_us["ligature"],
+        strings_checked=len(texts),
+    )
+    expected = [shaper.hand_glyph(text) for text in texts]
+    for system in systems:
+        translated = [translate_digits(text, system) for text in texts]
+        for text, want in zip(translated, expected):
+            shaped = shaper.visible_glyphs(text)
+            if shaped != [want]:
+                report.mismatches.append(f"{system} {text!r}: {shaped}, expected {want}")
+    return report
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+timer_shaping.py
+
+Minimal GSUB ligature shaping for the clock timer fonts, without a full shaping engine.
+
+Text(timerInterval:countsDown: false) with the en_US_POSIX locale renders elapsed time as
+"m:ss", "mm:ss" or "h:mm:ss". The clock fonts turn that string into one hand glyph through
+a ligature lookup (type 4, possibly wrapped in type 7 extensions once the table overflows).
+This module applies the feature-referenced lookups the way CoreText does for these fonts,
+in lookup-list order: single substitutions (the alternate-digit normalisation, see
+timer_numerals.py) glyph by glyph, ligatures left to right, subtables in order, first
+matching ligature wins.
+
+A multi-hour second-hand font (timer_context.py) uses a chained contextual lookup (type 6,
+format 3) instead: at each position the first subtable whose backtrack, input and lookahead
+coverages match runs its nested lookups on the input glyphs, and shaping resumes after the
+input. The digits and colons it leaves in place draw nothing and have no advance, so
+hand_glyph() looks only at the glyphs that are drawn.
+
+Dependencies:
+  python3 -m pip install --user fonttools
+"""
+
+from __future__ import annotations
+
+from typing import Dict, FrozenSet, List, Sequence, Tuple
+
+from fontTools.ttLib import TTFont
+
+
+TIMER_CHARS = "0123456789:"
+
+# first glyph -> [(remaining components, ligature glyph), ...] in preference order
+LigatureIndex = Dict[str, List[Tuple[Tuple[str, ...], str]]]
+
+# (backtrack nearest first, input, lookahead, [(input position, ("single" | "ligature", data)), ...])
+ContextRule = Tuple[
+    List[FrozenSet[str]], List[FrozenSet[str]], List[FrozenSet[str]], List[Tuple[int, Tuple[str, object]]]
+]
+
+
+def format_timer(seconds: int) -> str:
+    """Timer text for a non-negative elapsed time, as Text(timerInterval:) formats it."""
+    h, rem = divmod(int(seconds), 3600)
+    m, s = divmod(rem, 60)
+    if h > 0:
+        return f"{h}:{m:02d}:{s:02d}"
+    return f"{m}:{s:02d}"
+
+
+def timer_char_glyphs(font: TTFont) -> Dict[str, str]:
+    cmap = font.getBestCmap()
+    if cmap is None:
+        raise RuntimeError("Font has no cmap")
+
+    out: Dict[str, str] = {}
+    for ch in TIMER_CHARS:
+        g = cmap.get(ord(ch))
+        if not g:
+            raise RuntimeError(f"Font cmap missing glyph for character {ch!r} (U+{ord(ch):04X})")
+        out[ch] = g
+    return out
+
+
+def unwrap_subtable(st):
+    if getattr(st, "LookupType", None) == 7 or hasattr(st, "ExtSubTable"):
+        return st.ExtSubTable
+    return st
+
+
+def feature_lookup_indices(font: TTFont) -> List[int]:
+    if "GSUB" not in font:
+        return []
+
+    gsub = font["GSUB"].table
+    if gsub.FeatureList is None:
+        return []
+
+    indices = set()
+    for rec in gsub.FeatureList.FeatureRecord:
+        indices.update(rec.Feature.LookupListIndex)
+    return sorted(indices)
+
+
+def _is_ligature_lookup(font: TTFont, lookup_index: int) -> bool:
+    subtables = [unwrap_subtable(st) for st in font["GSUB"].table.LookupList.Lookup[lookup_index].SubTable]
+    return bool(subtables) and all(getattr(st, "LookupType", 4) == 4 for st in subtables)
+
+
+def ligature_subtable_indices(font: TTFont) -> List[List[LigatureIndex]]:
+    """One entry per feature-referenced ligature lookup, each a list of per-subtable indices."""
+    gsub = font["GSUB"].table
+    out: List[List[LigatureIndex]] = []
+    for li in feature_lookup_indices(font):
+        lookup = gsub.LookupList.Lookup[li]
+        if not _is_ligature_lookup(font, li):
+            continue
+        subtables = [unwrap_subtable(st) for st in lookup.SubTable]
+
+        out.append([_ligature_index(st) for st in subtables])
+    return out
+
+
+def _ligature_index(st) -> LigatureIndex:
+    return {first: [(tuple(lig.Component), lig.LigGlyph) for lig in ligs] for first, ligs in st.ligatures.items()}
+
+
+def _single_mapping(subtables: Sequence) -> Dict[str, str]:
+    mapping: Dict[str, str] = {}
+    for st in reversed(subtables):  # earlier subtables win
+        mapping.update(st.mapping)
+    return mapping
+
+
+def _is_context_lookup(font: TTFont, lookup_index: int) -> bool:
+    subtables = [unwrap_subtable(st) for st in font["GSUB"].table.LookupList.Lookup[lookup_index].SubTable]
+    return bool(subtables) and all(getattr(st, "LookupType", 0) == 6 for st in subtables)
+
+
+def context_rules(font: TTFont, lookup_index: int) -> List[ContextRule]:
+    """The format-3 chained contextual subtables of a lookup, with their nested lookups resolved."""
+    lookups = font["GSUB"].table.LookupList.Lookup
+    rules: List[ContextRule] = []
+    for st in lookups[lookup_index].SubTable:
+        st = unwrap_subtable(st)
+        if st.Format != 3:
+            raise ValueError(f"GSUB lookup {lookup_index}: chained context format {st.Format} is not modelled")
+
+        actions: List[Tuple[int, Tuple[str, object]]] = []
+        for rec in st.SubstLookupRecord:
+            nested = [unwrap_subtable(n) for n in lookups[rec.LookupListIndex].SubTable]
+            if all(getattr(n, "LookupType", 0) == 1 for n in nested):
+                actions.append((rec.SequenceIndex, ("single", _single_mapping(nested))))
+            elif all(getattr(n, "LookupType", 0) == 4 for n in nested):
+                actions.append((rec.SequenceIndex, ("ligature", [_ligature_index(n) for n in nested])))
+            else:
+                raise ValueError(f"GSUB lookup {rec.LookupListIndex}: only single and ligature nested lookups are modelled")
+
+        rules.append(
+            (
+                [frozenset(cov.glyphs) for cov in st.BacktrackCoverage],
+                [frozenset(cov.glyphs) for cov in st.InputCoverage],
+                [frozenset(cov.glyphs) for cov in st.LookAheadCoverage],
+                actions,
+            )
+        )
+    return rules
+
+
+def single_substitutions(font: TTFont) -> Dict[int, Dict[str, str]]:
+    """Lookup index -> glyph mapping of every feature-referenced single-substitution lookup."""
+    gsub = font["GSUB"].table
+    out: Dict[int, Dict[str, str]] = {}
+    for li in feature_lookup_indices(font):
+        subtables = [unwrap_subtable(st) for st in gsub.LookupList.Lookup[li].SubTable]
+        if not subtables or any(getattr(st, "LookupType", 0) != 1 for st in subtables):
+            continue
+        out[li] = _single_mapping(subtables)
+    return out
+
+
+def apply_ligature_lookup(subtables: Sequence[LigatureIndex], glyphs: Sequence[str]) -> List[str]:
+    out: List[str] = []
+    i = 0
+    n = len(glyphs)
+    while i < n:
+        first = glyphs[i]
+        matched = False
+        for index in subtables:
+            for comps, lig_glyph in index.get(first, ()):
+                end = i + 1 + len(comps)
+                if end <= n and tuple(glyphs[i + 1 : end]) == comps:
+                    out.append(lig_glyph)
+                    i = end
+                    matched = True
+                    break
+            if matched:
+                break
+        if not matched:
+            out.append(first)
+            i += 1
+    return out
+
+
+def _match_ligature(subtables: Sequence[LigatureIndex], glyphs: Sequence[str], i: int, end: int):
+    for index in subtables:
+        for comps, lig_glyph in index.get(glyphs[i], ()):
+            stop = i + 1 + len(comps)
+            if stop <= end and tuple(glyphs[i + 1 : stop]) == comps:
+                return lig_glyph, stop
+    return None
+
+
+def apply_context_lookup(rules: Sequence[ContextRule], glyphs: Sequence[str]) -> List[str]:
+    out = list(glyphs)
+    i = 0
+    while i < len(out):
+        for backtrack, inputs, lookahead, actions in rules:
+            end = i + len(inputs)
+            if i < len(backtrack) or end + len(lookahead) > len(out):
+                continue
+            if not (
+                all(out[i + k] in cov for k, cov in enumerate(inputs))
+                and all(out[i - 1 - k] in cov for k, cov in enumerate(backtrack))
+                and all(out[end + k] in cov for k, cov in enumerate(lookahead))
+            ):
+                continue
+
+            # Nested lookups only see the matched input.
+            span = out[i:end]
+            for pos, (kind, data) in actions:
+                if pos >= len(span):
+                    continue
+                if kind == "single":
+                    span[pos] = data.get(span[pos], span[pos])
+                else:
+                    hit = _match_ligature(data, span, pos, len(span))
+                    if hit is not None:
+                        span[pos:hit[1]] = [hit[0]]
+            out[i:end] = span
+            i += len(span)
+            break
+        else:
+            i += 1
+    return out
+
+
+class TimerShaper:
+    """Caches the cmap and lookup indices for repeated timer-string shaping."""
+
+    def __init__(self, font: TTFont) -> None:
+        cmap = font.getBestCmap() or {}
+        self.char_to_glyph = {chr(u): g for u, g in cmap.items()}
+        self.char_to_glyph.update(timer_char_glyphs(font))
+        self.lookups = ligature_subtable_indices(font)
+
+        # Ligature and single-substitution lookups in lookup-list order.
+        singles = single_substitutions(font) if "GSUB" in font else {}
+        ligature_lookups = iter(self.lookups)
+        self.steps: List[Tuple[str, object]] = []
+        for li in feature_lookup_indices(font):
+            if li in singles:
+                self.steps.append(("single", singles[li]))
+            elif _is_ligature_lookup(font, li):
+                self.steps.append(("ligature", next(ligature_lookups)))
+            elif _is_context_lookup(font, li):
+                self.steps.append(("context", context_rules(font, li)))
+
+        glyf = font["glyf"]
+        hmtx = font["hmtx"]
+        self.blank_glyphs = frozenset(
+            g
+            for g in set(self.char_to_glyph.values())
+            if hmtx[g][0] == 0 and glyf[g].numberOfContours == 0
+        )
+
+    def glyphs_for_text(self, text: str) -> List[str]:
+        return [self.char_to_glyph[ch] for ch in text]
+
+    def shape(self, text: str) -> List[str]:
+        glyphs = self.glyphs_for_text(text)
+        for kind, data in self.steps:
+            if kind == "single":
+                glyphs = [data.get(g, g) for g in glyphs]
+            elif kind == "context":
+                glyphs = apply_context_lookup(data, glyphs)
+            else:
+                glyphs = apply_ligature_lookup(data, glyphs)
+        return glyphs
+
+    def visible_glyphs(self, text: str) -> List[str]:
+        """The shaped glyphs without the empty, zero-advance ones, which draw nothing."""
+        return [g for g in self.shape(text) if g not in self.blank_glyphs]
+
+    def hand_glyph(self, text: str) -> str:
+        """The single glyph a timer string draws, or raises if it does not collapse to one."""
+        shaped = self.visible_glyphs(text)
+        if len(shaped) != 1:
+            raise ValueError(f"Timer text {text!r} shaped to {len(shaped)} glyphs: {shaped}")
+        return shaped[0]
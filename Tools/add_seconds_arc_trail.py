@@ -5,113 +5,101 @@ add_seconds_arc_trail.py
 Adds a "motion trail" arc behind the seconds-hand tip by appending one or more
 thin, tapered arc-sector contours to each sec00...sec59 glyph.
 
-The original glyph outlines are preserved by replaying the glyph draw commands,
-so curves remain curves (no flattening into line segments).
+The original glyph contours are kept point for point (with their on/off-curve
+flags), so curves remain curves (no flattening into line segments). The rounded arc
+points are then passed through the shared outline simplification
+(Scripts/glyph_simplify.py); --no-simplify skips it.
+
+Any rotated glyph family can be trailed: --glyph-prefix mh (or --glyph-regex) selects the
+3600 minute-hand glyphs. The bucket -> angle mapping (--degrees-per-bucket, default one
+revolution over the family) sets the tip direction of every arc and the direction of
+motion it trails; the offset between the mapped angle and the hand's actual tip is
+measured once, on the first glyph, so rounding in individual glyphs cannot make the arc
+jump between tip corners. Glyphs are processed in batches (--batch-size) over a process
+pool (--jobs); see Scripts/glyph_family.py.
+
+The arcs are always fitted to the undecorated outlines kept in the font's base-glyph store
+(Scripts/base_glyphs.py) and recorded there as the "arc" layer, drawn over the hand: re-
+running the tool replaces the previous arcs instead of stacking on them, and a sweep trail
+added before or after (Tools/make_seconds_sweep_font.py) is kept. The output font is written
+without the store, which is kept beside it (FONT.ttf.wwbg); a trailed font copied without
+its store is refused rather than trailed again.
 
 Typical usage (in-place overwrite after making a backup):
   python3 WidgetWeaver/Tools/add_seconds_arc_trail.py \
     WidgetWeaverWidget/Clock/WWClockSecondHand-Regular.ttf \
     WidgetWeaverWidget/Clock/WWClockSecondHand-Regular.ttf
+
+Minute-hand font:
+  python3 Tools/add_seconds_arc_trail.py \
+    WidgetWeaverWidget/Clock/WWClockMinuteHand-Regular.ttf /tmp/minute-arc.ttf \
+    --glyph-prefix mh --arc-span-deg 3
 """
 
 import argparse
 import math
 import os
-import tempfile
-from typing import List, Optional, Tuple
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 from fontTools.ttLib import TTFont
-from fontTools.pens.ttGlyphPen import TTGlyphPen
-
-
-Point = Tuple[float, float]
-
-
-def _normalise_rad(a: float) -> float:
-    return (a + math.pi) % (2.0 * math.pi) - math.pi
-
+from fontTools.ttLib.tables._g_l_y_f import Glyph, flagOnCurve
 
-def _split_contours(ttfont: TTFont, glyph_name: str) -> List[List[Point]]:
-    glyf = ttfont["glyf"]
-    glyph = glyf[glyph_name]
-    coords, end_pts, _flags = glyph.getCoordinates(glyf)
-    coords = [(float(x), float(y)) for x, y in coords]
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Scripts"))
 
-    contours: List[List[Point]] = []
-    start = 0
-    for end in list(end_pts):
-        contours.append(coords[start : end + 1])
-        start = end + 1
-    return contours
+from base_glyphs import (  # noqa: E402
+    BASE_GLYPHS_TAG,
+    OVER,
+    attach_base_glyphs,
+    base_glyph_data,
+    read_glyph_store,
+    save_base_glyphs,
+    split_base_glyphs,
+)
+from font_io import FontSource, load_font, write_bytes_atomic  # noqa: E402
+from glyph_family import (  # noqa: E402
+    DEFAULT_BATCH_SIZE,
+    GlyphFamily,
+    GlyphTask,
+    add_family_arguments,
+    contour_ranges,
+    default_angles,
+    family_from_args,
+    glyph_arrays,
+    is_keeper_contour,
+    make_glyph,
+    process_glyphs,
+)
+from glyph_simplify import DEFAULT_TOLERANCE, SimplifyStats  # noqa: E402
 
 
-def _bbox(points: List[Point]) -> Tuple[float, float, float, float]:
-    xs = [p[0] for p in points]
-    ys = [p[1] for p in points]
-    return min(xs), min(ys), max(xs), max(ys)
+SECONDS_FAMILY = GlyphFamily.from_prefix("sec")
 
+DECORATION = "arc"
 
-def _is_keeper_contour(points: List[Point]) -> bool:
-    xmin, ymin, xmax, ymax = _bbox(points)
 
-    # Bottom-left keeper square (roughly 0..32)
-    if xmax <= 40.0 and ymax <= 40.0:
-        return True
+def _normalise_deg(a: float) -> float:
+    return (a + 180.0) % 360.0 - 180.0
 
-    # Top-right keeper square (roughly 968..1000)
-    if xmin >= 960.0 and ymin >= 960.0:
-        return True
 
-    return False
+def _hand_points(points: np.ndarray, end_pts: List[int]) -> np.ndarray:
+    hand = [points[a:b] for a, b in contour_ranges(end_pts) if not is_keeper_contour(points[a:b])]
+    return np.concatenate(hand) if hand else np.zeros((0, 2), dtype=np.float64)
 
 
-def _tip_angle_radius(
-    ttfont: TTFont, glyph_name: str, cx: float, cy: float
-) -> Optional[Tuple[float, float]]:
-    contours = _split_contours(ttfont, glyph_name)
-
-    pts: List[Point] = []
-    for c in contours:
-        if _is_keeper_contour(c):
-            continue
-        pts.extend(c)
-
-    if not pts:
+def _tip(points: np.ndarray, cx: float, cy: float) -> Optional[Tuple[float, float]]:
+    """(angle in font-space radians, radius) of the hand point farthest from the centre."""
+    if len(points) == 0:
         return None
-
-    max_d2 = -1.0
-    tip: Optional[Point] = None
-    for x, y in pts:
-        dx = x - cx
-        dy = y - cy
-        d2 = dx * dx + dy * dy
-        if d2 > max_d2:
-            max_d2 = d2
-            tip = (x, y)
-
-    if tip is None:
-        return None
-
-    angle = math.atan2(tip[1] - cy, tip[0] - cx)
-    radius = math.sqrt(max_d2)
-    return angle, radius
+    d = points - np.array([cx, cy])
+    d2 = (d * d).sum(axis=1)
+    i = int(np.argmax(d2))  # first farthest point, as a linear scan would pick
+    return math.atan2(d[i, 1], d[i, 0]), math.sqrt(float(d2[i]))
 
 
-def _detect_motion_sign(ttfont: TTFont, cx: float, cy: float) -> int:
-    # +1 means angle increases as seconds advance; -1 means angle decreases.
-    a0 = _tip_angle_radius(ttfont, "sec00", cx, cy)
-    a1 = _tip_angle_radius(ttfont, "sec01", cx, cy)
-    if a0 is None or a1 is None:
-        return -1
-
-    d = _normalise_rad(a1[0] - a0[0])
-    if abs(d) < 1e-6:
-        return -1
-    return 1 if d > 0 else -1
-
-
-def _add_arc_sector_contour(
-    pen: TTGlyphPen,
+def _arc_sector(
     cx: float,
     cy: float,
     angle_tip: float,
@@ -121,44 +109,185 @@ def _add_arc_sector_contour(
     thickness: float,
     segments: int,
     taper_min_frac: float,
-) -> None:
-    # Trail spans from tail -> tip.
-    span_rad = math.radians(span_deg) * float(trail_dir)
-    angle_tail = angle_tip + span_rad
-
-    outer: List[Point] = []
-    for j in range(segments + 1):
-        u = float(j) / float(segments)
-        ang = angle_tail + (angle_tip - angle_tail) * u
-        x = cx + r_outer * math.cos(ang)
-        y = cy + r_outer * math.sin(ang)
-        outer.append((x, y))
-
-    inner: List[Point] = []
-    for j in range(segments, -1, -1):
-        u = float(j) / float(segments)
-        ang = angle_tail + (angle_tip - angle_tail) * u
-
-        # Taper thickness: thin at tail, thick at tip.
-        t = thickness * (taper_min_frac + (1.0 - taper_min_frac) * u)
-        r_inner = max(0.0, r_outer - t)
-
-        x = cx + r_inner * math.cos(ang)
-        y = cy + r_inner * math.sin(ang)
-        inner.append((x, y))
-
-    def ip(p: Point) -> Tuple[int, int]:
-        return (int(round(p[0])), int(round(p[1])))
-
-    pen.moveTo(ip(outer[0]))
-    for p in outer[1:]:
-        pen.lineTo(ip(p))
-    for p in inner:
-        pen.lineTo(ip(p))
-    pen.closePath()
-
-
-def main() -> int:
+) -> np.ndarray:
+    # Trail spans from tail -> tip: outer edge tail -> tip, inner edge back, thin at the tail.
+    angle_tail = angle_tip + math.radians(span_deg) * float(trail_dir)
+
+    u = np.arange(segments + 1, dtype=np.float64) / float(segments)
+    ang = angle_tail + (angle_tip - angle_tail) * u
+    outer = np.stack([cx + r_outer * np.cos(ang), cy + r_outer * np.sin(ang)], axis=-1)
+
+    u_in = u[::-1]
+    ang_in = ang[::-1]
+    r_inner = np.maximum(0.0, r_outer - thickness * (taper_min_frac + (1.0 - taper_min_frac) * u_in))
+    inner = np.stack([cx + r_inner * np.cos(ang_in), cy + r_inner * np.sin(ang_in)], axis=-1)
+
+    return np.concatenate([outer, inner])
+
+
+def arc_trail_glyphs(tasks: List[GlyphTask], options: Dict[str, Any]) -> List[Tuple[str, Glyph]]:
+    """
+    Batch worker: the tapered arc sectors of each glyph (the arc layer; process_glyphs
+    draws it over the glyph's contours, which it keeps exactly, with their on/off-curve
+    flags). The tip direction is the glyph's mapped hand angle plus the family's tip
+    offset; the tip radius is measured per glyph.
+    """
+    cx = float(options["cx"])
+    cy = float(options["cy"])
+    trail_dir = int(options["trail_dir"])
+    tip_offset_deg = float(options["tip_offset_deg"])
+    segments = int(options["segments"])
+
+    out: List[Tuple[str, Glyph]] = []
+    for name, angle, data in tasks:
+        points, _flags, end_pts = glyph_arrays(data)
+        contours: List[Tuple[np.ndarray, bytes]] = []
+
+        tip = _tip(_hand_points(points, end_pts), cx, cy)
+        if tip is not None:
+            _, r_tip = tip
+            # Clockwise degrees from 12 o'clock -> font-space (counter-clockwise from +x) radians.
+            angle_tip = math.radians(90.0 - (angle + tip_offset_deg))
+
+            for layer in range(max(1, int(options["layers"]))):
+                layer_span = float(options["arc_span_deg"]) * max(0.0, 1.0 - float(options["span_decay"]) * layer)
+                layer_thickness = float(options["thickness"]) * max(
+                    0.0, 1.0 - float(options["thickness_decay"]) * layer
+                )
+                layer_inset = float(options["radius_inset"]) + float(options["inset_step"]) * layer
+
+                if layer_span <= 0.1 or layer_thickness <= 0.1:
+                    continue
+
+                sector = _arc_sector(
+                    cx,
+                    cy,
+                    angle_tip,
+                    trail_dir,
+                    layer_span,
+                    max(0.0, r_tip - layer_inset),
+                    layer_thickness,
+                    segments,
+                    float(options["taper_min_frac"]),
+                )
+                contours.append((sector, bytes([flagOnCurve]) * len(sector)))
+
+        out.append((name, make_glyph(contours)))
+    return out
+
+
+def add_arc_trail(
+    font: TTFont,
+    glyph_names: List[str],
+    *,
+    angles: Optional[Sequence[float]] = None,
+    arc_span_deg: float = 5.5,
+    radius_inset: float = 10.0,
+    thickness: float = 10.0,
+    segments: int = 20,
+    taper_min_frac: float = 0.22,
+    layers: int = 3,
+    span_decay: float = 0.25,
+    thickness_decay: float = 0.25,
+    inset_step: float = 2.0,
+    flip_direction: bool = False,
+    cx: float = 500.0,
+    cy: float = 500.0,
+    simplify_tolerance: Optional[float] = None,
+    jobs: int = 1,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> SimplifyStats:
+    """
+    Appends the tapered arc layers to each named glyph in place, replacing earlier arcs and
+    keeping other decorations (defaults match the CLI).
+    angles are the hands' mapped angles (degrees clockwise from 12 o'clock; default: one
+    revolution over the names' bucket numbers). The trail runs against the direction of
+    motion they imply; the tip offset is measured once, on the first glyph.
+    """
+    if not glyph_names:
+        return SimplifyStats()
+    angles = list(angles) if angles is not None else default_angles(glyph_names)
+
+    clockwise = len(angles) < 2 or angles[1] >= angles[0]
+    trail_dir = 1 if clockwise else -1  # counter-clockwise in font space behind a clockwise hand
+    if flip_direction:
+        trail_dir = -trail_dir
+
+    points, _flags, end_pts = glyph_arrays(base_glyph_data(font, glyph_names[:1])[glyph_names[0]])
+    ref = _tip(_hand_points(points, end_pts), cx, cy)
+    tip_offset_deg = _normalise_deg(90.0 - math.degrees(ref[0]) - angles[0]) if ref is not None else 0.0
+
+    options = {
+        "arc_span_deg": arc_span_deg,
+        "radius_inset": radius_inset,
+        "thickness": thickness,
+        "segments": segments,
+        "taper_min_frac": taper_min_frac,
+        "layers": layers,
+        "span_decay": span_decay,
+        "thickness_decay": thickness_decay,
+        "inset_step": inset_step,
+        "cx": cx,
+        "cy": cy,
+        "trail_dir": trail_dir,
+        "tip_offset_deg": tip_offset_deg,
+    }
+    return process_glyphs(
+        font,
+        glyph_names,
+        angles,
+        arc_trail_glyphs,
+        options,
+        decoration=DECORATION,
+        placement=OVER,
+        simplify_tolerance=simplify_tolerance,
+        jobs=jobs,
+        batch_size=batch_size,
+    )
+
+
+def build_arc_trail_font(
+    source: FontSource,
+    *,
+    simplify_tolerance: Optional[float] = DEFAULT_TOLERANCE,
+    log_fn: Callable[[str], None] = print,
+    family: GlyphFamily = SECONDS_FAMILY,
+    jobs: int = 1,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    **arc_options,
+) -> TTFont:
+    """In-memory build: source TTFont (modified in place) or bytes -> decorated TTFont."""
+    font = load_font(source)
+    members = family.select(font)
+    if not members:
+        raise RuntimeError(f"No glyphs match {family.regex!r}")
+    names = [name for name, _ in members]
+    store = read_glyph_store(font)
+    stored = [store[name] for name in names if name in store]
+    kept = sorted({d for entry in stored for d in entry.layers} - {DECORATION})
+    log_fn(
+        f"Base glyph store ({BASE_GLYPHS_TAG}): {len(stored)} of {len(names)} undecorated outlines already stored"
+        + (f"; keeping the {', '.join(kept)} layer(s)" if kept else "")
+    )
+
+    t0 = time.perf_counter()
+    stats = add_arc_trail(
+        font,
+        names,
+        angles=family.angles([bucket for _, bucket in members]),
+        simplify_tolerance=simplify_tolerance,
+        jobs=jobs,
+        batch_size=batch_size,
+        **arc_options,
+    )
+    log_fn(f"Arc trail on {len(names)} glyphs ({names[0]}..{names[-1]}) in {time.perf_counter() - t0:.2f} s, {jobs} job(s)")
+
+    if simplify_tolerance is not None:
+        log_fn(stats.summary())
+    return font
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("input_ttf", help="Input WWClockSecondHand-Regular.ttf")
     parser.add_argument("output_ttf", help="Output .ttf (can equal input for in-place overwrite)")
@@ -178,71 +307,40 @@ def main() -> int:
     parser.add_argument("--cx", type=float, default=500.0)
     parser.add_argument("--cy", type=float, default=500.0)
 
-    args = parser.parse_args()
-
-    font = TTFont(args.input_ttf)
-    glyf = font["glyf"]
-    glyph_set = font.getGlyphSet()
-
-    glyph_order = font.getGlyphOrder()
-    sec_glyphs = [g for g in glyph_order if len(g) == 5 and g.startswith("sec") and g[3:].isdigit()]
-
-    motion_sign = _detect_motion_sign(font, args.cx, args.cy)
-    trail_dir = -motion_sign  # opposite direction of motion
-    if args.flip_direction:
-        trail_dir = -trail_dir
-
-    for gname in sec_glyphs:
-        tip = _tip_angle_radius(font, gname, args.cx, args.cy)
-        if tip is None:
-            continue
-        angle_tip, r_tip = tip
-
-        pen = TTGlyphPen(glyph_set)
-        glyph_set[gname].draw(pen)  # preserve original curves exactly
-
-        for layer in range(max(1, int(args.layers))):
-            layer_span = float(args.arc_span_deg) * max(0.0, 1.0 - float(args.span_decay) * float(layer))
-            layer_thickness = float(args.thickness) * max(0.0, 1.0 - float(args.thickness_decay) * float(layer))
-            layer_inset = float(args.radius_inset) + float(args.inset_step) * float(layer)
-
-            if layer_span <= 0.1 or layer_thickness <= 0.1:
-                continue
-
-            r_outer = max(0.0, r_tip - layer_inset)
-
-            _add_arc_sector_contour(
-                pen=pen,
-                cx=float(args.cx),
-                cy=float(args.cy),
-                angle_tip=float(angle_tip),
-                trail_dir=int(trail_dir),
-                span_deg=float(layer_span),
-                r_outer=float(r_outer),
-                thickness=float(layer_thickness),
-                segments=int(args.segments),
-                taper_min_frac=float(args.taper_min_frac),
-            )
-
-        new_glyph = pen.glyph()
-        new_glyph.recalcBounds(glyf)
-        glyf[gname] = new_glyph
-
-    out_dir = os.path.dirname(os.path.abspath(args.output_ttf)) or "."
-    os.makedirs(out_dir, exist_ok=True)
-
-    fd, tmp_path = tempfile.mkstemp(prefix="arctrail_", suffix=".ttf", dir=out_dir)
-    os.close(fd)
-
-    try:
-        font.save(tmp_path)
-        os.replace(tmp_path, args.output_ttf)
-    finally:
-        if os.path.exists(tmp_path):
-            try:
-                os.remove(tmp_path)
-            except OSError:
-                pass
+    parser.add_argument("--simplify-tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--no-simplify", action="store_true")
+    add_family_arguments(parser)
+
+    args = parser.parse_args(argv)
+
+    with open(args.input_ttf, "rb") as f:
+        source = f.read()
+    font = load_font(source)
+    attach_base_glyphs(font, args.input_ttf, source)
+
+    font = build_arc_trail_font(
+        font,
+        simplify_tolerance=None if args.no_simplify else float(args.simplify_tolerance),
+        family=family_from_args(args),
+        jobs=args.jobs,
+        batch_size=args.batch_size,
+        arc_span_deg=float(args.arc_span_deg),
+        radius_inset=float(args.radius_inset),
+        thickness=float(args.thickness),
+        segments=int(args.segments),
+        taper_min_frac=float(args.taper_min_frac),
+        layers=int(args.layers),
+        span_decay=float(args.span_decay),
+        thickness_decay=float(args.thickness_decay),
+        inset_step=float(args.inset_step),
+        flip_direction=bool(args.flip_direction),
+        cx=float(args.cx),
+        cy=float(args.cy),
+    )
+
+    data, store = split_base_glyphs(font)
+    write_bytes_atomic(args.output_ttf, data)
+    save_base_glyphs(args.output_ttf, store, data)
 
     return 0
 
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+add_seconds_sbix_strikes.py
+
+Optional output mode for the seconds-hand font: pre-rendered bitmap strikes (sbix).
+
+Each sec00...sec59 glyph is rasterized offline at the exact dial pixel sizes of the
+.systemSmall clock widget (Scripts/clock_widget_metrics.py), anti-aliased and clipped to
+the dial circle (so the keeper squares never appear in the bitmaps), and embedded as a
+PNG in an sbix strike with ppem == dial pixels. The glyf outlines stay in the font as the
+fallback for any other size.
+
+Trail opacity can be baked into the bitmaps with --trail-count: rotated copies of the glyph
+are composited behind it with decreasing alpha, which outlines cannot express. Use this on
+an undecorated font; on a font already processed by make_seconds_sweep_font.py or
+add_seconds_arc_trail.py the baked copies stack on top of the outline trails.
+
+Note: sbix glyphs are drawn as images, so the SwiftUI .foregroundStyle tint no longer
+applies. The hand colour is baked in with --colour (one font per colour scheme).
+
+A size/performance report is printed per widget family: PNG bytes per strike versus the
+outline raster cost at that size, so strikes can be chosen per family (--families).
+
+Typical usage:
+  python3 Tools/add_seconds_sbix_strikes.py \
+    WidgetWeaverWidget/Clock/WWClockSecondHand-Regular.ttf \
+    /tmp/WWClockSecondHand-sbix.ttf --colour E5D05A --trail-count 4
+
+Dependencies:
+  python3 -m pip install --user fonttools freetype-py numpy
+"""
+
+import argparse
+import io
+import os
+import statistics
+import struct
+import sys
+import time
+import zlib
+from typing import Dict, List, Tuple
+
+import numpy as np
+from fontTools.ttLib import TTFont, newTable
+from fontTools.ttLib.tables.sbixGlyph import Glyph as SbixGlyph
+from fontTools.ttLib.tables.sbixStrike import Strike
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Scripts"))
+
+from clock_widget_metrics import WIDGET_FAMILY_SIZES  # noqa: E402
+from font_io import font_bytes, write_bytes_atomic  # noqa: E402
+from glyph_raster import encode_png_rgba, open_face, render_glyph, render_to_canvas  # noqa: E402
+
+
+def _parse_colour(hex_str: str) -> Tuple[int, int, int]:
+    v = hex_str.strip().lstrip("#")
+    if len(v) != 6:
+        raise argparse.ArgumentTypeError(f"Expected RRGGBB, got {hex_str!r}")
+    return int(v[0:2], 16), int(v[2:4], 16), int(v[4:6], 16)
+
+
+def _circle_mask(size: int) -> np.ndarray:
+    r = size / 2.0
+    yy, xx = np.mgrid[0:size, 0:size]
+    return ((xx + 0.5 - r) ** 2 + (yy + 0.5 - r) ** 2 <= r * r).astype(np.float32)
+
+
+def _coverage(face, glyph_index: int, size: int, angle_deg: float = 0.0) -> np.ndarray:
+    canvas = render_to_canvas(face, glyph_index, size, angle_deg)
+    return np.frombuffer(bytes(canvas), dtype=np.uint8).reshape(size, size).astype(np.float32) / 255.0
+
+
+def render_strike_glyph(
+    face,
+    glyph_index: int,
+    size: int,
+    mask: np.ndarray,
+    colour: Tuple[int, int, int],
+    trail_count: int,
+    trail_step_deg: float,
+    trail_opacity: float,
+) -> Tuple[bytes, int, int]:
+    """Returns (png_bytes, origin_offset_x, origin_offset_y) for one glyph at one strike size."""
+    alpha = np.zeros((size, size), dtype=np.float32)
+
+    # Furthest trail copy first, then "over"-composite towards the hand.
+    for i in range(trail_count, 0, -1):
+        layer_alpha = trail_opacity * (1.0 - float(i - 1) / float(trail_count))
+        a = _coverage(face, glyph_index, size, float(i) * trail_step_deg) * layer_alpha
+        alpha = a + alpha * (1.0 - a)
+
+    a = _coverage(face, glyph_index, size)
+    alpha = a + alpha * (1.0 - a)
+    alpha *= mask
+
+    a8 = np.clip(np.rint(alpha * 255.0), 0, 255).astype(np.uint8)
+
+    rows = np.flatnonzero(a8.any(axis=1))
+    cols = np.flatnonzero(a8.any(axis=0))
+    if rows.size == 0:
+        a8 = np.zeros((1, 1), dtype=np.uint8)
+        top, left, bottom = size - 1, 0, size
+    else:
+        top, bottom = int(rows[0]), int(rows[-1]) + 1
+        left, right = int(cols[0]), int(cols[-1]) + 1
+        a8 = a8[top:bottom, left:right]
+
+    h, w = a8.shape
+    rgba = np.empty((h, w, 4), dtype=np.uint8)
+    rgba[..., 0] = colour[0]
+    rgba[..., 1] = colour[1]
+    rgba[..., 2] = colour[2]
+    rgba[..., 3] = a8
+
+    png = encode_png_rgba(w, h, rgba.tobytes())
+
+    # sbix origin offsets: bitmap lower-left corner relative to the glyph origin, in pixels.
+    return png, left, size - bottom
+
+
+def _outline_raster_us(face, glyph_indices: List[int], size: int) -> float:
+    samples: List[float] = []
+    for gid in glyph_indices:
+        t0 = time.perf_counter()
+        render_glyph(face, gid, size)
+        samples.append((time.perf_counter() - t0) * 1e6)
+    return statistics.median(samples)
+
+
+def _png_decode_us(pngs: List[bytes]) -> float:
+    # zlib inflate of the IDAT payload approximates the per-glyph bitmap decode cost.
+    samples: List[float] = []
+    for png in pngs:
+        (length,) = struct.unpack(">I", png[33:37])
+        idat = png[41 : 41 + length]
+        t0 = time.perf_counter()
+        zlib.decompress(idat)
+        samples.append((time.perf_counter() - t0) * 1e6)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input_ttf", help="Input WWClockSecondHand-Regular.ttf")
+    parser.add_argument("output_ttf", help="Output .ttf (can equal input for in-place overwrite)")
+    parser.add_argument(
+        "--families",
+        nargs="+",
+        default=sorted(WIDGET_FAMILY_SIZES),
+        choices=sorted(WIDGET_FAMILY_SIZES),
+        help="Widget families to embed strikes for",
+    )
+    parser.add_argument("--colour", type=_parse_colour, default=(255, 255, 255), help="Hand colour RRGGBB")
+    parser.add_argument("--trail-count", type=int, default=0)
+    parser.add_argument("--trail-step-deg", type=float, default=1.0)
+    parser.add_argument("--trail-opacity", type=float, default=0.45)
+    args = parser.parse_args()
+
+    with open(args.input_ttf, "rb") as f:
+        source = f.read()
+
+    font = TTFont(io.BytesIO(source))
+    face = open_face(source)
+
+    glyph_order = font.getGlyphOrder()
+    sec_glyphs = [g for g in glyph_order if len(g) == 5 and g.startswith("sec") and g[3:].isdigit()]
+    sec_ids = [font.getGlyphID(g) for g in sec_glyphs]
+
+    # One strike per distinct dial pixel size; several families can share one.
+    sizes: Dict[int, List[str]] = {}
+    for fam in args.families:
+        sizes.setdefault(WIDGET_FAMILY_SIZES[fam].dial_pixels, []).append(fam)
+
+    sbix = newTable("sbix")
+    sbix.version = 1
+    sbix.flags = 1
+    sbix.strikes = {}
+
+    report: List[Tuple[int, List[str], int, float, float]] = []
+    for size in sorted(sizes):
+        mask = _circle_mask(size)
+        strike = Strike(ppem=size, resolution=72)
+        pngs: List[bytes] = []
+        for name, gid in zip(sec_glyphs, sec_ids):
+            png, ox, oy = render_strike_glyph(
+                face,
+                gid,
+                size,
+                mask,
+                args.colour,
+                max(0, int(args.trail_count)),
+                float(args.trail_step_deg),
+                float(args.trail_opacity),
+            )
+            strike.glyphs[name] = SbixGlyph(
+                glyphName=name,
+                graphicType="png ",
+                originOffsetX=ox,
+                originOffsetY=oy,
+                imageData=png,
+            )
+            pngs.append(png)
+        sbix.strikes[size] = strike
+
+        report.append(
+            (
+                size,
+                sizes[size],
+                sum(len(p) for p in pngs),
+                _outline_raster_us(face, sec_ids, size),
+                _png_decode_us(pngs),
+            )
+        )
+
+    font["sbix"] = sbix
+
+    write_bytes_atomic(args.output_ttf, font_bytes(font))
+
+    out_size = os.path.getsize(args.output_ttf)
+    print(f"Font size: {len(source)} → {out_size} bytes (+{out_size - len(source)})")
+    for size, fams, png_bytes, outline_us, decode_us in report:
+        print(
+            f"  strike {size:4d}px [{', '.join(fams)}]: {png_bytes} PNG bytes "
+            f"({png_bytes / max(1, len(sec_glyphs)):.0f}/glyph), "
+            f"outline raster median {outline_us:.1f}µs vs PNG inflate median {decode_us:.1f}µs"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+analyze_timer_gsub.py
+
+Static GSUB analyzer for the clock timer fonts (see Scripts/timer_gsub_analysis.py).
+
+Loads only GSUB, cmap and the glyph order of each font, builds a trie over all ligature
+inputs and reports:
+- entries shadowed by an earlier subtable or a shorter, earlier-listed ligature
+- entries whose output glyph is not the expected sec**/mh**** bucket for their timer text
+- timer strings inside the mapped window that do not shape to the right bucket glyph
+A contextual seconds lookup (generate_second_hand_font.py --multi-hour) is checked through
+its nested pair ligatures and by shaping a two-hour window.
+
+Exits non-zero if any font has a problem, so it can run on every build.
+
+Typical usage:
+  python3 Tools/analyze_timer_gsub.py WidgetWeaverWidget/Clock/*.ttf
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from fontTools.ttLib import TTFont
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Scripts"))
+
+from timer_gsub_analysis import analyze_timer_gsub  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("fonts", nargs="+", help="Timer fonts to analyze")
+    parser.add_argument("--limit", type=int, default=10, help="Issues listed per category")
+    args = parser.parse_args()
+
+    ok = True
+    for path in args.fonts:
+        t0 = time.perf_counter()
+        font = TTFont(path, lazy=True)
+        results = analyze_timer_gsub(font)
+        elapsed = (time.perf_counter() - t0) * 1000.0
+
+        print(f"{os.path.basename(path)} ({elapsed:.0f} ms)")
+        if not results:
+            print("  FAIL no feature-referenced ligature or contextual timer lookup")
+            ok = False
+            continue
+
+        for r in results:
+            for line in r.summary_lines(args.limit):
+                print(line)
+            ok = ok and r.ok
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
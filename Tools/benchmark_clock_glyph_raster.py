@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+benchmark_clock_glyph_raster.py
+
+Offline rasterization cost benchmark for the clock hand glyphs (sec** and mh****).
+
+Every glyph is loaded and rendered with FreeType (unhinted, anti-aliased) at the dial
+pixel sizes the .systemSmall clock widget uses (see Scripts/clock_widget_metrics.py).
+Each render is timed several times and the per-glyph median is kept. The report shows,
+per family and size, the median / p99 / worst glyphs with their contour and point counts.
+
+Passing --compare runs the same benchmark on a second build and prints the ratios, so a
+trail design that makes the hands noticeably more expensive can be rejected before it
+ships (--max-ratio turns that into a non-zero exit code).
+
+Typical usage:
+  python3 Tools/benchmark_clock_glyph_raster.py \
+    WidgetWeaverWidget/Clock/WWClockSecondHand-Regular.ttf \
+    --compare /tmp/WWClockSecondHand-trail.ttf --max-ratio 1.5
+
+Dependencies:
+  python3 -m pip install --user freetype-py
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+import freetype
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Scripts"))
+
+from clock_widget_metrics import dial_pixel_sizes  # noqa: E402
+from glyph_raster import LOAD_FLAGS, family_glyphs, open_face  # noqa: E402
+
+
+# (glyph_name, median_ns, contours, points)
+GlyphTiming = Tuple[str, int, int, int]
+
+
+def _percentile(sorted_values: List[int], pct: float) -> int:
+    if not sorted_values:
+        return 0
+    k = min(len(sorted_values) - 1, max(0, int(round((pct / 100.0) * (len(sorted_values) - 1)))))
+    return sorted_values[k]
+
+
+def _time_glyph(face: freetype.Face, glyph_index: int, repeat: int) -> Tuple[int, int, int]:
+    samples: List[int] = []
+    contours = points = 0
+    slot = face.glyph
+    for _ in range(repeat):
+        t0 = time.perf_counter_ns()
+        face.load_glyph(glyph_index, LOAD_FLAGS)
+        slot.render(freetype.FT_RENDER_MODE_NORMAL)
+        samples.append(time.perf_counter_ns() - t0)
+
+    contours = slot.outline.n_contours
+    points = slot.outline.n_points
+    return int(statistics.median(samples)), contours, points
+
+
+def benchmark_font(
+    path: str,
+    sizes: List[int],
+    families: List[str],
+    repeat: int,
+    warmup: int,
+) -> Dict[Tuple[str, int], List[GlyphTiming]]:
+    face = open_face(path)
+    glyphs = family_glyphs(face, families)
+
+    results: Dict[Tuple[str, int], List[GlyphTiming]] = {}
+    for size in sizes:
+        face.set_pixel_sizes(size, size)
+        for fam in families:
+            entries = glyphs.get(fam, [])
+            if not entries:
+                continue
+
+            for _, idx in entries[:warmup]:
+                face.load_glyph(idx, LOAD_FLAGS)
+                face.glyph.render(freetype.FT_RENDER_MODE_NORMAL)
+
+            timings: List[GlyphTiming] = []
+            for name, idx in entries:
+                med, contours, points = _time_glyph(face, idx, repeat)
+                timings.append((name, med, contours, points))
+            results[(fam, size)] = timings
+
+    return results
+
+
+def _summarise(timings: List[GlyphTiming]) -> Dict[str, float]:
+    ns = sorted(t[1] for t in timings)
+    return {
+        "glyphs": float(len(timings)),
+        "median_us": statistics.median(ns) / 1000.0,
+        "p99_us": _percentile(ns, 99.0) / 1000.0,
+        "max_us": ns[-1] / 1000.0,
+        "contours_avg": statistics.fmean(t[2] for t in timings),
+        "contours_max": float(max(t[2] for t in timings)),
+        "points_avg": statistics.fmean(t[3] for t in timings),
+        "points_max": float(max(t[3] for t in timings)),
+    }
+
+
+def print_report(
+    label: str,
+    results: Dict[Tuple[str, int], List[GlyphTiming]],
+    worst: int,
+) -> Dict[Tuple[str, int], Dict[str, float]]:
+    print(f"== {label}")
+    summaries: Dict[Tuple[str, int], Dict[str, float]] = {}
+    for (fam, size), timings in sorted(results.items()):
+        s = _summarise(timings)
+        summaries[(fam, size)] = s
+        print(
+            f"  {fam:>3} @ {size:4d}px  glyphs={int(s['glyphs']):4d}  "
+            f"median={s['median_us']:8.1f}µs  p99={s['p99_us']:8.1f}µs  max={s['max_us']:8.1f}µs  "
+            f"contours avg/max={s['contours_avg']:.1f}/{int(s['contours_max'])}  "
+            f"points avg/max={s['points_avg']:.1f}/{int(s['points_max'])}"
+        )
+        for name, ns, contours, points in sorted(timings, key=lambda t: t[1], reverse=True)[:worst]:
+            print(f"      worst {name}: {ns / 1000.0:8.1f}µs  contours={contours}  points={points}")
+    return summaries
+
+
+def print_comparison(
+    base: Dict[Tuple[str, int], Dict[str, float]],
+    cand: Dict[Tuple[str, int], Dict[str, float]],
+) -> float:
+    print("== Comparison (candidate / baseline)")
+    worst_ratio = 0.0
+    for key in sorted(set(base) & set(cand)):
+        b = base[key]
+        c = cand[key]
+        med_ratio = c["median_us"] / b["median_us"] if b["median_us"] else float("inf")
+        p99_ratio = c["p99_us"] / b["p99_us"] if b["p99_us"] else float("inf")
+        pts_ratio = c["points_avg"] / b["points_avg"] if b["points_avg"] else float("inf")
+        worst_ratio = max(worst_ratio, med_ratio, p99_ratio)
+        fam, size = key
+        print(
+            f"  {fam:>3} @ {size:4d}px  median x{med_ratio:5.2f}  p99 x{p99_ratio:5.2f}  "
+            f"points x{pts_ratio:5.2f}  contours {b['contours_avg']:.1f} → {c['contours_avg']:.1f}"
+        )
+    return worst_ratio
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("font_ttf", help="Font to benchmark (baseline when --compare is used)")
+    parser.add_argument("--compare", help="Second font build to benchmark against font_ttf")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=None,
+        help="Pixel sizes (default: widget dial sizes from clock_widget_metrics)",
+    )
+    parser.add_argument("--families", nargs="+", default=["sec", "mh"], choices=["sec", "mh"])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--worst", type=int, default=3, help="Worst glyphs listed per family/size")
+    parser.add_argument(
+        "--max-ratio",
+        type=float,
+        default=None,
+        help="Exit 1 if candidate median/p99 exceeds baseline by this factor",
+    )
+    args = parser.parse_args()
+
+    sizes = args.sizes or dial_pixel_sizes()
+    repeat = max(1, int(args.repeat))
+
+    base_results = benchmark_font(args.font_ttf, sizes, args.families, repeat, args.warmup)
+    base_summary = print_report(args.font_ttf, base_results, args.worst)
+
+    if not args.compare:
+        return 0
+
+    cand_results = benchmark_font(args.compare, sizes, args.families, repeat, args.warmup)
+    cand_summary = print_report(args.compare, cand_results, args.worst)
+
+    worst_ratio = print_comparison(base_summary, cand_summary)
+
+    max_ratio: Optional[float] = args.max_ratio
+    if max_ratio is not None and worst_ratio > max_ratio:
+        print(f"FAIL: candidate raster cost x{worst_ratio:.2f} exceeds --max-ratio {max_ratio:.2f}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
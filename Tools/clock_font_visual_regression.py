@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+clock_font_visual_regression.py
+
+Render-and-diff visual regression harness for the clock hand fonts.
+
+For each font, a set of timer positions is shaped through the font's own GSUB ligatures
+(Scripts/timer_shaping.py), so the check covers the timer-text -> glyph mapping as well as
+the outlines. Each resulting hand glyph is rendered with FreeType at a widget dial size and
+clipped to the dial circle, like the clipShape(Circle()) in WidgetWeaverClockWidgetLiveView,
+which hides the keeper squares. Renders are fanned out over a process pool and diffed
+against stored goldens with a per-pixel tolerance.
+
+Positions:
+- second-hand fonts: all 60 second positions (mixing m:ss and mm:ss timer texts)
+- minute-hand fonts: every --minute-stride seconds of the hour (default 5 => 720 positions),
+  alternating m:ss/mm:ss and h:mm:ss timer texts
+
+Goldens are one uint8 .npy stack (memory-mapped by the workers) plus a .json sidecar per
+font and size. Record them from a known-good build with --update, then run without it after
+regenerating:
+
+  python3 Tools/clock_font_visual_regression.py --goldens .clock-goldens --update
+  python3 -u Scripts/generate_minute_hand_font.py
+  python3 Tools/clock_font_visual_regression.py --goldens .clock-goldens
+
+Dependencies:
+  python3 -m pip install --user fonttools freetype-py numpy
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from fontTools.ttLib import TTFont
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Scripts"))
+
+from clock_widget_metrics import dial_pixel_sizes  # noqa: E402
+from glyph_raster import open_face, render_to_canvas  # noqa: E402
+from timer_shaping import TimerShaper, format_timer  # noqa: E402
+
+
+CLOCK_DIR = os.path.join("WidgetWeaverWidget", "Clock")
+
+DEFAULT_FONTS = [
+    os.path.join(CLOCK_DIR, "WWClockSecondHand-Regular.ttf"),
+    os.path.join(CLOCK_DIR, "WWClockMinuteHand-Regular.ttf"),
+    os.path.join(CLOCK_DIR, "WWClockMinuteHandIcon-Regular.ttf"),
+]
+
+# (timer text, glyph name, glyph index)
+Position = Tuple[str, str, int]
+
+
+def second_positions() -> List[int]:
+    # One timer value per second position, spread over the minutes so both the m:ss and
+    # mm:ss subtables are exercised.
+    return [s + 60 * ((s * 7) % 60) for s in range(60)]
+
+
+def minute_positions(stride: int, window_hours: int) -> List[int]:
+    out: List[int] = []
+    for i, t in enumerate(range(0, 3600, stride)):
+        hour = i % window_hours if window_hours > 0 else 0
+        out.append(t + 3600 * hour)
+    return out
+
+
+def timer_positions(font_path: str, minute_stride: int, window_hours: int) -> List[Position]:
+    font = TTFont(font_path, lazy=True)
+    shaper = TimerShaper(font)
+    is_minute_font = any(n.startswith("mh") for n in font.getGlyphOrder())
+
+    values = minute_positions(minute_stride, window_hours) if is_minute_font else second_positions()
+
+    out: List[Position] = []
+    for value in values:
+        text = format_timer(value)
+        name = shaper.hand_glyph(text)
+        out.append((text, name, font.getGlyphID(name)))
+    return out
+
+
+def circle_mask(size: int) -> np.ndarray:
+    r = size / 2.0
+    yy, xx = np.mgrid[0:size, 0:size]
+    d2 = (xx + 0.5 - r) ** 2 + (yy + 0.5 - r) ** 2
+    return (d2 <= r * r).astype(np.uint8)
+
+
+# Worker state (one face + golden stack per process).
+_W: Dict[str, object] = {}
+
+
+def _init_worker(font_path: str, size: int, golden_path: Optional[str]) -> None:
+    _W["face"] = open_face(font_path)
+    _W["size"] = size
+    _W["mask"] = circle_mask(size)
+    _W["golden"] = np.load(golden_path, mmap_mode="r") if golden_path else None
+
+
+def _render(glyph_index: int) -> np.ndarray:
+    size = int(_W["size"])  # type: ignore[arg-type]
+    canvas = render_to_canvas(_W["face"], glyph_index, size)
+    img = np.frombuffer(bytes(canvas), dtype=np.uint8).reshape(size, size)
+    return img * _W["mask"]  # type: ignore[operator]
+
+
+def _render_chunk(chunk: List[Tuple[int, int]]) -> List[Tuple[int, np.ndarray]]:
+    return [(pos, _render(gid)) for pos, gid in chunk]
+
+
+def _diff_chunk(args: Tuple[List[Tuple[int, int]], int, bool]) -> List[Tuple[int, int, int, Optional[np.ndarray]]]:
+    chunk, pixel_tolerance, keep_images = args
+    golden = _W["golden"]
+    out = []
+    for pos, gid in chunk:
+        img = _render(gid)
+        ref = np.asarray(golden[pos])  # type: ignore[index]
+        delta = np.abs(img.astype(np.int16) - ref.astype(np.int16))
+        bad = int(np.count_nonzero(delta > pixel_tolerance))
+        out.append((pos, bad, int(delta.max()), img if (keep_images and bad) else None))
+    return out
+
+
+def _chunks(items: List[Tuple[int, int]], n: int) -> List[List[Tuple[int, int]]]:
+    size = max(1, (len(items) + n - 1) // n)
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _golden_paths(goldens_dir: str, font_path: str, size: int) -> Tuple[str, str]:
+    stem = os.path.splitext(os.path.basename(font_path))[0]
+    base = os.path.join(goldens_dir, f"{stem}@{size}px")
+    return base + ".npy", base + ".json"
+
+
+def _write_pgm(path: str, img: np.ndarray) -> None:
+    h, w = img.shape
+    with open(path, "wb") as f:
+        f.write(f"P5 {w} {h} 255\n".encode("ascii"))
+        f.write(np.ascontiguousarray(img, dtype=np.uint8).tobytes())
+
+
+def run_font(
+    font_path: str,
+    size: int,
+    args: argparse.Namespace,
+) -> bool:
+    t0 = time.perf_counter()
+    positions = timer_positions(font_path, args.minute_stride, args.window_hours)
+    work = [(i, gid) for i, (_, _, gid) in enumerate(positions)]
+    npy_path, json_path = _golden_paths(args.goldens, font_path, size)
+    label = f"{os.path.basename(font_path)} @ {size}px"
+
+    if args.update:
+        os.makedirs(args.goldens, exist_ok=True)
+        stack = np.zeros((len(positions), size, size), dtype=np.uint8)
+        with ProcessPoolExecutor(args.jobs, initializer=_init_worker, initargs=(font_path, size, None)) as pool:
+            for results in pool.map(_render_chunk, _chunks(work, args.jobs * 4)):
+                for pos, img in results:
+                    stack[pos] = img
+        np.save(npy_path, stack)
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump({"texts": [p[0] for p in positions], "glyphs": [p[1] for p in positions]}, f)
+        print(f"{label}: recorded {len(positions)} goldens in {time.perf_counter() - t0:.2f}s")
+        return True
+
+    if not (os.path.exists(npy_path) and os.path.exists(json_path)):
+        print(f"{label}: FAIL no goldens at {npy_path} (record them with --update)")
+        return False
+
+    with open(json_path, "r", encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta["texts"] != [p[0] for p in positions]:
+        print(f"{label}: FAIL golden positions differ (re-record with --update)")
+        return False
+
+    failures: List[Tuple[int, int, int]] = []
+    keep = bool(args.diff_dir)
+    golden = np.load(npy_path, mmap_mode="r")
+    tasks = [(c, args.pixel_tolerance, keep) for c in _chunks(work, args.jobs * 4)]
+    with ProcessPoolExecutor(args.jobs, initializer=_init_worker, initargs=(font_path, size, npy_path)) as pool:
+        for results in pool.map(_diff_chunk, tasks):
+            for pos, bad, max_delta, img in results:
+                if bad <= args.max_diff_pixels:
+                    continue
+                failures.append((pos, bad, max_delta))
+                if img is not None and len(failures) <= args.max_diff_images:
+                    os.makedirs(args.diff_dir, exist_ok=True)
+                    ref = np.asarray(golden[pos])
+                    delta = np.abs(img.astype(np.int16) - ref.astype(np.int16)).astype(np.uint8)
+                    text = positions[pos][0].replace(":", "-")
+                    stem = os.path.splitext(os.path.basename(font_path))[0]
+                    _write_pgm(
+                        os.path.join(args.diff_dir, f"{stem}@{size}px_{text}.pgm"),
+                        np.hstack([ref, img, delta]),
+                    )
+
+    elapsed = time.perf_counter() - t0
+    if not failures:
+        print(f"{label}: OK {len(positions)} positions in {elapsed:.2f}s")
+        return True
+
+    print(f"{label}: FAIL {len(failures)}/{len(positions)} positions differ ({elapsed:.2f}s)")
+    for pos, bad, max_delta in sorted(failures, key=lambda f: f[1], reverse=True)[:10]:
+        text, name, _ = positions[pos]
+        was = meta["glyphs"][pos]
+        print(f"    {text:>8} -> {name} (golden {was}): {bad} px over tolerance, max delta {max_delta}")
+    return False
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("fonts", nargs="*", default=DEFAULT_FONTS, help="Fonts to check (default: shipped clock fonts)")
+    parser.add_argument("--goldens", required=True, help="Directory holding the golden renders")
+    parser.add_argument("--update", action="store_true", help="Record goldens instead of diffing")
+    parser.add_argument("--sizes", type=int, nargs="+", default=None, help="Dial pixel sizes (default: smallest widget dial)")
+    parser.add_argument("--minute-stride", type=int, default=5, help="Seconds between sampled minute positions")
+    parser.add_argument("--window-hours", type=int, default=2, help="Hour values mixed into minute timer texts")
+    parser.add_argument("--pixel-tolerance", type=int, default=8, help="Per-pixel coverage delta ignored (0..255)")
+    parser.add_argument("--max-diff-pixels", type=int, default=0, help="Pixels over tolerance allowed per position")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--diff-dir", default=None, help="Write golden|actual|delta PGM strips for failures here")
+    parser.add_argument("--max-diff-images", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    if 3600 % args.minute_stride != 0:
+        raise SystemExit("--minute-stride must divide 3600 evenly")
+
+    args.jobs = max(1, int(args.jobs))
+    sizes = args.sizes or dial_pixel_sizes()[:1]
+
+    ok = True
+    for font_path in args.fonts:
+        for size in sizes:
+            ok = run_font(font_path, size, args) and ok
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+explore_trail_designs.py
+
+Parameter-sweep explorer for the seconds-hand trail designs.
+
+Takes value ranges for the sweep-trail knobs (make_seconds_sweep_font.py) and the arc-trail
+knobs (add_seconds_arc_trail.py), builds every combination in a process pool and reports,
+per variant:
+- font size in bytes
+- outline point count over sec00...sec59
+- raster cost: median FreeType render time per sec** glyph at the smallest dial size
+
+The base font is decoded once in the parent before the pool starts; forked workers inherit
+it and each variant restores the undecorated sec** outlines (from the base-glyph store when
+the template is already trailed, see Scripts/base_glyphs.py) and an empty set of trail
+layers, so no variant re-reads or re-parses the template, and none inherits the previous
+variant's trail. Sizes are those of the font as written, without the store.
+
+A contact sheet PNG (one row per variant, in report order) shows representative positions,
+so designs can be picked by eye and then checked against the numbers.
+
+Ranges are "start:stop:step" (inclusive), a comma list, or a single value. A trail pass runs
+when any of its knobs is given (or with --sweep / --arc for its defaults).
+
+Typical usage:
+  python3 Tools/explore_trail_designs.py \
+    WidgetWeaverWidget/Clock/WWClockSecondHand-Regular.ttf /tmp/trail-explore \
+    --trail-count 3:7:2 --trail-step-deg 0.5,1.0 --layers 1:3:1
+
+Dependencies:
+  python3 -m pip install --user fonttools freetype-py numpy
+"""
+
+import argparse
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+import freetype
+import numpy as np
+from fontTools.ttLib import TTFont
+from fontTools.ttLib.tables._g_l_y_f import Glyph
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Scripts"))
+
+from add_seconds_arc_trail import add_arc_trail  # noqa: E402
+from base_glyphs import (  # noqa: E402
+    StoredGlyph,
+    attach_base_glyphs,
+    base_glyph_data,
+    split_base_glyphs,
+    write_glyph_store,
+)
+from clock_widget_metrics import dial_pixel_sizes  # noqa: E402
+from glyph_raster import LOAD_FLAGS, encode_png_rgba, open_face, render_to_canvas  # noqa: E402
+from glyph_simplify import DEFAULT_TOLERANCE, simplify_font_glyphs  # noqa: E402
+from make_seconds_sweep_font import add_sweep_trail  # noqa: E402
+
+
+# knob -> value type
+SWEEP_KNOBS = {
+    "trail_count": int,
+    "trail_step_deg": float,
+    "scale_step": float,
+}
+ARC_KNOBS = {
+    "layers": int,
+    "span_decay": float,
+    "thickness_decay": float,
+    "inset_step": float,
+    "taper_min_frac": float,
+}
+
+CONTACT_SECONDS = (0, 8, 23, 41)
+
+_BASE: Optional[TTFont] = None
+_PRISTINE: Dict[str, bytes] = {}
+_SEC_GLYPHS: List[str] = []
+
+
+def parse_range(text: str, kind: type) -> List:
+    """'a:b:step' (inclusive), 'a,b,c' or 'a'."""
+    if ":" in text:
+        parts = [float(p) for p in text.split(":")]
+        if len(parts) != 3 or parts[2] <= 0.0:
+            raise argparse.ArgumentTypeError(f"Bad range {text!r} (expected start:stop:step)")
+        start, stop, step = parts
+        values = []
+        i = 0
+        while start + i * step <= stop + 1e-9:
+            values.append(start + i * step)
+            i += 1
+    else:
+        values = [float(p) for p in text.split(",") if p.strip()]
+    return [int(round(v)) if kind is int else round(v, 6) for v in values]
+
+
+def _load_base(source: bytes, path: str) -> None:
+    global _BASE, _PRISTINE, _SEC_GLYPHS
+    font = TTFont(io.BytesIO(source))
+    attach_base_glyphs(font, path, source)
+    _SEC_GLYPHS = [g for g in font.getGlyphOrder() if len(g) == 5 and g.startswith("sec") and g[3:].isdigit()]
+    _PRISTINE = base_glyph_data(font, _SEC_GLYPHS)
+    # Decode everything save() touches, so forked workers share it copy-on-write.
+    for tag in font.keys():
+        if tag != "GlyphOrder":
+            font[tag]
+    _BASE = font
+
+
+def _init_worker(source: bytes, path: str) -> None:
+    if _BASE is None:  # spawn start method: nothing inherited
+        _load_base(source, path)
+
+
+def _build_variant(
+    index: int,
+    sweep: Optional[Dict],
+    arc: Optional[Dict],
+    tolerance: float,
+    raster_px: int,
+    repeat: int,
+    tile_px: int,
+    out_dir: Optional[str],
+) -> Dict:
+    font = _BASE
+    assert font is not None
+    glyf = font["glyf"]
+
+    t0 = time.perf_counter()
+    for name, data in _PRISTINE.items():
+        g = Glyph(data)
+        g.expand(glyf)
+        glyf[name] = g
+    write_glyph_store(font, {name: StoredGlyph(data) for name, data in _PRISTINE.items()})
+
+    if sweep is not None:
+        add_sweep_trail(font, _SEC_GLYPHS, **sweep)
+    if arc is not None:
+        add_arc_trail(font, _SEC_GLYPHS, **arc)
+    if tolerance >= 0.0:
+        simplify_font_glyphs(font, _SEC_GLYPHS, tolerance)
+
+    points = sum(len(glyf[n].getCoordinates(glyf)[0]) for n in _SEC_GLYPHS)
+
+    data, _store = split_base_glyphs(font)
+    build_ms = (time.perf_counter() - t0) * 1000.0
+
+    if out_dir:
+        with open(os.path.join(out_dir, f"variant_{index:03d}.ttf"), "wb") as f:
+            f.write(data)
+
+    face = open_face(data)
+    gids = [face.get_name_index(n.encode("ascii")) for n in _SEC_GLYPHS]
+
+    face.set_pixel_sizes(raster_px, raster_px)
+    slot = face.glyph
+    medians: List[int] = []
+    for gid in gids:
+        samples: List[int] = []
+        for _ in range(repeat):
+            t = time.perf_counter_ns()
+            face.load_glyph(gid, LOAD_FLAGS)
+            slot.render(freetype.FT_RENDER_MODE_NORMAL)
+            samples.append(time.perf_counter_ns() - t)
+        medians.append(int(statistics.median(samples)))
+
+    tiles = [
+        bytes(render_to_canvas(face, face.get_name_index(f"sec{s:02d}".encode("ascii")), tile_px))
+        for s in CONTACT_SECONDS
+    ]
+
+    return {
+        "index": index,
+        "sweep": sweep,
+        "arc": arc,
+        "bytes": len(data),
+        "points": points,
+        "raster_median_us": statistics.median(medians) / 1000.0,
+        "raster_worst_us": max(medians) / 1000.0,
+        "build_ms": build_ms,
+        "tiles": tiles,
+    }
+
+
+def _combinations(grid: Dict[str, List]) -> List[Dict]:
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+
+
+def _contact_sheet(results: Sequence[Dict], tile_px: int, gap: int = 2) -> bytes:
+    cols = len(CONTACT_SECONDS)
+    w = cols * tile_px + (cols - 1) * gap
+    h = len(results) * tile_px + (len(results) - 1) * gap
+
+    sheet = np.full((h, w), 40, dtype=np.uint8)
+    r = tile_px / 2.0
+    yy, xx = np.mgrid[0:tile_px, 0:tile_px]
+    inside = (xx + 0.5 - r) ** 2 + (yy + 0.5 - r) ** 2 <= r * r
+
+    for row, res in enumerate(results):
+        y = row * (tile_px + gap)
+        for col, tile in enumerate(res["tiles"]):
+            x = col * (tile_px + gap)
+            cov = np.frombuffer(tile, dtype=np.uint8).reshape(tile_px, tile_px)
+            sheet[y : y + tile_px, x : x + tile_px] = np.where(inside, cov, 40)
+
+    rgba = np.empty((h, w, 4), dtype=np.uint8)
+    rgba[..., :3] = sheet[..., None]
+    rgba[..., 3] = 255
+    return encode_png_rgba(w, h, rgba.tobytes())
+
+
+def _describe(res: Dict) -> str:
+    parts = []
+    for label, params in (("sweep", res["sweep"]), ("arc", res["arc"])):
+        if params is not None:
+            parts.append(label + "(" + ", ".join(f"{k}={v}" for k, v in params.items()) + ")")
+    return " ".join(parts) or "base"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input_ttf", help="Undecorated second-hand font")
+    parser.add_argument("out_dir", help="Directory for report.json, contact_sheet.png and variant fonts")
+    for knob, kind in list(SWEEP_KNOBS.items()) + list(ARC_KNOBS.items()):
+        parser.add_argument("--" + knob.replace("_", "-"), type=lambda t, k=kind: parse_range(t, k), default=None)
+    parser.add_argument("--sweep", action="store_true", help="Enable the sweep trail with defaults")
+    parser.add_argument("--arc", action="store_true", help="Enable the arc trail with defaults")
+    parser.add_argument("--simplify-tolerance", type=float, default=DEFAULT_TOLERANCE, help="Negative disables")
+    parser.add_argument("--size", type=int, default=dial_pixel_sizes()[0], help="Raster-cost pixel size")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed renders per glyph")
+    parser.add_argument("--tile", type=int, default=128, help="Contact sheet tile size in pixels")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--max-variants", type=int, default=256)
+    parser.add_argument("--write-fonts", action="store_true", help="Save every variant font")
+    parser.add_argument("--sort", choices=["index", "bytes", "points", "raster"], default="index")
+    args = parser.parse_args()
+
+    sweep_grid = {k: getattr(args, k) for k in SWEEP_KNOBS if getattr(args, k) is not None}
+    arc_grid = {k: getattr(args, k) for k in ARC_KNOBS if getattr(args, k) is not None}
+
+    sweeps: List[Optional[Dict]] = _combinations(sweep_grid) if (sweep_grid or args.sweep) else [None]
+    arcs: List[Optional[Dict]] = _combinations(arc_grid) if (arc_grid or args.arc) else [None]
+    variants = list(itertools.product(sweeps, arcs))
+    if len(variants) > args.max_variants:
+        print(f"{len(variants)} variants exceed --max-variants {args.max_variants}")
+        return 2
+
+    os.makedirs(args.out_dir, exist_ok=True)
+
+    with open(args.input_ttf, "rb") as f:
+        source = f.read()
+
+    t0 = time.perf_counter()
+    _load_base(source, args.input_ttf)
+    base_points = sum(len(_BASE["glyf"][n].getCoordinates(_BASE["glyf"])[0]) for n in _SEC_GLYPHS)
+    print(f"Base: {len(source)} bytes, {base_points} points over {len(_SEC_GLYPHS)} sec glyphs")
+    print(f"Building {len(variants)} variants with {args.jobs} jobs…")
+
+    jobs = [
+        (
+            i,
+            sweep,
+            arc,
+            args.simplify_tolerance,
+            args.size,
+            max(1, args.repeat),
+            args.tile,
+            args.out_dir if args.write_fonts else None,
+        )
+        for i, (sweep, arc) in enumerate(variants)
+    ]
+
+    if args.jobs > 1 and len(jobs) > 1:
+        methods = multiprocessing.get_all_start_methods()
+        ctx = multiprocessing.get_context("fork" if "fork" in methods else None)
+        with ProcessPoolExecutor(
+            max_workers=args.jobs, mp_context=ctx, initializer=_init_worker, initargs=(source, args.input_ttf)
+        ) as pool:
+            results = list(pool.map(_build_variant, *zip(*jobs)))
+    else:
+        results = [_build_variant(*job) for job in jobs]
+
+    elapsed = time.perf_counter() - t0
+
+    sort_key = {
+        "index": lambda r: r["index"],
+        "bytes": lambda r: r["bytes"],
+        "points": lambda r: r["points"],
+        "raster": lambda r: r["raster_median_us"],
+    }[args.sort]
+    results.sort(key=sort_key)
+
+    print(f"{'#':>4} {'bytes':>8} {'points':>7} {'med µs':>7} {'worst µs':>8}  design")
+    for res in results:
+        print(
+            f"{res['index']:>4} {res['bytes']:>8} {res['points']:>7} "
+            f"{res['raster_median_us']:>7.1f} {res['raster_worst_us']:>8.1f}  {_describe(res)}"
+        )
+
+    sheet_path = os.path.join(args.out_dir, "contact_sheet.png")
+    with open(sheet_path, "wb") as f:
+        f.write(_contact_sheet(results, args.tile))
+
+    report = {
+        "input": args.input_ttf,
+        "base_bytes": len(source),
+        "base_points": base_points,
+        "raster_px": args.size,
+        "contact_seconds": list(CONTACT_SECONDS),
+        "variants": [
+            {k: v for k, v in res.items() if k != "tiles"} | {"sheet_row": row}
+            for row, res in enumerate(results)
+        ],
+    }
+    with open(os.path.join(args.out_dir, "report.json"), "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print(f"Contact sheet: {sheet_path} (rows in the order above)")
+    print(f"Done in {elapsed:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
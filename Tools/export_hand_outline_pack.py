@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+export_hand_outline_pack.py
+
+Exports the clock hand outlines as a memory-mappable binary pack (see
+Scripts/hand_outline_pack.py), for renderers that draw the hands from outlines by index
+instead of shaping a timer string.
+
+Each family (--families, default mh and sec) is taken from the first input font that has
+it, so the minute and second fonts together give one pack with every hand. Trail tools
+run on a font first are baked into its outlines and exported as they are. After writing,
+every packed glyph is read back through the mapped file and compared with its font, and
+random access is timed against decompiling the glyph from the font.
+
+Typical usage:
+  python3 Tools/export_hand_outline_pack.py \
+    WidgetWeaverWidget/Clock/WWClockMinuteHand-Regular.ttf \
+    WidgetWeaverWidget/Clock/WWClockSecondHand-Regular.ttf \
+    -o /tmp/WWClockHands.outlines
+"""
+
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Scripts"))
+
+from font_io import write_bytes_atomic  # noqa: E402
+from hand_outline_pack import DEFAULT_FAMILIES, HandOutlinePack, pack_font_bytes, pack_report  # noqa: E402
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("fonts", nargs="+", help="Clock hand fonts, searched in order for each family")
+    parser.add_argument("-o", "--output", required=True, help="Output pack path")
+    parser.add_argument(
+        "--families",
+        nargs="+",
+        default=list(DEFAULT_FAMILIES),
+        help=f"Glyph name prefixes to pack, in pack order (default: {' '.join(DEFAULT_FAMILIES)})",
+    )
+    parser.add_argument(
+        "--keep-keepers",
+        action="store_true",
+        help="Keep the keeper squares (they only pin the glyph bounds for text layout)",
+    )
+    args = parser.parse_args(argv)
+
+    fonts = []
+    for path in args.fonts:
+        with open(path, "rb") as f:
+            fonts.append(f.read())
+
+    pack = pack_font_bytes(fonts, families=args.families, strip_keepers=not args.keep_keepers)
+    view = HandOutlinePack.from_buffer(pack)
+    if not view.families:
+        print(f"No {', '.join(args.families)} glyphs in {', '.join(args.fonts)}")
+        return 1
+
+    write_bytes_atomic(args.output, pack)
+    print(f"Wrote: {args.output}")
+
+    with open(args.output, "rb") as f:
+        written = f.read()
+    report = pack_report(fonts, written)
+    for line in report.summary_lines():
+        print(line)
+
+    mapped = HandOutlinePack.open(args.output)
+    print(
+        f"  mapped: {mapped.glyph_count} glyphs, unitsPerEm {mapped.units_per_em}, "
+        f"{'all on-curve' if mapped.all_on_curve else 'has off-curve points'}"
+    )
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
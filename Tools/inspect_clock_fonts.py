@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+inspect_clock_fonts.py
+
+Quick structural check of the clock fonts (see Scripts/font_inspect.py): GSUB lookups with
+glyph and ligature counts per subtable, hand-family bucket ranges with contour and point
+statistics, trail presence, and name-table identity. Tables are read lazily and walked as
+raw bytes, so even the 3600-glyph minute fonts take a few tens of milliseconds; the total
+time is printed. Exits non-zero when a font has issues (bucket gaps, ligatures past the
+glyph count, no ligature lookup), so it can gate commits that touch the fonts.
+
+Typical usage:
+  python3 Tools/inspect_clock_fonts.py
+  python3 Tools/inspect_clock_fonts.py /tmp/sweep.ttf --sections glyf trails
+  python3 Tools/inspect_clock_fonts.py WidgetWeaverWidget/Clock/WWClockMinuteHands-Regular.ttc
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+from typing import List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Scripts"))
+
+from font_inspect import SECTIONS, inspect_path  # noqa: E402
+
+
+CLOCK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "WidgetWeaverWidget", "Clock")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "fonts",
+        nargs="*",
+        default=None,
+        help="Fonts or collections to inspect (default: WidgetWeaverWidget/Clock/*.ttf)",
+    )
+    parser.add_argument(
+        "--sections",
+        nargs="+",
+        choices=SECTIONS,
+        default=list(SECTIONS),
+        help="What to read (default: all)",
+    )
+    args = parser.parse_args(argv)
+
+    fonts = args.fonts or sorted(glob.glob(os.path.join(os.path.normpath(CLOCK_DIR), "*.ttf")))
+    if not fonts:
+        print("No fonts to inspect")
+        return 1
+
+    t0 = time.perf_counter()
+    issues = 0
+    for path in fonts:
+        t_font = time.perf_counter()
+        reports = inspect_path(path, args.sections)
+        elapsed_ms = (time.perf_counter() - t_font) * 1000.0
+        for report in reports:
+            for line in report.summary_lines():
+                print(line)
+            issues += len(report.issues)
+        print(f"  ({elapsed_ms:.0f} ms)")
+
+    print(f"Inspected {len(fonts)} fonts in {(time.perf_counter() - t0) * 1000.0:.0f} ms, {issues} issues")
+    return 1 if issues else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
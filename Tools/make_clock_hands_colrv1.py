@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+make_clock_hands_colrv1.py
+
+COLRv1 paint-graph variant of the clock hand fonts.
+
+Instead of one full outline per bucket (and, with make_seconds_sweep_font.py, up to
+--trail-count extra copies of the hand per glyph), every sec** or mh**** glyph becomes one
+rotation of a shared COLRv1 paint graph:
+
+  PaintRotateAroundCenter(hand angle, 500, 500)
+    PaintColrLayers (one LayerList slice, shared by every bucket)
+      PaintRotateAroundCenter(trail offset, 500, 500) -> PaintGlyph(hand.base) -> PaintSolid(fg, alpha)
+      ...
+      PaintGlyph(hand.base) -> PaintSolid(fg, 1.0)
+
+hand.base is a single outline: the hand contours of sec00 / mh0000 (pointing at 12 o'clock),
+without the keeper squares. Trail layers are rotated references with decreasing alpha, so
+they are real opacity fades rather than scaled copies. The layers are relative to the hand,
+so they are stored once and each bucket only costs its rotation and base glyph record
+(about 16 bytes). PaintSolid uses the foreground palette index, so the SwiftUI
+.foregroundStyle tint still applies. A ClipBox of 0..1000 keeps the layout bounds identical
+to the outline glyphs.
+
+Each bucket glyph's outline is replaced by a composite of hand.keepers (the keeper squares
+of sec00 / mh0000), which keeps its bounds. --keep-outlines keeps the hand outlines as the
+fallback for renderers without COLRv1 support; the font then grows by the COLR table.
+
+The input and output sizes are printed, and without --keep-outlines a note that renderers
+without COLRv1 draw no hand. Without --keep-outlines, the tool fails without writing the
+output when the COLR font is larger than its input; with it, it warns.
+
+Use this on an undecorated font; trail contours already baked into sec00 by the other
+trail tools would become part of hand.base.
+
+Typical usage:
+  python3 Tools/make_clock_hands_colrv1.py \
+    WidgetWeaverWidget/Clock/WWClockSecondHand-Regular.ttf \
+    /tmp/WWClockSecondHand-colr.ttf --trail-count 5
+"""
+
+import argparse
+import io
+import os
+import re
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from fontTools.colorLib.builder import buildCOLR, buildCPAL
+from fontTools.pens.recordingPen import RecordingPen
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+from fontTools.ttLib import TTFont
+from fontTools.ttLib.tables.otTables import PaintFormat
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Scripts"))
+
+from font_io import font_bytes, write_bytes_atomic  # noqa: E402
+
+
+BASE_GLYPH = "hand.base"
+KEEPERS_GLYPH = "hand.keepers"
+
+# Foreground colour (the text colour set by SwiftUI).
+FOREGROUND_PALETTE_INDEX = 0xFFFF
+
+FAMILIES: Dict[str, re.Pattern] = {
+    "sec": re.compile(r"^sec\d{2}$"),
+    "mh": re.compile(r"^mh\d{4}$"),
+}
+
+Contour = List[Tuple[str, tuple]]
+
+
+def _record_contours(ttfont: TTFont, glyph_name: str) -> List[Contour]:
+    rec = RecordingPen()
+    ttfont.getGlyphSet()[glyph_name].draw(rec)
+
+    contours: List[Contour] = []
+    current: Contour = []
+    for op, args in rec.value:
+        current.append((op, args))
+        if op in ("closePath", "endPath"):
+            contours.append(current)
+            current = []
+    if current:
+        contours.append(current)
+    return contours
+
+
+def _is_keeper(contour: Contour) -> bool:
+    pts = [p for _, args in contour for p in args]
+    if not pts:
+        return False
+    xs = [p[0] for p in pts]
+    ys = [p[1] for p in pts]
+
+    # Bottom-left keeper square (roughly 0..32)
+    if max(xs) <= 40 and max(ys) <= 40:
+        return True
+
+    # Top-right keeper square (roughly 968..1000)
+    if min(xs) >= 960 and min(ys) >= 960:
+        return True
+
+    return False
+
+
+def _replay(pen: TTGlyphPen, contours: List[Contour]) -> None:
+    for contour in contours:
+        for op, args in contour:
+            getattr(pen, op)(*args)
+
+
+def _rotate(angle_deg: float, paint: dict) -> dict:
+    return {
+        "Format": PaintFormat.PaintRotateAroundCenter,
+        "angle": angle_deg,
+        "centerX": 500,
+        "centerY": 500,
+        "Paint": paint,
+    }
+
+
+def _hand_paint(alpha: float) -> dict:
+    return {
+        "Format": PaintFormat.PaintGlyph,
+        "Glyph": BASE_GLYPH,
+        "Paint": {
+            "Format": PaintFormat.PaintSolid,
+            "PaletteIndex": FOREGROUND_PALETTE_INDEX,
+            "Alpha": alpha,
+        },
+    }
+
+
+def _normalise_deg(a: float) -> float:
+    # F2Dot14 half-turns cover [-360, 360); keep angles in (-180, 180].
+    a = a % 360.0
+    return a - 360.0 if a > 180.0 else a
+
+
+def trail_layers(trail_count: int, trail_step_deg: float, trail_opacity: float) -> List[dict]:
+    """Trail layers (farthest first) and the hand, relative to a hand at 12 o'clock."""
+    layers = []
+    for i in range(trail_count, 0, -1):
+        alpha = trail_opacity * (1.0 - float(i - 1) / float(trail_count))
+        # Clockwise motion; font-space rotation is counter-clockwise positive, so the trail
+        # sits at positive angles behind the hand.
+        layers.append(_rotate(_normalise_deg(float(i) * trail_step_deg), _hand_paint(alpha)))
+    layers.append(_hand_paint(1.0))
+    return layers
+
+
+def _set_glyph(font: TTFont, name: str, glyph, metrics: Tuple[int, int]) -> None:
+    order = font.getGlyphOrder()
+    if name not in order:
+        font.setGlyphOrder(order + [name])
+    glyf = font["glyf"]
+    glyf[name] = glyph
+    glyph.recalcBounds(glyf)
+    font["hmtx"].metrics[name] = metrics
+
+
+def build_colr_font(
+    font: TTFont,
+    family: str,
+    trail_count: int,
+    trail_step_deg: float,
+    trail_opacity: float,
+    keep_outlines: bool,
+) -> Tuple[int, int]:
+    """Adds hand.base, hand.keepers and COLR/CPAL in place. Returns (outline points before, after)."""
+    order = font.getGlyphOrder()
+    names = [g for g in order if FAMILIES[family].match(g)]
+    if not names:
+        raise RuntimeError(f"No {family} glyphs in font")
+
+    glyf = font["glyf"]
+    hmtx = font["hmtx"]
+
+    def total_points() -> int:
+        extra = [g for g in (BASE_GLYPH, KEEPERS_GLYPH) if g in glyf]
+        # Composite bucket glyphs store no points of their own.
+        return sum(0 if glyf[n].isComposite() else len(glyf[n].getCoordinates(glyf)[0]) for n in names + extra)
+
+    before = total_points()
+
+    contours = _record_contours(font, names[0])
+    pen = TTGlyphPen(font.getGlyphSet())
+    _replay(pen, [c for c in contours if not _is_keeper(c)])
+    _set_glyph(font, BASE_GLYPH, pen.glyph(), hmtx[names[0]])
+
+    kpen = TTGlyphPen(font.getGlyphSet())
+    _replay(kpen, [c for c in contours if _is_keeper(c)])
+    _set_glyph(font, KEEPERS_GLYPH, kpen.glyph(), hmtx[names[0]])
+
+    # One list object for every bucket: buildCOLR's layer reuse stores the slice once.
+    layers = trail_layers(trail_count, trail_step_deg, trail_opacity)
+    shared = {"Format": PaintFormat.PaintColrLayers, "Layers": layers}
+
+    positions = len(names)
+    paints: Dict[str, dict] = {}
+    clip_boxes: Dict[str, Tuple[int, int, int, int]] = {}
+    for bucket, name in enumerate(names):
+        # Clockwise motion; font-space rotation is counter-clockwise positive.
+        paints[name] = _rotate(_normalise_deg(-360.0 * float(bucket) / float(positions)), shared)
+        clip_boxes[name] = (0, 0, 1000, 1000)
+
+        if not keep_outlines:
+            cpen = TTGlyphPen(font.getGlyphSet())
+            cpen.addComponent(KEEPERS_GLYPH, (1, 0, 0, 1, 0, 0))
+            g = cpen.glyph()
+            g.recalcBounds(glyf)
+            glyf[name] = g
+
+    font["COLR"] = buildCOLR(
+        paints,
+        version=1,
+        glyphMap=font.getReverseGlyphMap(rebuild=True),
+        clipBoxes=clip_boxes,
+        allowLayerReuse=True,
+    )
+    font["CPAL"] = buildCPAL([[(1.0, 1.0, 1.0, 1.0)]])
+
+    if "maxp" in font:
+        font["maxp"].numGlyphs = len(font.getGlyphOrder())
+
+    return before, total_points()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input_ttf", help="Second- or minute-hand font")
+    parser.add_argument("output_ttf", help="Output .ttf (can match input for in-place replace)")
+    parser.add_argument("--family", choices=sorted(FAMILIES), default=None, help="Glyph family (default: detect)")
+    parser.add_argument("--trail-count", type=int, default=5)
+    parser.add_argument("--trail-step-deg", type=float, default=1.0)
+    parser.add_argument("--trail-opacity", type=float, default=0.5)
+    parser.add_argument(
+        "--keep-outlines",
+        action="store_true",
+        help="Keep the hand outlines as a fallback for renderers without COLRv1 (the font grows)",
+    )
+    args = parser.parse_args(argv)
+
+    with open(args.input_ttf, "rb") as f:
+        source = f.read()
+    font = TTFont(io.BytesIO(source))
+
+    family = args.family
+    if family is None:
+        family = "mh" if any(FAMILIES["mh"].match(g) for g in font.getGlyphOrder()) else "sec"
+
+    before, after = build_colr_font(
+        font,
+        family,
+        trail_count=max(0, int(args.trail_count)),
+        trail_step_deg=float(args.trail_step_deg),
+        trail_opacity=float(args.trail_opacity),
+        keep_outlines=bool(args.keep_outlines),
+    )
+
+    data = font_bytes(font)
+    colr_bytes = len(TTFont(io.BytesIO(data), lazy=True).reader["COLR"])
+    size_before = len(source)
+    size_after = len(data)
+    growth = size_after - size_before
+    print(f"{family} glyphs: outline points {before} → {after}, COLR {colr_bytes} bytes")
+    print(f"Font size: {size_before} → {size_after} bytes ({growth:+d}, {growth / size_before * 100.0:+.1f}%)")
+    if not args.keep_outlines:
+        print(
+            f"NOTE: the {family} glyphs keep no hand outline; renderers without COLRv1 draw no hand "
+            f"(--keep-outlines keeps them as the fallback)"
+        )
+
+    if growth > 0 and not args.keep_outlines:
+        print("ERROR: the COLR font is larger than its input; font not saved")
+        return 1
+
+    write_bytes_atomic(args.output_ttf, data)
+    print(f"Saved: {args.output_ttf}")
+    if growth > 0:
+        print("WARNING: the COLR font is larger than its input (outlines kept as the fallback)")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
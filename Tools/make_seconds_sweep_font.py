@@ -5,156 +5,235 @@ make_seconds_sweep_font.py
 Adds a "motion trail" to the WidgetWeaver seconds-hand font by duplicating the
 hand contours inside each sec00...sec59 glyph at small angular offsets.
 
+Any rotated glyph family can be trailed: --glyph-prefix mh (or --glyph-regex) selects the
+3600 minute-hand glyphs, and the bucket -> angle mapping (--degrees-per-bucket, default one
+revolution over the family) gives the direction of motion the trail follows. Glyphs are
+processed in batches (--batch-size) over a process pool (--jobs); see
+Scripts/glyph_family.py. On/off-curve flags are kept, so curved hands stay curved.
+
+The trail is always built from the undecorated outlines kept in the font's base-glyph store
+(Scripts/base_glyphs.py) and recorded there as the "sweep" layer, drawn under the hand: re-
+running the tool replaces the previous sweep instead of stacking on it, and an arc trail
+added before or after (Tools/add_seconds_arc_trail.py) is kept. The output font is written
+without the store, which is kept beside it (FONT.ttf.wwbg); a trailed font copied without
+its store is refused rather than trailed again.
+
 The font includes two small "keeper" squares (bottom-left and top-right) that
 pin the glyph bounds. Those contours are left untouched so they remain clipped
 outside the circular mask and do not swing into view.
+
+Rounded trail copies are passed through the shared outline simplification
+(Scripts/glyph_simplify.py) before saving; --no-simplify skips it.
+
+Typical usage:
+  python3 Tools/make_seconds_sweep_font.py \
+    WidgetWeaverWidget/Clock/WWClockMinuteHand-Regular.ttf /tmp/minute-sweep.ttf \
+    --glyph-prefix mh --trail-count 4 --trail-step-deg 0.5
 """
 
 import argparse
-import math
 import os
-import tempfile
-from fontTools.ttLib import TTFont
-from fontTools.pens.ttGlyphPen import TTGlyphPen
-
-
-def _split_contours(ttfont: TTFont, glyph_name: str) -> list[list[tuple[float, float]]]:
-    glyf_table = ttfont["glyf"]
-    glyph = glyf_table[glyph_name]
-
-    coords, end_pts, _flags = glyph.getCoordinates(glyf_table)
-    coords = [(float(x), float(y)) for x, y in coords]
-    end_pts = list(end_pts)
-
-    contours: list[list[tuple[float, float]]] = []
-    start = 0
-    for end in end_pts:
-        contours.append(coords[start : end + 1])
-        start = end + 1
-    return contours
-
-
-def _bbox(points: list[tuple[float, float]]) -> tuple[float, float, float, float]:
-    xs = [p[0] for p in points]
-    ys = [p[1] for p in points]
-    return min(xs), min(ys), max(xs), max(ys)
-
-
-def _is_keeper(points: list[tuple[float, float]]) -> bool:
-    xmin, ymin, xmax, ymax = _bbox(points)
-
-    # Bottom-left keeper square (roughly 0..32)
-    if xmax <= 40 and ymax <= 40:
-        return True
-
-    # Top-right keeper square (roughly 968..1000)
-    if xmin >= 960 and ymin >= 960:
-        return True
-
-    return False
-
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-def _transform_points(
-    points: list[tuple[float, float]],
-    angle_deg: float,
-    scale: float,
-    cx: float = 500.0,
-    cy: float = 500.0,
-) -> list[tuple[float, float]]:
-    rad = math.radians(angle_deg)
-    c = math.cos(rad)
-    s = math.sin(rad)
-
-    out: list[tuple[float, float]] = []
-    for x, y in points:
-        dx = (x - cx) * scale
-        dy = (y - cy) * scale
-
-        tx = dx * c - dy * s
-        ty = dx * s + dy * c
-
-        out.append((tx + cx, ty + cy))
+import numpy as np
+from fontTools.ttLib import TTFont
+from fontTools.ttLib.tables._g_l_y_f import Glyph
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Scripts"))
+
+from base_glyphs import (  # noqa: E402
+    BASE_GLYPHS_TAG,
+    UNDER,
+    attach_base_glyphs,
+    read_glyph_store,
+    save_base_glyphs,
+    split_base_glyphs,
+)
+from font_io import FontSource, load_font, write_bytes_atomic  # noqa: E402
+from glyph_family import (  # noqa: E402
+    DEFAULT_BATCH_SIZE,
+    GlyphFamily,
+    GlyphTask,
+    add_family_arguments,
+    contour_ranges,
+    family_from_args,
+    glyph_arrays,
+    is_keeper_contour,
+    make_glyph,
+    process_glyphs,
+)
+from glyph_simplify import DEFAULT_TOLERANCE, SimplifyStats  # noqa: E402
+
+
+SECONDS_FAMILY = GlyphFamily.from_prefix("sec")
+
+DECORATION = "sweep"
+
+
+def sweep_trail_glyphs(tasks: List[GlyphTask], options: Dict[str, Any]) -> List[Tuple[str, Glyph]]:
+    """
+    Batch worker: the trail copies of each glyph's hand contours, farthest first (the sweep
+    layer; process_glyphs puts it between the keepers and the hand). The hand contours of
+    one glyph are transformed for every trail copy in one numpy operation.
+    """
+    trail_count = int(options["trail_count"])
+    trail_step_deg = float(options["trail_step_deg"])
+    scale_step = float(options["scale_step"])
+    # The trail sits behind the hand: counter-clockwise (positive angles in font coords) for
+    # a clockwise family.
+    trail_sign = float(options.get("trail_sign", 1.0))
+    cx = cy = 500.0
+
+    # Copies from the farthest (i = trail_count) to the nearest (i = 1).
+    steps = np.arange(trail_count, 0, -1, dtype=np.float64)
+    rad = np.radians(steps * trail_step_deg * trail_sign)
+    scale = np.maximum(0.0, 1.0 - steps * scale_step)
+    c = (np.cos(rad) * scale)[:, None]
+    s = (np.sin(rad) * scale)[:, None]
+
+    out: List[Tuple[str, Glyph]] = []
+    for name, _angle, data in tasks:
+        points, flags, end_pts = glyph_arrays(data)
+        hand = [(a, b) for a, b in contour_ranges(end_pts) if not is_keeper_contour(points[a:b])]
+
+        contours: List[Tuple[np.ndarray, bytes]] = []
+        if hand:
+            idx = np.concatenate([np.arange(a, b) for a, b in hand])
+            dx = points[idx, 0] - cx
+            dy = points[idx, 1] - cy
+            tx = cx + dx[None, :] * c - dy[None, :] * s
+            ty = cy + dx[None, :] * s + dy[None, :] * c
+            copies = np.stack([tx, ty], axis=-1)
+
+            for copy in copies:
+                offset = 0
+                for a, b in hand:
+                    n = b - a
+                    contours.append((copy[offset : offset + n], flags[a:b]))
+                    offset += n
+
+        out.append((name, make_glyph(contours)))
     return out
 
 
-def _add_contour(pen: TTGlyphPen, points: list[tuple[float, float]]) -> None:
-    pen.moveTo((round(points[0][0]), round(points[0][1])))
-    for x, y in points[1:]:
-        pen.lineTo((round(x), round(y)))
-    pen.closePath()
-
-
-def _add_trail_to_sec_glyph(
+def add_sweep_trail(
     ttfont: TTFont,
-    glyph_name: str,
-    trail_count: int,
-    trail_step_deg: float,
-    scale_step: float,
-) -> None:
-    contours = _split_contours(ttfont, glyph_name)
-    keepers = [c for c in contours if _is_keeper(c)]
-    hand = [c for c in contours if not _is_keeper(c)]
-
-    # New glyph: keepers + trail + main hand
-    pen = TTGlyphPen(ttfont.getGlyphSet())
-
-    for c in keepers:
-        _add_contour(pen, c)
-
-    # Seconds hand moves clockwise. Trail is placed counter-clockwise (positive angles in font coords).
-    for i in range(trail_count, 0, -1):
-        angle = float(i) * float(trail_step_deg)
-        scale = max(0.0, 1.0 - float(i) * float(scale_step))
-
-        for c in hand:
-            _add_contour(pen, _transform_points(c, angle_deg=angle, scale=scale))
-
-    for c in hand:
-        _add_contour(pen, c)
-
-    new_glyph = pen.glyph()
-    new_glyph.recalcBounds(ttfont["glyf"])
-    ttfont["glyf"][glyph_name] = new_glyph
-
-
-def main() -> int:
+    glyph_names: List[str],
+    trail_count: int = 5,
+    trail_step_deg: float = 1.0,
+    scale_step: float = 0.03,
+    *,
+    clockwise: bool = True,
+    simplify_tolerance: Optional[float] = None,
+    jobs: int = 1,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> SimplifyStats:
+    """
+    Adds the trail to each named glyph in place, replacing an earlier sweep and keeping
+    other decorations (and simplifies it when a tolerance is given). clockwise is the
+    family's direction of motion; the trail goes the other way.
+    """
+    options = {
+        "trail_count": trail_count,
+        "trail_step_deg": trail_step_deg,
+        "scale_step": scale_step,
+        "trail_sign": 1.0 if clockwise else -1.0,
+    }
+    return process_glyphs(
+        ttfont,
+        glyph_names,
+        [0.0] * len(glyph_names),
+        sweep_trail_glyphs,
+        options,
+        decoration=DECORATION,
+        placement=UNDER,
+        simplify_tolerance=simplify_tolerance,
+        jobs=jobs,
+        batch_size=batch_size,
+    )
+
+
+def build_sweep_font(
+    source: FontSource,
+    trail_count: int = 5,
+    trail_step_deg: float = 1.0,
+    scale_step: float = 0.03,
+    simplify_tolerance: Optional[float] = DEFAULT_TOLERANCE,
+    log_fn: Callable[[str], None] = print,
+    *,
+    family: GlyphFamily = SECONDS_FAMILY,
+    jobs: int = 1,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> TTFont:
+    """In-memory build: source TTFont (modified in place) or bytes -> TTFont with the trail."""
+    font = load_font(source)
+    members = family.select(font)
+    if not members:
+        raise RuntimeError(f"No glyphs match {family.regex!r}")
+    names = [name for name, _ in members]
+    angles = family.angles([bucket for _, bucket in members])
+    clockwise = len(angles) < 2 or angles[1] >= angles[0]
+    store = read_glyph_store(font)
+    stored = [store[name] for name in names if name in store]
+    kept = sorted({d for entry in stored for d in entry.layers} - {DECORATION})
+    log_fn(
+        f"Base glyph store ({BASE_GLYPHS_TAG}): {len(stored)} of {len(names)} undecorated outlines already stored"
+        + (f"; keeping the {', '.join(kept)} layer(s)" if kept else "")
+    )
+
+    t0 = time.perf_counter()
+    stats = add_sweep_trail(
+        font,
+        names,
+        trail_count=trail_count,
+        trail_step_deg=trail_step_deg,
+        scale_step=scale_step,
+        clockwise=clockwise,
+        simplify_tolerance=simplify_tolerance,
+        jobs=jobs,
+        batch_size=batch_size,
+    )
+    log_fn(f"Sweep trail on {len(names)} glyphs ({names[0]}..{names[-1]}) in {time.perf_counter() - t0:.2f} s, {jobs} job(s)")
+
+    if simplify_tolerance is not None:
+        log_fn(stats.summary())
+    return font
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("input_ttf", help="Path to WWClockSecondHand-Regular.ttf")
     parser.add_argument("output_ttf", help="Output .ttf path (can match input for in-place replace)")
     parser.add_argument("--trail-count", type=int, default=5)
     parser.add_argument("--trail-step-deg", type=float, default=1.0)
     parser.add_argument("--scale-step", type=float, default=0.03)
-    args = parser.parse_args()
-
-    font = TTFont(args.input_ttf)
-    glyph_order = font.getGlyphOrder()
-
-    sec_glyphs = [g for g in glyph_order if len(g) == 5 and g.startswith("sec") and g[3:].isdigit()]
-    for gname in sec_glyphs:
-        _add_trail_to_sec_glyph(
-            font,
-            gname,
-            trail_count=args.trail_count,
-            trail_step_deg=args.trail_step_deg,
-            scale_step=args.scale_step,
-        )
+    parser.add_argument("--simplify-tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--no-simplify", action="store_true")
+    add_family_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with open(args.input_ttf, "rb") as f:
+        source = f.read()
+    font = load_font(source)
+    attach_base_glyphs(font, args.input_ttf, source)
+
+    font = build_sweep_font(
+        font,
+        trail_count=args.trail_count,
+        trail_step_deg=args.trail_step_deg,
+        scale_step=args.scale_step,
+        simplify_tolerance=None if args.no_simplify else args.simplify_tolerance,
+        family=family_from_args(args),
+        jobs=args.jobs,
+        batch_size=args.batch_size,
+    )
 
     # Safe write (supports input == output).
-    out_dir = os.path.dirname(os.path.abspath(args.output_ttf)) or "."
-    os.makedirs(out_dir, exist_ok=True)
-
-    with tempfile.NamedTemporaryFile(prefix="sweepfont_", suffix=".ttf", delete=False, dir=out_dir) as tmp:
-        tmp_path = tmp.name
-
-    try:
-        font.save(tmp_path)
-        os.replace(tmp_path, args.output_ttf)
-    finally:
-        if os.path.exists(tmp_path):
-            try:
-                os.remove(tmp_path)
-            except OSError:
-                pass
+    data, store = split_base_glyphs(font)
+    write_bytes_atomic(args.output_ttf, data)
+    save_base_glyphs(args.output_ttf, store, data)
 
     return 0
 
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+render_clock_hand_previews.py
+
+PNG preview strips of the clock hand fonts: a few hand positions per font, rendered with
+FreeType at a widget dial size and clipped to the dial circle like the widget's
+clipShape(Circle()), so the keeper squares do not show.
+
+Positions are fractions of a revolution of the font's hand family (sec** or mh****), the
+same four the design watcher previews: 0, 1/8, 3/8 and 11/16 of a turn. Each font is
+written to OUT_DIR/<font name>.png.
+
+Dependencies:
+  python3 -m pip install --user fonttools freetype-py numpy
+
+Typical usage:
+  python3 Tools/render_clock_hand_previews.py WidgetWeaverWidget/Clock/*.ttf --out-dir /tmp/previews
+"""
+
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Scripts"))
+
+from clock_widget_metrics import dial_pixel_sizes  # noqa: E402
+from glyph_raster import encode_png_rgba, family_glyphs, open_face, render_to_canvas  # noqa: E402
+
+
+PREVIEW_FRACTIONS = (0.0, 0.125, 0.375, 0.6875)
+
+
+def preview_path(out_dir: str, font_path: str) -> str:
+    return os.path.join(out_dir, os.path.splitext(os.path.basename(font_path))[0] + ".png")
+
+
+def render_preview(font_path: str, size: int) -> bytes:
+    face = open_face(font_path)
+    families = family_glyphs(face)
+    members = families["sec"] or families["mh"]
+    if not members:
+        raise RuntimeError(f"No sec or mh glyphs in {font_path}")
+
+    r = size / 2.0
+    yy, xx = np.mgrid[0:size, 0:size]
+    mask = ((xx + 0.5 - r) ** 2 + (yy + 0.5 - r) ** 2 <= r * r).astype(np.uint8)
+
+    tiles = []
+    for fraction in PREVIEW_FRACTIONS:
+        _, index = members[int(round(fraction * len(members))) % len(members)]
+        canvas = render_to_canvas(face, index, size)
+        tiles.append(np.frombuffer(bytes(canvas), dtype=np.uint8).reshape(size, size) * mask)
+    strip = np.hstack(tiles)
+
+    h, w = strip.shape
+    rgba = np.empty((h, w, 4), dtype=np.uint8)
+    rgba[..., :3] = strip[..., None]
+    rgba[..., 3] = 255
+    return encode_png_rgba(w, h, rgba.tobytes())
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("fonts", nargs="+", help="Clock hand fonts")
+    parser.add_argument("--out-dir", required=True, help="Directory for the PNG strips")
+    parser.add_argument("--size", type=int, default=dial_pixel_sizes()[0], help="Dial diameter in pixels")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    for font_path in args.fonts:
+        out_path = preview_path(args.out_dir, font_path)
+        with open(out_path, "wb") as f:
+            f.write(render_preview(font_path, args.size))
+        print(f"Wrote: {out_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+report_font_sizes.py
+
+Per-table size breakdown for the clock fonts (see Scripts/font_size_budget.py).
+
+Prints glyf/loca/GSUB/post/hmtx/name sizes with bytes per glyph and per ligature and the
+hmtx/loca layout (Scripts/font_compaction.py), and compares each font against its
+configured budget (matched by file name). Exits non-zero when any font is over budget, so
+trail tools and hand-edited builds can be gated the same way the generators are.
+
+Typical usage:
+  python3 Tools/report_font_sizes.py WidgetWeaverWidget/Clock/*.ttf
+  python3 Tools/report_font_sizes.py /tmp/trail.ttf --budget-as WWClockSecondHand-Regular.ttf
+"""
+
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Scripts"))
+
+from font_compaction import compaction_report  # noqa: E402
+from font_size_budget import add_budget_arguments, budget_violations, font_size_report, selected_budget  # noqa: E402
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("fonts", nargs="+", help="Fonts to report")
+    add_budget_arguments(parser)
+    args = parser.parse_args(argv)
+
+    violations = []
+    for path in args.fonts:
+        budget = selected_budget(path, args.budget_as, args.no_budget)
+
+        report = font_size_report(path)
+        for line in report.summary_lines(budget):
+            print(line)
+        for line in compaction_report(path).summary_lines():
+            print(f"  {line}")
+        violations.extend(budget_violations(report, budget))
+
+    for v in violations:
+        print(f"OVER BUDGET {v}")
+
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
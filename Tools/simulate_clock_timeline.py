@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+simulate_clock_timeline.py
+
+Minimum WidgetKit timeline entries and reloads for the clock widget, per font window
+configuration (see Scripts/clock_timeline.py).
+
+Each configuration combines a minute-font WINDOW_HOURS with a second-font ceiling; the
+widget's timer windows default to the shipped minuteHandTimerWindowSeconds and
+secondsHandTimerWindowSeconds, or follow WINDOW_HOURS with --tie-minute-window. For a
+day of widget visibility the report gives the entries needed before each hand's timer
+string falls off its mapped range, which hand forced them, the reloads at the given
+entries per timeline against the daily reload budget, and the minute-font ligature count
+that window costs. The shipped WINDOW_HOURS is always included.
+
+Typical usage:
+  python3 Tools/simulate_clock_timeline.py
+  python3 Tools/simulate_clock_timeline.py --window-hours 1 2 3 4 --tie-minute-window \
+    --second-ceiling-hours 1 2 --visible 7-9,12:30-13,18-23 --entries-per-timeline 3
+"""
+
+import argparse
+import itertools
+import os
+import sys
+from typing import List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Scripts"))
+
+from clock_timeline import (  # noqa: E402
+    DAILY_RELOAD_BUDGET,
+    MINUTE_HAND_TIMER_WINDOW_SECONDS,
+    SECONDS_HAND_TIMER_WINDOW_SECONDS,
+    SECOND_FONT_CEILING_SECONDS,
+    TimerConfig,
+    parse_visibility,
+    simulate,
+)
+from generate_minute_hand_font import WINDOW_HOURS  # noqa: E402
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--window-hours",
+        type=int,
+        nargs="+",
+        default=[1, 2, 3, 4],
+        help=f"Minute-font WINDOW_HOURS values to compare (shipped: {WINDOW_HOURS})",
+    )
+    parser.add_argument(
+        "--second-ceiling-hours",
+        type=float,
+        nargs="+",
+        default=[SECOND_FONT_CEILING_SECONDS / 3600.0],
+        help="Elapsed time the second-hand font maps, in hours (shipped: 1, i.e. 59:59)",
+    )
+    parser.add_argument(
+        "--minute-window-hours",
+        type=float,
+        default=MINUTE_HAND_TIMER_WINDOW_SECONDS / 3600.0,
+        help="minuteHandTimerWindowSeconds, in hours",
+    )
+    parser.add_argument(
+        "--tie-minute-window",
+        action="store_true",
+        help="Set minuteHandTimerWindowSeconds to WINDOW_HOURS in every configuration",
+    )
+    parser.add_argument(
+        "--second-window-hours",
+        type=float,
+        default=SECONDS_HAND_TIMER_WINDOW_SECONDS / 3600.0,
+        help="secondsHandTimerWindowSeconds, in hours",
+    )
+    parser.add_argument("--no-seconds", action="store_true", help="Minute tick mode: no second hand")
+    parser.add_argument(
+        "--visible",
+        default="0-24",
+        help="Visible spans of the day, START-END in hours or h:mm, comma-separated (default: all day)",
+    )
+    parser.add_argument("--entries-per-timeline", type=int, default=1, help="Entries returned per reload")
+    parser.add_argument("--budget", type=int, default=DAILY_RELOAD_BUDGET, help="Daily reload budget")
+    args = parser.parse_args(argv)
+
+    visibility = parse_visibility(args.visible)
+    window_hours = sorted(set(args.window_hours) | {WINDOW_HOURS})
+
+    over = 0
+    for hours, ceiling in itertools.product(window_hours, sorted(set(args.second_ceiling_hours))):
+        config = TimerConfig(
+            window_hours=hours,
+            minute_window_seconds=(hours if args.tie_minute_window else args.minute_window_hours) * 3600.0,
+            second_window_seconds=args.second_window_hours * 3600.0,
+            second_ceiling_seconds=ceiling * 3600.0,
+            show_seconds=not args.no_seconds,
+        )
+        sim = simulate(config, visibility, args.entries_per_timeline)
+        shipped = " (shipped)" if hours == WINDOW_HOURS and ceiling * 3600.0 == SECOND_FONT_CEILING_SECONDS else ""
+        lines = sim.summary_lines(args.budget)
+        print(lines[0] + shipped)
+        for line in lines[1:]:
+            print(line)
+        over += sim.reloads > args.budget
+
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+watch_clock_font_design.py
+
+Warm-process watch mode for iterating on clock hand designs.
+
+Keeps the template font (with its hand glyphs back on their undecorated outlines, see
+Scripts/base_glyphs.py) and, for minute targets, the compiled GSUB in memory, polls a JSON
+parameter file and, on each change, regenerates only what the changed parameters affect:
+
+- "target" / "template" changes      -> full rebuild (template reload, GSUB build + compile)
+- "hand" changes (minute targets)     -> mh**** outlines, then both trails on them
+- "sweep" / "arc" changes             -> that trail's layer only; the other trail is kept
+- "simplify_tolerance" changes        -> everything it simplifies: the mh**** outlines and
+                                         both trail layers (GSUB bytes reused throughout)
+- "output" / "preview" changes        -> rewrite only
+
+Each rebuild writes the font and a PNG preview strip of a few hand positions, and logs the
+time taken.
+
+Minute targets get the generator's GSUB, glyph order and name table
+(minute_hand_font.install_timer_gsub / finish_minute_font), so the output matches what
+Scripts/generate_minute_hand_font.py ships apart from the hand parameters.
+
+Second targets (60 glyphs) rebuild in well under a second. Minute targets do not: every
+hand or trail change rewrites all 3600 mh**** glyphs, so a hand change takes about a second
+and each trail a few seconds on one core (--jobs spreads the trail work over processes),
+and even a write-only rebuild serialises the whole font (about a second).
+
+Parameter file (JSON; omitted keys use the generator/tool defaults):
+  {
+    "target": "second",                 // "second", "minute" or "minute-icon"
+    "template": "WidgetWeaverWidget/Clock/WWClockSecondHand-Regular.ttf",
+    "output": "/tmp/ww-design.ttf",
+    "preview": "/tmp/ww-design.png",
+    "hand": {"width": 18.0, "length": 420.0},                       // minute targets
+    "sweep": {"trail_count": 5, "trail_step_deg": 1.0, "scale_step": 0.03},   // null / absent = off
+    "arc": {"arc_span_deg": 5.5, "thickness": 10.0, "layers": 3},   // null / absent = off
+    "simplify_tolerance": 0.5
+  }
+
+The sweep/arc objects take the keyword arguments of add_sweep_trail / add_arc_trail ({} for
+their defaults) and apply to the target's hand glyphs; both together compose. The output is
+written like the generators write theirs: atomically, without the base-glyph store.
+
+Typical usage:
+  python3 Tools/watch_clock_font_design.py design.json
+  python3 Tools/watch_clock_font_design.py design.json --once
+
+Dependencies:
+  python3 -m pip install --user fonttools freetype-py numpy
+"""
+
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from fontTools.ttLib import TTFont
+from fontTools.ttLib.tables.DefaultTable import DefaultTable
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Scripts"))
+
+import minute_hand_font  # noqa: E402
+from add_seconds_arc_trail import DECORATION as ARC_DECORATION, add_arc_trail  # noqa: E402
+from base_glyphs import (  # noqa: E402
+    attach_base_glyphs,
+    forget_base_glyphs,
+    save_base_glyphs,
+    split_base_glyphs,
+    strip_decorations,
+)
+from clock_widget_metrics import dial_pixel_sizes  # noqa: E402
+from font_io import write_bytes_atomic  # noqa: E402
+from generate_minute_hand_font import MINUTE_HAND  # noqa: E402
+from generate_minute_hand_icon_font import MINUTE_HAND_ICON  # noqa: E402
+from glyph_family import remove_decoration  # noqa: E402
+from glyph_raster import encode_png_rgba, open_face, render_to_canvas  # noqa: E402
+from glyph_simplify import DEFAULT_TOLERANCE, simplify_font_glyphs  # noqa: E402
+from make_seconds_sweep_font import DECORATION as SWEEP_DECORATION, add_sweep_trail  # noqa: E402
+from minute_hand_font import MinuteHandVariant  # noqa: E402
+
+
+DEFAULT_TEMPLATE = os.path.join("WidgetWeaverWidget", "Clock", "WWClockSecondHand-Regular.ttf")
+
+MINUTE_VARIANTS = {
+    "minute": MINUTE_HAND,
+    "minute-icon": MINUTE_HAND_ICON,
+}
+
+FULL_KEYS = ("target", "template")
+OUTLINE_KEYS = ("hand", "sweep", "arc", "simplify_tolerance")
+
+# params key -> (decoration layer name, trail function), in the order they are applied.
+TRAILS = {
+    "sweep": (SWEEP_DECORATION, add_sweep_trail),
+    "arc": (ARC_DECORATION, add_arc_trail),
+}
+
+# Preview positions (seconds into the minute / hour).
+PREVIEW_SECONDS = (0, 8, 23, 41)
+PREVIEW_MINUTE_SECONDS = (0, 450, 1350, 2475)
+
+
+def log(msg: str) -> None:
+    print(msg, flush=True)
+
+
+class DesignSession:
+    def __init__(self, preview_size: int, jobs: int = 1) -> None:
+        self.preview_size = preview_size
+        self.jobs = jobs
+        self.params: Dict = {}
+        self.font: Optional[TTFont] = None
+        self.hand_glyphs: List[str] = []
+        self.last_bytes: Optional[bytes] = None
+
+    # -- full rebuild ---------------------------------------------------------------
+
+    def _load_template(self, params: Dict) -> None:
+        template_path = params.get("template", DEFAULT_TEMPLATE)
+        with open(template_path, "rb") as f:
+            template = f.read()
+
+        font = TTFont(io.BytesIO(template))
+        attach_base_glyphs(font, template_path, template)
+        target = params.get("target", "second")
+
+        if target == "second":
+            self.hand_glyphs = [g for g in font.getGlyphOrder() if len(g) == 5 and g.startswith("sec") and g[3:].isdigit()]
+            # Trails start from the undecorated outlines, also for an already trailed template.
+            strip_decorations(font, self.hand_glyphs)
+        elif target in MINUTE_VARIANTS:
+            self._prepare_minute_font(font, MINUTE_VARIANTS[target])
+        else:
+            raise ValueError(f"Unknown target {target!r}")
+
+        self.font = font
+
+    def _prepare_minute_font(self, font: TTFont, variant: MinuteHandVariant) -> None:
+        positions = minute_hand_font.SECONDS_PER_HOUR // minute_hand_font.TICK_SECONDS
+        self.hand_glyphs = [minute_hand_font.glyph_name_for_bucket(b) for b in range(positions)]
+
+        # Decompile against the template glyph order before appending mh**** names.
+        font["glyf"]
+        hmtx = font["hmtx"]
+        base_aw = hmtx["sec00"][0] if "sec00" in hmtx.metrics else 1000
+
+        # The generator's GSUB, glyph order and names (minute_hand_font.build_minute_hand_font);
+        # only the mh**** outlines are the watcher's.
+        minute_hand_font.install_timer_gsub(font, log_fn=log)
+        order = font.getGlyphOrder()
+        existing = set(order)
+        font.setGlyphOrder(order + [n for n in self.hand_glyphs if n not in existing])
+        for name in self.hand_glyphs:
+            hmtx.metrics[name] = (base_aw, 0)
+        minute_hand_font.finish_minute_font(font, variant, self.hand_glyphs, log_fn=log)
+
+        # Compile once and keep the bytes: outline edits never touch GSUB.
+        compiled = DefaultTable("GSUB")
+        compiled.data = font["GSUB"].compile(font)
+        font["GSUB"] = compiled
+
+    # -- outline rebuild ------------------------------------------------------------
+
+    def _regenerate_outlines(self, params: Dict, changed: Optional[Set[str]] = None) -> None:
+        """Rebuilds what the changed keys affect (everything when changed is None)."""
+        font = self.font
+        assert font is not None
+        glyf = font["glyf"]
+        target = params.get("target", "second")
+        tolerance = float(params.get("simplify_tolerance", DEFAULT_TOLERANCE))
+        simplify = tolerance if tolerance >= 0.0 else None
+
+        def touched(*keys: str) -> bool:
+            return changed is None or bool(changed.intersection(keys))
+
+        rebuild_hands = target in MINUTE_VARIANTS and touched("hand", "simplify_tolerance")
+        if rebuild_hands:
+            hand = {"width": MINUTE_VARIANTS[target].hand_width, **(params.get("hand") or {})}
+            glyph_set = font.getGlyphSet()
+            for bucket, name in enumerate(self.hand_glyphs):
+                angle_deg = (bucket * minute_hand_font.TICK_SECONDS / 3600.0) * 360.0  # 360° per hour
+                glyf[name] = minute_hand_font.make_hand_glyph(glyph_set, angle_deg, **hand)
+            if simplify is not None:
+                simplify_font_glyphs(font, self.hand_glyphs, simplify)
+            # New base outlines: every trail is rebuilt on them below.
+            forget_base_glyphs(font, self.hand_glyphs)
+
+        for key, (decoration, add_trail) in TRAILS.items():
+            if not (rebuild_hands or touched(key, "simplify_tolerance")):
+                continue
+            options = params.get(key)
+            if options is not None:
+                add_trail(font, self.hand_glyphs, **{"simplify_tolerance": simplify, "jobs": self.jobs, **options})
+            else:
+                remove_decoration(font, self.hand_glyphs, decoration)
+
+    # -- output ---------------------------------------------------------------------
+
+    def _write(self, params: Dict) -> bytes:
+        font = self.font
+        assert font is not None
+        data, store = split_base_glyphs(font)
+
+        output = params.get("output")
+        if output:
+            write_bytes_atomic(output, data)
+            save_base_glyphs(output, store, data)
+
+        return data
+
+    def _write_preview(self, params: Dict, data: bytes) -> None:
+        preview = params.get("preview")
+        if not preview:
+            return
+
+        face = open_face(data)
+        size = self.preview_size
+        target = params.get("target", "second")
+        if target == "second":
+            names = [f"sec{s:02d}" for s in PREVIEW_SECONDS]
+        else:
+            names = [
+                minute_hand_font.glyph_name_for_bucket(t // minute_hand_font.TICK_SECONDS)
+                for t in PREVIEW_MINUTE_SECONDS
+            ]
+
+        r = size / 2.0
+        yy, xx = np.mgrid[0:size, 0:size]
+        mask = ((xx + 0.5 - r) ** 2 + (yy + 0.5 - r) ** 2 <= r * r).astype(np.uint8)
+
+        tiles = []
+        for name in names:
+            canvas = render_to_canvas(face, face.get_name_index(name.encode("ascii")), size)
+            tiles.append(np.frombuffer(bytes(canvas), dtype=np.uint8).reshape(size, size) * mask)
+        strip = np.hstack(tiles)
+
+        h, w = strip.shape
+        rgba = np.empty((h, w, 4), dtype=np.uint8)
+        rgba[..., 0] = strip
+        rgba[..., 1] = strip
+        rgba[..., 2] = strip
+        rgba[..., 3] = 255
+
+        with open(preview, "wb") as f:
+            f.write(encode_png_rgba(w, h, rgba.tobytes()))
+
+    # -- entry point ----------------------------------------------------------------
+
+    def apply(self, params: Dict) -> Tuple[str, float]:
+        t0 = time.perf_counter()
+        changed = {k for k in set(params) | set(self.params) if params.get(k) != self.params.get(k)}
+
+        if self.font is None or changed & set(FULL_KEYS):
+            kind = "full"
+            self._load_template(params)
+            self._regenerate_outlines(params)
+        elif changed & set(OUTLINE_KEYS):
+            kind = "outlines"
+            self._regenerate_outlines(params, changed)
+        elif changed:
+            kind = "write-only"
+        else:
+            return "unchanged", 0.0
+
+        data = self._write(params)
+        self._write_preview(params, data)
+        self.params = json.loads(json.dumps(params))
+        self.last_bytes = data
+        return kind, time.perf_counter() - t0
+
+
+def _read_params(path: str) -> Dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("params_json", help="Design parameter file to watch")
+    parser.add_argument("--once", action="store_true", help="Build once and exit")
+    parser.add_argument("--interval", type=float, default=0.1, help="Poll interval in seconds")
+    parser.add_argument("--preview-size", type=int, default=dial_pixel_sizes()[0])
+    parser.add_argument("--jobs", type=int, default=multiprocessing.cpu_count(), help="Trail worker processes")
+    args = parser.parse_args()
+
+    session = DesignSession(preview_size=args.preview_size, jobs=args.jobs)
+    last_mtime = -1.0
+
+    log(f"Watching {args.params_json} (Ctrl-C to stop)…" if not args.once else f"Building {args.params_json}…")
+    try:
+        while True:
+            try:
+                mtime = os.stat(args.params_json).st_mtime
+            except FileNotFoundError:
+                mtime = -1.0
+
+            if mtime != last_mtime and mtime >= 0.0:
+                last_mtime = mtime
+                try:
+                    kind, elapsed = session.apply(_read_params(args.params_json))
+                    if kind != "unchanged":
+                        size = len(session.last_bytes or b"")
+                        log(f"[{time.strftime('%H:%M:%S')}] {kind} rebuild in {elapsed * 1000.0:.0f} ms ({size} bytes)")
+                except Exception:
+                    log(traceback.format_exc().rstrip())
+                    if args.once:
+                        return 1
+
+            if args.once:
+                return 0
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())